@@ -2,7 +2,7 @@
 Backend source package.
 """
 from config import Settings
-from database import engine, AsyncSessionLocal
+from database import engine, read_engine, AsyncSessionLocal, AsyncReadSessionLocal, read_session
 from models import User, Subscription, Job
 
 settings = Settings()
@@ -11,7 +11,10 @@ __all__ = [
     "Settings",
     "settings",
     "engine",
+    "read_engine",
     "AsyncSessionLocal",
+    "AsyncReadSessionLocal",
+    "read_session",
     "User",
     "Subscription",
     "Job",
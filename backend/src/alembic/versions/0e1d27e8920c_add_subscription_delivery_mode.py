@@ -0,0 +1,36 @@
+"""add subscription delivery mode
+
+Revision ID: 0e1d27e8920c
+Revises: b826827afc71
+Create Date: 2026-10-19 09:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0e1d27e8920c'
+down_revision: Union[str, Sequence[str], None] = 'b826827afc71'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        'subscriptions',
+        sa.Column(
+            'delivery_mode',
+            sa.Enum('INSTANT', 'BATCHED', name='deliverymodeenum', native_enum=False),
+            server_default='INSTANT',
+            nullable=False,
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('subscriptions', 'delivery_mode')
@@ -0,0 +1,92 @@
+"""add job owner_registered_at
+
+Revision ID: 2d8b6f3e9c15
+Revises: 7c4e2b9a1f60
+Create Date: 2026-10-19 15:00:00.000000
+
+"""
+import re
+from datetime import datetime, timezone
+from typing import Optional, Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2d8b6f3e9c15'
+down_revision: Union[str, Sequence[str], None] = '7c4e2b9a1f60'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BACKFILL_BATCH_SIZE = 5000
+
+# Frozen copy of the registration date parsing in core.processing.normalizer
+# as of this revision, so re-running it always gives the same data and does
+# not import the application.
+MONTH_NUMBERS = {
+    "يناير": 1, "فبراير": 2, "مارس": 3, "أبريل": 4, "ابريل": 4, "إبريل": 4,
+    "مايو": 5, "يونيو": 6, "يوليو": 7, "أغسطس": 8, "اغسطس": 8, "سبتمبر": 9,
+    "أكتوبر": 10, "اكتوبر": 10, "نوفمبر": 11, "ديسمبر": 12,
+}
+ASCII_DIGITS = str.maketrans({
+    **{chr(0x0660 + i): str(i) for i in range(10)},
+    **{chr(0x06F0 + i): str(i) for i in range(10)},
+})
+DATE_RE = re.compile(r"(\d{1,2})\s+(\S+)\s+(\d{4})")
+
+
+def parse_registration_date(date_str: Optional[str]) -> Optional[datetime]:
+    if not isinstance(date_str, str):
+        return None
+    match = DATE_RE.search(date_str.translate(ASCII_DIGITS))
+    if not match:
+        return None
+
+    day, month_name, year = match.groups()
+    month = MONTH_NUMBERS.get(month_name)
+    if month is None:
+        month = int(month_name) if month_name.isdigit() else None
+    if month is None:
+        return None
+
+    try:
+        return datetime(int(year), month, int(day), tzinfo=timezone.utc)
+    except ValueError:
+        return None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('jobs', sa.Column('owner_registered_at', sa.DateTime(timezone=True), nullable=True))
+
+    # Arabic month names are parsed by the normalizer, backfill in id
+    # batches, each committed on its own
+    with op.get_context().autocommit_block():
+        bind = op.get_bind()
+        low, high = bind.execute(sa.text("SELECT min(id), max(id) FROM jobs")).one()
+        if low is None:
+            return
+        for start in range(low, high + 1, BACKFILL_BATCH_SIZE):
+            rows = bind.execute(
+                sa.text(
+                    "SELECT id, owner_registration_date FROM jobs "
+                    "WHERE id >= :start AND id < :stop"
+                ),
+                {"start": start, "stop": start + BACKFILL_BATCH_SIZE},
+            ).all()
+            updates = [
+                {"id": job_id, "registered_at": registered_at}
+                for job_id, raw in rows
+                if (registered_at := parse_registration_date(raw)) is not None
+            ]
+            if updates:
+                bind.execute(
+                    sa.text("UPDATE jobs SET owner_registered_at = :registered_at WHERE id = :id"),
+                    updates,
+                )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('jobs', 'owner_registered_at')
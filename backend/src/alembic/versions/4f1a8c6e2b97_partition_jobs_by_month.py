@@ -0,0 +1,149 @@
+"""partition jobs by month
+
+Revision ID: 4f1a8c6e2b97
+Revises: 9e5a7d2c4b83
+Create Date: 2026-10-19 17:00:00.000000
+
+"""
+from datetime import date, datetime, timezone
+from typing import List, Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4f1a8c6e2b97'
+down_revision: Union[str, Sequence[str], None] = '9e5a7d2c4b83'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+COPY_BATCH_SIZE = 5000
+# partitions created ahead of the current month, maintenance keeps this up
+PARTITIONS_AHEAD = 3
+ARCHIVE_SCHEMA = 'jobs_archive'
+
+COLUMN_NAMES = (
+    "id, external_id, external_url, category, title, details, budget, duration, "
+    "owner_name, owner_registration_date, owner_employment_rate, number_of_bids, "
+    "published_at, budget_min, budget_max, budget_currency, duration_days, "
+    "bids_count, employment_rate, published_date, owner_registered_at, created_at"
+)
+
+
+def _columns() -> List[sa.Column]:
+    return [
+        sa.Column('id', sa.Integer(), server_default=sa.text("nextval('jobs_id_seq'::regclass)"), nullable=False),
+        sa.Column('external_id', sa.String(), nullable=False),
+        sa.Column('external_url', sa.String(), nullable=False),
+        sa.Column('category', sa.String(), nullable=False),
+        sa.Column('title', sa.Text(), nullable=False),
+        sa.Column('details', sa.Text(), nullable=False),
+        sa.Column('budget', sa.String(), nullable=False),
+        sa.Column('duration', sa.String(), nullable=False),
+        sa.Column('owner_name', sa.String(), nullable=False),
+        sa.Column('owner_registration_date', sa.String(), nullable=False),
+        sa.Column('owner_employment_rate', sa.String(), nullable=False),
+        sa.Column('number_of_bids', sa.String(), nullable=False),
+        sa.Column('published_at', sa.String(), nullable=False),
+        sa.Column('budget_min', sa.Numeric(12, 2), nullable=True),
+        sa.Column('budget_max', sa.Numeric(12, 2), nullable=True),
+        sa.Column('budget_currency', sa.String(3), nullable=True),
+        sa.Column('duration_days', sa.Integer(), nullable=True),
+        sa.Column('bids_count', sa.Integer(), nullable=True),
+        sa.Column('employment_rate', sa.Numeric(5, 2), nullable=True),
+        sa.Column('published_date', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('owner_registered_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    ]
+
+
+def _add_months(month: date, months: int) -> date:
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def _copy(bind, source: str, target: str, on_conflict: str = "") -> None:
+    # copy in id ranges, each batch committed on its own. Rows already in
+    # the target are skipped, so a copy that failed halfway can be resumed
+    # (new jobs written meanwhile have higher ids, max(id) would skip rows)
+    low, high = bind.execute(sa.text(f"SELECT min(id), max(id) FROM {source}")).one()
+    if low is None:
+        return
+    for start in range(low, high + 1, COPY_BATCH_SIZE):
+        bind.execute(
+            sa.text(
+                f"INSERT INTO {target} ({COLUMN_NAMES}) SELECT {COLUMN_NAMES} FROM {source} AS source "
+                f"WHERE source.id >= :start AND source.id < :stop AND NOT EXISTS ("
+                f"SELECT 1 FROM {target} AS copied "
+                f"WHERE copied.id = source.id AND copied.created_at = source.created_at"
+                f") {on_conflict}"
+            ),
+            {"start": start, "stop": start + COPY_BATCH_SIZE},
+        )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    bind = op.get_bind()
+    # the DDL below is committed before the copy starts; if a previous run
+    # failed while copying, jobs_legacy is still there and only the
+    # partitions and the copy are left to do
+    if not sa.inspect(bind).has_table('jobs_legacy'):
+        # keep the old table around until its rows are copied, under names
+        # that do not clash with the partitioned table's indexes
+        op.rename_table('jobs', 'jobs_legacy')
+        op.execute("ALTER INDEX jobs_pkey RENAME TO jobs_legacy_pkey")
+        op.drop_index('ix_jobs_external_id', table_name='jobs_legacy')
+        op.drop_index('ix_jobs_category', table_name='jobs_legacy')
+        op.drop_index('ix_jobs_published_date', table_name='jobs_legacy')
+
+        # a unique index on a partitioned table has to include the partition
+        # key, so external_id uniqueness is left to the job writer
+        op.create_table(
+            'jobs',
+            *_columns(),
+            sa.PrimaryKeyConstraint('id', 'created_at'),
+            postgresql_partition_by='RANGE (created_at)',
+        )
+        op.execute("ALTER SEQUENCE jobs_id_seq OWNED BY jobs.id")
+        op.create_index(op.f('ix_jobs_external_id'), 'jobs', ['external_id'], unique=False)
+        op.create_index(op.f('ix_jobs_category'), 'jobs', ['category'], unique=False)
+        op.create_index(op.f('ix_jobs_published_date'), 'jobs', ['published_date'], unique=False)
+    op.execute(f"CREATE SCHEMA IF NOT EXISTS {ARCHIVE_SCHEMA}")
+
+    oldest = bind.execute(sa.text("SELECT min(created_at) FROM jobs_legacy")).scalar()
+    current = datetime.now(timezone.utc).date().replace(day=1)
+    month = (oldest.date() if oldest else current).replace(day=1)
+    while month <= _add_months(current, PARTITIONS_AHEAD):
+        op.execute(
+            f"CREATE TABLE IF NOT EXISTS jobs_{month.year:04d}_{month.month:02d} PARTITION OF jobs "
+            f"FOR VALUES FROM ('{month.isoformat()}') TO ('{_add_months(month, 1).isoformat()}')"
+        )
+        month = _add_months(month, 1)
+
+    with op.get_context().autocommit_block():
+        _copy(bind, 'jobs_legacy', 'jobs')
+
+    op.drop_table('jobs_legacy')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # archived partitions stay in their schema, only attached ones are copied back
+    op.rename_table('jobs', 'jobs_partitioned')
+    op.execute("ALTER INDEX jobs_pkey RENAME TO jobs_partitioned_pkey")
+    op.drop_index('ix_jobs_external_id', table_name='jobs_partitioned')
+    op.drop_index('ix_jobs_category', table_name='jobs_partitioned')
+    op.drop_index('ix_jobs_published_date', table_name='jobs_partitioned')
+
+    op.create_table('jobs', *_columns(), sa.PrimaryKeyConstraint('id'))
+    op.execute("ALTER SEQUENCE jobs_id_seq OWNED BY jobs.id")
+    op.create_index(op.f('ix_jobs_external_id'), 'jobs', ['external_id'], unique=True)
+    op.create_index(op.f('ix_jobs_category'), 'jobs', ['category'], unique=False)
+    op.create_index(op.f('ix_jobs_published_date'), 'jobs', ['published_date'], unique=False)
+
+    with op.get_context().autocommit_block():
+        _copy(op.get_bind(), 'jobs_partitioned', 'jobs', on_conflict="ON CONFLICT DO NOTHING")
+
+    op.drop_table('jobs_partitioned')
@@ -0,0 +1,31 @@
+"""add subscription quarantined_at
+
+Revision ID: 5a3f9c1d7e42
+Revises: 0e1d27e8920c
+Create Date: 2026-10-19 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5a3f9c1d7e42'
+down_revision: Union[str, Sequence[str], None] = '0e1d27e8920c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        'subscriptions',
+        sa.Column('quarantined_at', sa.DateTime(timezone=True), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('subscriptions', 'quarantined_at')
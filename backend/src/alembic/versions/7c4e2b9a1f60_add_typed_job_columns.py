@@ -0,0 +1,76 @@
+"""add typed job columns
+
+Revision ID: 7c4e2b9a1f60
+Revises: 5a3f9c1d7e42
+Create Date: 2026-10-19 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7c4e2b9a1f60'
+down_revision: Union[str, Sequence[str], None] = '5a3f9c1d7e42'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BACKFILL_BATCH_SIZE = 5000
+
+# Mirrors core.processing.normalizer: the last amount of a budget is its
+# maximum, the first one its minimum; dates were stored in ISO format.
+BACKFILL = sa.text(r"""
+    UPDATE jobs SET
+        budget_min = replace(substring(budget from '(\d[\d,]*(?:\.\d+)?)'), ',', '')::numeric,
+        budget_max = replace(substring(budget from '(\d[\d,]*(?:\.\d+)?)[^\d]*$'), ',', '')::numeric,
+        budget_currency = CASE
+            WHEN budget LIKE '%$%' THEN 'USD'
+            WHEN budget LIKE '%€%' THEN 'EUR'
+            WHEN budget LIKE '%£%' THEN 'GBP'
+        END,
+        duration_days = substring(duration from '(\d+)')::integer,
+        bids_count = substring(number_of_bids from '(\d+)')::integer,
+        employment_rate = substring(owner_employment_rate from '(\d+(?:\.\d+)?)\s*%')::numeric,
+        published_date = substring(published_at from '^\d{4}-\d{2}-\d{2}(?:T\d{2}:\d{2}:\d{2})?')::timestamp
+            AT TIME ZONE 'UTC'
+    WHERE id >= :start AND id < :stop
+""")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('jobs', sa.Column('budget_min', sa.Numeric(12, 2), nullable=True))
+    op.add_column('jobs', sa.Column('budget_max', sa.Numeric(12, 2), nullable=True))
+    op.add_column('jobs', sa.Column('budget_currency', sa.String(3), nullable=True))
+    op.add_column('jobs', sa.Column('duration_days', sa.Integer(), nullable=True))
+    op.add_column('jobs', sa.Column('bids_count', sa.Integer(), nullable=True))
+    op.add_column('jobs', sa.Column('employment_rate', sa.Numeric(5, 2), nullable=True))
+    op.add_column('jobs', sa.Column('published_date', sa.DateTime(timezone=True), nullable=True))
+
+    # backfill in id ranges, each batch committed on its own so the table
+    # is never locked for the whole run
+    with op.get_context().autocommit_block():
+        bind = op.get_bind()
+        low, high = bind.execute(sa.text("SELECT min(id), max(id) FROM jobs")).one()
+        if low is not None:
+            for start in range(low, high + 1, BACKFILL_BATCH_SIZE):
+                bind.execute(BACKFILL, {"start": start, "stop": start + BACKFILL_BATCH_SIZE})
+
+        op.create_index(
+            op.f('ix_jobs_published_date'), 'jobs', ['published_date'],
+            unique=False, postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_jobs_published_date'), table_name='jobs')
+    op.drop_column('jobs', 'published_date')
+    op.drop_column('jobs', 'employment_rate')
+    op.drop_column('jobs', 'bids_count')
+    op.drop_column('jobs', 'duration_days')
+    op.drop_column('jobs', 'budget_currency')
+    op.drop_column('jobs', 'budget_max')
+    op.drop_column('jobs', 'budget_min')
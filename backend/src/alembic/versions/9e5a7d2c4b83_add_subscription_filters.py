@@ -0,0 +1,36 @@
+"""add subscription filters
+
+Revision ID: 9e5a7d2c4b83
+Revises: 2d8b6f3e9c15
+Create Date: 2026-10-19 16:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9e5a7d2c4b83'
+down_revision: Union[str, Sequence[str], None] = '2d8b6f3e9c15'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('subscriptions', sa.Column('include_keywords', sa.JSON(), server_default='[]', nullable=False))
+    op.add_column('subscriptions', sa.Column('exclude_keywords', sa.JSON(), server_default='[]', nullable=False))
+    op.add_column('subscriptions', sa.Column('min_budget', sa.Numeric(12, 2), nullable=True))
+    op.add_column('subscriptions', sa.Column('max_budget', sa.Numeric(12, 2), nullable=True))
+    op.add_column('subscriptions', sa.Column('max_bids', sa.Integer(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('subscriptions', 'max_bids')
+    op.drop_column('subscriptions', 'max_budget')
+    op.drop_column('subscriptions', 'min_budget')
+    op.drop_column('subscriptions', 'exclude_keywords')
+    op.drop_column('subscriptions', 'include_keywords')
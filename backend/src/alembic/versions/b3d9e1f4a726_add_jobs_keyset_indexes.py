@@ -0,0 +1,35 @@
+"""add jobs keyset indexes
+
+Revision ID: b3d9e1f4a726
+Revises: 4f1a8c6e2b97
+Create Date: 2026-10-19 18:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b3d9e1f4a726'
+down_revision: Union[str, Sequence[str], None] = '4f1a8c6e2b97'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # indexes on a partitioned table cannot be built concurrently, the
+    # partitions are small enough for a plain build
+    op.create_index('ix_jobs_created_at_id', 'jobs', ['created_at', 'id'], unique=False)
+    op.create_index('ix_jobs_category_created_at_id', 'jobs', ['category', 'created_at', 'id'], unique=False)
+    # category lookups are served by the leading column of the index above
+    op.drop_index('ix_jobs_category', table_name='jobs')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(op.f('ix_jobs_category'), 'jobs', ['category'], unique=False)
+    op.drop_index('ix_jobs_category_created_at_id', table_name='jobs')
+    op.drop_index('ix_jobs_created_at_id', table_name='jobs')
@@ -0,0 +1,84 @@
+"""initial schema
+
+Revision ID: b826827afc71
+Revises: 
+Create Date: 2026-10-19 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b826827afc71'
+down_revision: Union[str, Sequence[str], None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'users',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('name', sa.String(), nullable=True),
+        sa.Column('email', sa.String(), nullable=False),
+        sa.Column('password_hash', sa.String(), nullable=False),
+        sa.Column('max_categories', sa.Integer(), nullable=False),
+        sa.Column('is_active', sa.Boolean(), nullable=False),
+        sa.Column('telegram_chat_id', sa.BigInteger(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('telegram_chat_id'),
+    )
+    op.create_index(op.f('ix_users_email'), 'users', ['email'], unique=True)
+
+    op.create_table(
+        'subscriptions',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('category', sa.String(), nullable=False),
+        sa.Column('platform', sa.Enum('TELEGRAM', 'DISCORD', name='platformenum', native_enum=False), nullable=False),
+        sa.Column('target_address', sa.String(), nullable=False),
+        sa.Column('is_active', sa.Boolean(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id']),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index(op.f('ix_subscriptions_category'), 'subscriptions', ['category'], unique=False)
+    op.create_index(op.f('ix_subscriptions_user_id'), 'subscriptions', ['user_id'], unique=False)
+
+    op.create_table(
+        'jobs',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('external_id', sa.String(), nullable=False),
+        sa.Column('external_url', sa.String(), nullable=False),
+        sa.Column('category', sa.String(), nullable=False),
+        sa.Column('title', sa.Text(), nullable=False),
+        sa.Column('details', sa.Text(), nullable=False),
+        sa.Column('budget', sa.String(), nullable=False),
+        sa.Column('duration', sa.String(), nullable=False),
+        sa.Column('owner_name', sa.String(), nullable=False),
+        sa.Column('owner_registration_date', sa.String(), nullable=False),
+        sa.Column('owner_employment_rate', sa.String(), nullable=False),
+        sa.Column('number_of_bids', sa.String(), nullable=False),
+        sa.Column('published_at', sa.String(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index(op.f('ix_jobs_category'), 'jobs', ['category'], unique=False)
+    op.create_index(op.f('ix_jobs_external_id'), 'jobs', ['external_id'], unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_jobs_external_id'), table_name='jobs')
+    op.drop_index(op.f('ix_jobs_category'), table_name='jobs')
+    op.drop_table('jobs')
+    op.drop_index(op.f('ix_subscriptions_user_id'), table_name='subscriptions')
+    op.drop_index(op.f('ix_subscriptions_category'), table_name='subscriptions')
+    op.drop_table('subscriptions')
+    op.drop_index(op.f('ix_users_email'), table_name='users')
+    op.drop_table('users')
@@ -0,0 +1,61 @@
+"""add jobs full-text search
+
+Revision ID: c5e2a8f1d394
+Revises: b3d9e1f4a726
+Create Date: 2026-10-19 19:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c5e2a8f1d394'
+down_revision: Union[str, Sequence[str], None] = 'b3d9e1f4a726'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Mirrors core.processing.normalizer.normalize_arabic: drop tashkeel,
+# superscript alef and tatweel, then ASCII digits and folded letters.
+# IMMUTABLE so it can be used in a generated column.
+CREATE_NORMALIZE_FUNCTION = r"""
+    CREATE OR REPLACE FUNCTION first_normalize_arabic(input text) RETURNS text
+    LANGUAGE sql IMMUTABLE STRICT PARALLEL SAFE AS $$
+        SELECT lower(translate(
+            regexp_replace(input, '[\u064B-\u065F\u0670\u0640]', '', 'g'),
+            '٠١٢٣٤٥٦٧٨٩۰۱۲۳۴۵۶۷۸۹٫٬٪أإآٱىةؤئ',
+            '01234567890123456789.,%اااايهوي'
+        ))
+    $$
+"""
+
+SEARCH_VECTOR = (
+    "setweight(to_tsvector('arabic'::regconfig, first_normalize_arabic(title)), 'A') || "
+    "setweight(to_tsvector('arabic'::regconfig, first_normalize_arabic(details)), 'B')"
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(CREATE_NORMALIZE_FUNCTION)
+    # rewrites every partition once to compute the vectors of existing jobs
+    op.add_column(
+        'jobs',
+        sa.Column(
+            'search_vector',
+            postgresql.TSVECTOR(),
+            sa.Computed(SEARCH_VECTOR, persisted=True),
+            nullable=True,
+        ),
+    )
+    op.create_index('ix_jobs_search_vector', 'jobs', ['search_vector'], unique=False, postgresql_using='gin')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_jobs_search_vector', table_name='jobs', postgresql_using='gin')
+    op.drop_column('jobs', 'search_vector')
+    op.execute("DROP FUNCTION IF EXISTS first_normalize_arabic(text)")
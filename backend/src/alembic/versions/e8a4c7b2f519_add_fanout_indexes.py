@@ -0,0 +1,36 @@
+"""add fan-out indexes
+
+Revision ID: e8a4c7b2f519
+Revises: c5e2a8f1d394
+Create Date: 2026-10-19 20:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e8a4c7b2f519'
+down_revision: Union[str, Sequence[str], None] = 'c5e2a8f1d394'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # built concurrently so subscriptions stay writable meanwhile, the
+    # predicate matches the is_(True) filter of the subscriber queries
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_subscriptions_active_user_id', 'subscriptions', ['user_id'],
+            unique=False,
+            postgresql_where=sa.text('is_active IS true'),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_subscriptions_active_user_id', table_name='subscriptions')
@@ -1,9 +1,10 @@
 from api.main import app
-from api.dependencies import get_db, get_current_user, get_current_active_user
+from api.dependencies import get_db, get_read_db, get_current_user, get_current_active_user
 
 __all__ = [
     "app",
     "get_db",
+    "get_read_db",
     "get_current_user",
     "get_current_active_user",
 ]
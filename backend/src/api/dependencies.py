@@ -5,7 +5,7 @@ from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.ext.asyncio import AsyncSession
 
 import models
-from database import AsyncSessionLocal
+from database import AsyncSessionLocal, read_session
 
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="v1/auth/login")
@@ -17,6 +17,12 @@ async def get_db():
         yield session
 
 
+async def get_read_db():
+    """read-only database session, on the read replica when one is configured. only for read-only handlers"""
+    async with read_session() as session:
+        yield session
+
+
 async def get_current_user(
     token: str = Depends(oauth2_scheme),
     db: AsyncSession = Depends(get_db)
@@ -7,10 +7,12 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI, APIRouter
 
 from database import engine
+from clients import close_http_clients
 from models import Base
 from api.routers.auth import router as auth_router
 from api.routers.users import router as users_router
 from api.routers.subscriptions import router as subscriptions_router
+from api.routers.jobs import router as jobs_router
 from api.middleware import setup_cors, RateLimitMiddleware, setup_error_handlers
 from logging_config import setup_logging
 
@@ -24,6 +26,7 @@ async def lifespan(app: FastAPI):
     # using Alembic
     yield
     logger.info("Shutting down API server...")
+    await close_http_clients()
 
 
 app = FastAPI(
@@ -59,6 +62,12 @@ v1_router.include_router(
     tags=["Subscriptions"]
 )
 
+v1_router.include_router(
+    jobs_router,
+    prefix="/jobs",
+    tags=["Jobs"]
+)
+
 # mount v1 API
 app.include_router(v1_router)
 
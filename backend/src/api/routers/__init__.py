@@ -1,9 +1,11 @@
 from .auth import router as auth_router
 from .users import router as users_router
 from .subscriptions import router as subscriptions_router
+from .jobs import router as jobs_router
 
 __all__ = [
     "auth_router",
     "users_router", 
     "subscriptions_router",
+    "jobs_router",
 ]
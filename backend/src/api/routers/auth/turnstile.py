@@ -1,6 +1,5 @@
-import httpx
-
 from config import settings
+from clients import get_http_client
 
 
 TURNSTILE_VERIFY_URL = "https://challenges.cloudflare.com/turnstile/v0/siteverify"
@@ -19,19 +18,18 @@ async def verify_turnstile(token: str | None) -> bool:
         return False
     
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                TURNSTILE_VERIFY_URL,
-                data={
-                    "secret": settings.TURNSTILE_SECRET_KEY,
-                    "response": token,
-                },
-                timeout=10
-            )
-            
-            result = response.json()
-            return result.get("success", False)
-            
+        client = get_http_client(TURNSTILE_VERIFY_URL)
+        response = await client.post(
+            TURNSTILE_VERIFY_URL,
+            data={
+                "secret": settings.TURNSTILE_SECRET_KEY,
+                "response": token,
+            }
+        )
+        
+        result = response.json()
+        return result.get("success", False)
+        
     except Exception:
         # fail closed - if verification fails, reject the request
         return False
@@ -0,0 +1,25 @@
+from .router import router
+from .crud import (
+    list_jobs,
+    search_jobs,
+    encode_cursor,
+    decode_cursor,
+)
+from .schemas import (
+    JobResponse,
+    JobList,
+    JobSearchResult,
+    JobSearchList,
+)
+
+__all__ = [
+    "router",
+    "list_jobs",
+    "search_jobs",
+    "encode_cursor",
+    "decode_cursor",
+    "JobResponse",
+    "JobList",
+    "JobSearchResult",
+    "JobSearchList",
+]
@@ -0,0 +1,48 @@
+"""Redis cache of the unfiltered first page of jobs per category.
+
+Cache keys carry the category's generation. The consumer increments the
+generation after storing jobs, so a page cached before the insert is
+never read again, even if it was written after the increment, and old
+pages simply expire.
+"""
+
+from typing import Optional, Tuple
+
+from config import settings
+from clients import get_redis_client
+from logging_config import setup_logging
+
+
+logger = setup_logging("first.api")
+
+async def _page_key(category: Optional[str]) -> str:
+    category = category or settings.JOBS_ALL_CATEGORIES
+    r = await get_redis_client()
+    generation = await r.get(settings.JOBS_GENERATION_KEY.format(category=category)) or 0
+    return settings.JOBS_PAGE_CACHE_KEY.format(category=category, generation=generation)
+
+
+async def get_cached_page(category: Optional[str]) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Get the cached first page of a category.
+
+    Returns:
+        (cache key, cached JSON or None). The key is None if Redis is
+        unavailable, the page is then neither read nor cached.
+    """
+    try:
+        key = await _page_key(category)
+        r = await get_redis_client()
+        return key, await r.get(key)
+    except Exception as e:
+        logger.warning(f"Jobs page cache unavailable: {e}")
+        return None, None
+
+
+async def set_cached_page(key: str, body: str) -> None:
+    """Cache a rendered first page under the key from get_cached_page."""
+    try:
+        r = await get_redis_client()
+        await r.set(key, body, ex=settings.JOBS_PAGE_CACHE_TTL_SECONDS)
+    except Exception as e:
+        logger.warning(f"Failed to cache jobs page: {e}")
@@ -0,0 +1,105 @@
+import base64
+from datetime import datetime
+from typing import Optional, List, Tuple
+
+import orjson
+from sqlalchemy import func, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+import models
+
+
+def encode_cursor(job: models.Job) -> str:
+    """
+    Encode the sort key of the last job of a page.
+    """
+    raw = orjson.dumps([job.created_at.isoformat(), job.id])
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """
+    Decode a cursor from encode_cursor.
+
+    Raises:
+        ValueError: If the cursor is malformed.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        created_at, job_id = orjson.loads(raw)
+        return datetime.fromisoformat(created_at), int(job_id)
+    except (TypeError, ValueError, orjson.JSONDecodeError) as e:
+        raise ValueError("Invalid cursor") from e
+
+
+async def list_jobs(
+    db: AsyncSession,
+    limit: int,
+    category: Optional[str] = None,
+    min_budget: Optional[float] = None,
+    max_budget: Optional[float] = None,
+    published_after: Optional[datetime] = None,
+    published_before: Optional[datetime] = None,
+    cursor: Optional[Tuple[datetime, int]] = None
+) -> Tuple[List[models.Job], Optional[str]]:
+    """
+    Get a page of jobs, newest first.
+
+    Pages are keyset paginated on (created_at, id), so a page deep into the
+    table costs the same as the first one.
+    """
+    query = select(models.Job)
+    
+    if category is not None:
+        query = query.where(models.Job.category == category)
+    # a job's budget range only has to overlap the requested one
+    if min_budget is not None:
+        query = query.where(models.Job.budget_max >= min_budget)
+    if max_budget is not None:
+        query = query.where(models.Job.budget_min <= max_budget)
+    if published_after is not None:
+        query = query.where(models.Job.published_date >= published_after)
+    if published_before is not None:
+        query = query.where(models.Job.published_date < published_before)
+    if cursor is not None:
+        query = query.where(tuple_(models.Job.created_at, models.Job.id) < cursor)
+    
+    # one extra row tells whether there is a next page
+    query = query.order_by(models.Job.created_at.desc(), models.Job.id.desc()).limit(limit + 1)
+    jobs = list((await db.execute(query)).scalars().all())
+    
+    if len(jobs) <= limit:
+        return jobs, None
+    jobs = jobs[:limit]
+    return jobs, encode_cursor(jobs[-1])
+
+
+async def search_jobs(
+    db: AsyncSession,
+    query: str,
+    limit: int,
+    offset: int = 0,
+    category: Optional[str] = None
+) -> Tuple[List[Tuple[models.Job, float]], bool]:
+    """
+    Full-text search of job titles and details, best matches first.
+
+    The query is normalized in the database with the same function as
+    the indexed search_vector, and supports websearch syntax
+    ("quoted phrases", -excluded words, or).
+
+    Returns:
+        (job, rank) pairs and whether there are more results.
+    """
+    tsquery = func.websearch_to_tsquery(models.JOB_SEARCH_CONFIG, func.first_normalize_arabic(query))
+    rank = func.ts_rank_cd(models.Job.search_vector, tsquery)
+    
+    stmt = select(models.Job, rank.label("rank")).where(models.Job.search_vector.op("@@")(tsquery))
+    if category is not None:
+        stmt = stmt.where(models.Job.category == category)
+    stmt = stmt.order_by(
+        rank.desc(), models.Job.created_at.desc(), models.Job.id.desc()
+    ).offset(offset).limit(limit + 1)
+    
+    results = [(job, float(job_rank)) for job, job_rank in (await db.execute(stmt)).all()]
+    return results[:limit], len(results) > limit
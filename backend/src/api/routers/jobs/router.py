@@ -0,0 +1,123 @@
+"""Jobs router - browse the jobs stored by the consumer."""
+
+from datetime import datetime
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+import models
+from config import settings
+from database import read_session
+from api.dependencies import get_db, get_read_db, get_current_active_user
+from api.routers.jobs import schemas, crud
+from api.routers.jobs.cache import get_cached_page, set_cached_page
+
+
+router = APIRouter()
+
+
+@router.get("/", response_model=schemas.JobList, status_code=status.HTTP_200_OK)
+async def get_jobs(
+    category: Optional[str] = Query(default=None, examples=["design"]),
+    min_budget: Optional[float] = Query(default=None, ge=0, description="Jobs whose budget can reach this"),
+    max_budget: Optional[float] = Query(default=None, ge=0, description="Jobs whose budget starts at most at this"),
+    published_after: Optional[datetime] = Query(default=None),
+    published_before: Optional[datetime] = Query(default=None),
+    cursor: Optional[str] = Query(default=None, description="next_cursor of the previous page"),
+    limit: int = Query(default=settings.JOBS_PAGE_SIZE, ge=1, le=settings.JOBS_MAX_PAGE_SIZE),
+    current_user: models.User = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    get stored jobs, newest first.
+
+    follow next_cursor for older jobs until it is null.
+    """
+    if category is not None and category not in settings.CATEGORIES:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown category. Use one of: {', '.join(settings.CATEGORIES)}"
+        )
+    
+    try:
+        position = crud.decode_cursor(cursor) if cursor else None
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    
+    # only the hot page everyone opens is cached, the rest go to the database
+    cacheable = (
+        position is None and limit == settings.JOBS_PAGE_SIZE
+        and min_budget is None and max_budget is None
+        and published_after is None and published_before is None
+    )
+    cache_key = None
+    if cacheable:
+        cache_key, cached = await get_cached_page(category)
+        if cached is not None:
+            return Response(content=cached, media_type="application/json")
+    
+    filters = dict(
+        limit=limit,
+        category=category,
+        min_budget=min_budget,
+        max_budget=max_budget,
+        published_after=published_after,
+        published_before=published_before,
+        cursor=position
+    )
+    # a lagging replica could cache a stale first page under the current
+    # generation, so that one is read from the primary
+    if cacheable:
+        jobs, next_cursor = await crud.list_jobs(db, **filters)
+    else:
+        async with read_session() as read_db:
+            jobs, next_cursor = await crud.list_jobs(read_db, **filters)
+    page = schemas.JobList(
+        jobs=[schemas.JobResponse.model_validate(job) for job in jobs],
+        next_cursor=next_cursor
+    )
+    
+    if cache_key is not None:
+        await set_cached_page(cache_key, page.model_dump_json())
+    
+    return page
+
+
+@router.get("/search", response_model=schemas.JobSearchList, status_code=status.HTTP_200_OK)
+async def search_jobs(
+    q: str = Query(min_length=2, max_length=200, description="Words to find, quote phrases, prefix - to exclude"),
+    category: Optional[str] = Query(default=None, examples=["design"]),
+    page: int = Query(default=1, ge=1, le=settings.JOBS_SEARCH_MAX_PAGES),
+    limit: int = Query(default=settings.JOBS_PAGE_SIZE, ge=1, le=settings.JOBS_MAX_PAGE_SIZE),
+    current_user: models.User = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_read_db)
+):
+    """
+    search job titles and details, best matches first.
+
+    arabic spelling variants and diacritics are ignored.
+    """
+    if category is not None and category not in settings.CATEGORIES:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown category. Use one of: {', '.join(settings.CATEGORIES)}"
+        )
+    
+    results, has_more = await crud.search_jobs(
+        db,
+        query=q,
+        limit=limit,
+        offset=(page - 1) * limit,
+        category=category
+    )
+    
+    return schemas.JobSearchList(
+        jobs=[
+            schemas.JobSearchResult(**schemas.JobResponse.model_validate(job).model_dump(), rank=rank)
+            for job, rank in results
+        ],
+        page=page,
+        has_more=has_more and page < settings.JOBS_SEARCH_MAX_PAGES
+    )
@@ -0,0 +1,70 @@
+from datetime import datetime
+from typing import Optional, List, Annotated
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class JobResponse(BaseModel):
+    id: Annotated[int, Field(examples=[1])]
+    external_id: Annotated[str, Field(examples=["812345"])]
+    external_url: Annotated[str, Field(examples=["https://mostaql.com/project/812345-logo-design"])]
+    category: Annotated[str, Field(examples=["design"])]
+    title: Annotated[str, Field(examples=["تصميم شعار لمتجر إلكتروني"])]
+    details: Annotated[str, Field(examples=["أحتاج إلى تصميم شعار احترافي..."])]
+    budget: Annotated[str, Field(description="Budget as shown on the site", examples=["$25.00 - $50.00"])]
+    budget_min: Annotated[Optional[float], Field(default=None, examples=[25])]
+    budget_max: Annotated[Optional[float], Field(default=None, examples=[50])]
+    budget_currency: Annotated[Optional[str], Field(default=None, examples=["USD"])]
+    duration: Annotated[str, Field(examples=["3 أيام"])]
+    duration_days: Annotated[Optional[int], Field(default=None, examples=[3])]
+    bids_count: Annotated[Optional[int], Field(default=None, examples=[4])]
+    published_date: Annotated[Optional[datetime], Field(default=None, examples=["2024-01-15T10:00:00Z"])]
+    created_at: Annotated[datetime, Field(examples=["2024-01-15T10:03:00Z"])]
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class JobSearchResult(JobResponse):
+    rank: Annotated[float, Field(description="Relevance, higher is better", examples=[0.6])]
+
+
+class JobSearchList(BaseModel):
+    jobs: Annotated[List[JobSearchResult], Field(examples=[[]])]
+    page: Annotated[int, Field(examples=[1])]
+    has_more: Annotated[bool, Field(examples=[False])]
+
+
+class JobList(BaseModel):
+    jobs: Annotated[List[JobResponse], Field(examples=[[]])]
+    next_cursor: Annotated[Optional[str], Field(
+        default=None,
+        description="Pass as 'cursor' to get the next page, null on the last page",
+        examples=["WyIyMDI0LTAxLTE1VDEwOjAzOjAwKzAwOjAwIiwgMV0"]
+    )]
+    
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "jobs": [
+                    {
+                        "id": 1,
+                        "external_id": "812345",
+                        "external_url": "https://mostaql.com/project/812345-logo-design",
+                        "category": "design",
+                        "title": "تصميم شعار لمتجر إلكتروني",
+                        "details": "أحتاج إلى تصميم شعار احترافي...",
+                        "budget": "$25.00 - $50.00",
+                        "budget_min": 25,
+                        "budget_max": 50,
+                        "budget_currency": "USD",
+                        "duration": "3 أيام",
+                        "duration_days": 3,
+                        "bids_count": 4,
+                        "published_date": "2024-01-15T10:00:00Z",
+                        "created_at": "2024-01-15T10:03:00Z"
+                    }
+                ],
+                "next_cursor": None
+            }
+        }
+    )
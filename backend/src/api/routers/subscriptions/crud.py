@@ -1,9 +1,10 @@
-from typing import Optional, List
+from typing import Any, Dict, Optional, List
 
 from sqlalchemy import select, func
 from sqlalchemy.ext.asyncio import AsyncSession
 
 import models
+from core.subscriptions import subscription_changed
 
 
 async def get_subscription(
@@ -54,12 +55,23 @@ async def get_user_subscription_count(
     return await db.scalar(query) or 0
 
 
+def _apply_filters(subscription: models.Subscription, filters: Dict[str, Any]) -> None:
+    """Replace a subscription's filters, keys missing from ``filters`` are cleared."""
+    subscription.include_keywords = list(filters.get("include_keywords") or [])
+    subscription.exclude_keywords = list(filters.get("exclude_keywords") or [])
+    subscription.min_budget = filters.get("min_budget")
+    subscription.max_budget = filters.get("max_budget")
+    subscription.max_bids = filters.get("max_bids")
+
+
 async def create_subscription(
     db: AsyncSession,
     user_id: int,
     category: str,
     platform: str,
-    target_address: str
+    target_address: str,
+    delivery_mode: str = models.DeliveryModeEnum.INSTANT.value,
+    filters: Optional[Dict[str, Any]] = None
 ) -> models.Subscription:
     """
     Create a new subscription.
@@ -68,11 +80,14 @@ async def create_subscription(
         user_id=user_id,
         category=category,
         platform=platform,
-        target_address=target_address
+        target_address=target_address,
+        delivery_mode=delivery_mode
     )
+    _apply_filters(subscription, filters or {})
     db.add(subscription)
     await db.commit()
     await db.refresh(subscription)
+    await subscription_changed(subscription.id)
     return subscription
 
 
@@ -82,7 +97,9 @@ async def update_subscription(
     category: Optional[str] = None,
     platform: Optional[str] = None,
     target_address: Optional[str] = None,
-    is_active: Optional[bool] = None
+    is_active: Optional[bool] = None,
+    delivery_mode: Optional[str] = None,
+    filters: Optional[Dict[str, Any]] = None
 ) -> models.Subscription:
     """
     Update a subscription's fields.
@@ -95,9 +112,17 @@ async def update_subscription(
         subscription.target_address = target_address
     if is_active is not None:
         subscription.is_active = is_active
+    # reactivating or pointing at a new target lifts a quarantine
+    if is_active or target_address is not None:
+        subscription.quarantined_at = None
+    if delivery_mode is not None:
+        subscription.delivery_mode = delivery_mode
+    if filters is not None:
+        _apply_filters(subscription, filters)
     
     await db.commit()
     await db.refresh(subscription)
+    await subscription_changed(subscription.id)
     return subscription
 
 
@@ -106,5 +131,7 @@ async def delete_subscription(
     subscription: models.Subscription
 ) -> None:
     """Delete a subscription."""
+    subscription_id = subscription.id
     await db.delete(subscription)
     await db.commit()
+    await subscription_changed(subscription_id)
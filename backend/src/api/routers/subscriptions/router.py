@@ -5,7 +5,7 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 import models
-from api.dependencies import get_db, get_current_active_user
+from api.dependencies import get_db, get_read_db, get_current_active_user
 from api.routers.subscriptions import schemas, crud
 from api.routers.subscriptions.schemas import TELEGRAM_CONNECTED_KEYWORD, PlatformEnum
 from core.notifications.discord import discord_format, notify_discord
@@ -27,6 +27,15 @@ def mask_subscription(subscription: models.Subscription) -> schemas.Subscription
         platform=subscription.platform,
         target_address=target_address,
         is_active=subscription.is_active,
+        delivery_mode=subscription.delivery_mode,
+        filters=schemas.SubscriptionFilters(
+            include_keywords=subscription.include_keywords or [],
+            exclude_keywords=subscription.exclude_keywords or [],
+            min_budget=subscription.min_budget,
+            max_budget=subscription.max_budget,
+            max_bids=subscription.max_bids
+        ),
+        quarantined_at=subscription.quarantined_at,
         created_at=subscription.created_at
     )
 
@@ -38,7 +47,7 @@ def mask_subscriptions(subscriptions: List[models.Subscription]) -> List[schemas
 @router.get("/", response_model=schemas.SubscriptionList, status_code=status.HTTP_200_OK)
 async def get_subscriptions(
     current_user: models.User = Depends(get_current_active_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """get all subscriptions for the current user."""
     subscriptions = await crud.get_user_subscriptions(db, user_id=current_user.id)
@@ -85,7 +94,9 @@ async def create_subscription(
         user_id=current_user.id,
         category=subscription_data.category,
         platform=subscription_data.platform.value,
-        target_address=target_address
+        target_address=target_address,
+        delivery_mode=subscription_data.delivery_mode.value,
+        filters=subscription_data.filters.model_dump()
     )
     
     return mask_subscription(subscription)
@@ -123,7 +134,9 @@ async def update_subscription(
         category=update_data.category,
         platform=update_data.platform.value if update_data.platform else None,
         target_address=target_address,
-        is_active=update_data.is_active
+        is_active=update_data.is_active,
+        delivery_mode=update_data.delivery_mode.value if update_data.delivery_mode else None,
+        filters=update_data.filters.model_dump() if update_data.filters else None
     )
     
     return mask_subscription(updated)
@@ -195,13 +208,7 @@ async def test_subscription(
             "username": "First",
             "content": "Hey, it's working! Your Discord notifications are set up correctly."
         }
-        import httpx
-        try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(subscription.target_address, json=test_payload, timeout=10)
-                success = response.status_code in (200, 204)
-        except Exception:
-            success = False
+        success = await notify_discord(subscription.target_address, test_payload)
             
     elif subscription.platform == "telegram":
         success = await notify_telegram(
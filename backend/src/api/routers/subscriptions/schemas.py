@@ -3,7 +3,7 @@ from datetime import datetime
 from typing import Optional, List, Annotated
 import enum
 
-from pydantic import BaseModel, ConfigDict, Field, model_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
 
 # discord webhook url pattern
@@ -14,18 +14,86 @@ DISCORD_WEBHOOK_PATTERN = re.compile(
 # magic word for telegram subscriptions
 TELEGRAM_CONNECTED_KEYWORD = "USE_CONNECTED"
 
+# limits on keyword filters, they are compiled into the consumer's matcher
+MAX_FILTER_KEYWORDS = 20
+MAX_FILTER_KEYWORD_LENGTH = 50
+
 
 class PlatformEnum(str, enum.Enum):
     TELEGRAM = "telegram"
     DISCORD = "discord"
 
 
+class DeliveryModeEnum(str, enum.Enum):
+    INSTANT = "instant"
+    BATCHED = "batched"
+
+
+class SubscriptionFilters(BaseModel):
+    include_keywords: Annotated[List[str], Field(
+        default_factory=list,
+        max_length=MAX_FILTER_KEYWORDS,
+        description="Only jobs whose title or details contain one of these",
+        examples=[["django", "بايثون"]]
+    )]
+    exclude_keywords: Annotated[List[str], Field(
+        default_factory=list,
+        max_length=MAX_FILTER_KEYWORDS,
+        description="Skip jobs whose title or details contain any of these",
+        examples=[["wordpress"]]
+    )]
+    min_budget: Annotated[Optional[float], Field(
+        default=None, ge=0,
+        description="Skip jobs whose budget cannot reach this amount",
+        examples=[100]
+    )]
+    max_budget: Annotated[Optional[float], Field(
+        default=None, ge=0,
+        description="Skip jobs whose budget starts above this amount",
+        examples=[None]
+    )]
+    max_bids: Annotated[Optional[int], Field(
+        default=None, ge=0,
+        description="Skip jobs that already have more bids than this",
+        examples=[10]
+    )]
+
+    @field_validator("include_keywords", "exclude_keywords")
+    @classmethod
+    def clean_keywords(cls, keywords: List[str]) -> List[str]:
+        cleaned = []
+        for keyword in keywords:
+            keyword = keyword.strip()
+            if not keyword:
+                raise ValueError("Keywords cannot be empty")
+            if len(keyword) > MAX_FILTER_KEYWORD_LENGTH:
+                raise ValueError(f"Keywords can be at most {MAX_FILTER_KEYWORD_LENGTH} characters")
+            if keyword not in cleaned:
+                cleaned.append(keyword)
+        return cleaned
+
+    @model_validator(mode="after")
+    def validate_budget_range(self):
+        if self.min_budget is not None and self.max_budget is not None and self.min_budget > self.max_budget:
+            raise ValueError("min_budget cannot be greater than max_budget")
+        return self
+
+
 class SubscriptionCreate(BaseModel):
     category: Annotated[str, Field(examples=["development"])]
     platform: Annotated[PlatformEnum, Field(examples=["discord"])]
     target_address: Annotated[str, Field(
         examples=["https://discord.com/api/webhooks/123456789/abcdef"]
     )]
+    delivery_mode: Annotated[DeliveryModeEnum, Field(
+        default=DeliveryModeEnum.INSTANT,
+        description="'instant' sends every job, 'batched' merges jobs into digests",
+        examples=["instant"]
+    )]
+    filters: Annotated[SubscriptionFilters, Field(
+        default_factory=SubscriptionFilters,
+        description="Only notify about jobs matching these, all jobs by default"
+    )]
     
     @model_validator(mode="after")
     def validate_target_for_platform(self):
@@ -49,12 +117,19 @@ class SubscriptionCreate(BaseModel):
                 {
                     "category": "development",
                     "platform": "discord",
-                    "target_address": "https://discord.com/api/webhooks/123456789/abcdefghijk"
+                    "target_address": "https://discord.com/api/webhooks/123456789/abcdefghijk",
+                    "delivery_mode": "instant"
                 },
                 {
                     "category": "design",
                     "platform": "telegram",
-                    "target_address": "USE_CONNECTED"
+                    "target_address": "USE_CONNECTED",
+                    "delivery_mode": "batched",
+                    "filters": {
+                        "include_keywords": ["logo", "شعار"],
+                        "min_budget": 100,
+                        "max_bids": 10
+                    }
                 }
             ]
         }
@@ -66,6 +141,11 @@ class SubscriptionUpdate(BaseModel):
     platform: Annotated[Optional[PlatformEnum], Field(default=None, examples=["telegram"])]
     target_address: Annotated[Optional[str], Field(default=None, examples=["USE_CONNECTED"])]
     is_active: Annotated[Optional[bool], Field(default=None, examples=[True])]
+    delivery_mode: Annotated[Optional[DeliveryModeEnum], Field(default=None, examples=["batched"])]
+    filters: Annotated[Optional[SubscriptionFilters], Field(
+        default=None,
+        description="Replaces all of the subscription's filters when given"
+    )]
     
     @model_validator(mode="after")
     def validate_target_for_platform(self):
@@ -97,6 +177,13 @@ class SubscriptionResponse(BaseModel):
         examples=["https://discord.com/api/webhooks/123/abc", "CONNECTED"]
     )]
     is_active: Annotated[bool, Field(examples=[True])]
+    delivery_mode: Annotated[DeliveryModeEnum, Field(examples=["instant"])]
+    filters: Annotated[SubscriptionFilters, Field(default_factory=SubscriptionFilters)]
+    quarantined_at: Annotated[Optional[datetime], Field(
+        default=None,
+        description="Set when the subscription was deactivated because its target stopped accepting messages",
+        examples=[None]
+    )]
     created_at: Annotated[datetime, Field(examples=["2024-01-15T10:30:00Z"])]
 
     model_config = ConfigDict(
@@ -109,6 +196,15 @@ class SubscriptionResponse(BaseModel):
                     "platform": "discord",
                     "target_address": "https://discord.com/api/webhooks/123456789/abcdef",
                     "is_active": True,
+                    "delivery_mode": "instant",
+                    "filters": {
+                        "include_keywords": [],
+                        "exclude_keywords": [],
+                        "min_budget": None,
+                        "max_budget": None,
+                        "max_bids": None
+                    },
+                    "quarantined_at": None,
                     "created_at": "2024-01-15T10:30:00Z"
                 },
                 {
@@ -117,6 +213,15 @@ class SubscriptionResponse(BaseModel):
                     "platform": "telegram",
                     "target_address": "CONNECTED",
                     "is_active": True,
+                    "delivery_mode": "batched",
+                    "filters": {
+                        "include_keywords": ["logo", "شعار"],
+                        "exclude_keywords": [],
+                        "min_budget": 100,
+                        "max_budget": None,
+                        "max_bids": 10
+                    },
+                    "quarantined_at": None,
                     "created_at": "2024-01-15T11:00:00Z"
                 }
             ]
@@ -139,6 +244,7 @@ class SubscriptionList(BaseModel):
                         "platform": "discord",
                         "target_address": "https://discord.com/api/webhooks/123/abc",
                         "is_active": True,
+                        "delivery_mode": "instant",
                         "created_at": "2024-01-15T10:30:00Z"
                     }
                 ],
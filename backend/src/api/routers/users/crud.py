@@ -4,6 +4,7 @@ from sqlalchemy import select, func, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 import models
+from core.subscriptions import user_changed
 from .schemas import UserProfile
 
 
@@ -83,6 +84,7 @@ async def update_telegram_id(db: AsyncSession, user_id: int, telegram_chat_id: i
         .values(telegram_chat_id=telegram_chat_id)
     )
     await db.commit()
+    await user_changed(user_id)
 
     return True
 
@@ -2,7 +2,7 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 import models
-from api.dependencies import get_db, get_current_active_user
+from api.dependencies import get_db, get_read_db, get_current_active_user
 from api.routers.users.crud import get_user_profile
 from api.routers.users import schemas
 from config import settings
@@ -18,7 +18,7 @@ router = APIRouter()
 @router.get("/me", response_model=schemas.UserProfile, status_code=status.HTTP_200_OK)
 async def get_current_user_info(
     current_user: models.User = Depends(get_current_active_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     try:
         return await get_user_profile(db, user_id=current_user.id)
@@ -0,0 +1,68 @@
+"""Benchmark the queue job formats.
+
+Compares bytes-per-job and encode/decode time of the legacy
+``json.dumps([category, job])`` entries against the versioned envelope.
+
+Usage:
+    python -m benchmarks.envelope [iterations]
+"""
+
+import json
+import sys
+import timeit
+
+from core.queue.envelope import JobEnvelope, decode_job, encode_job, encode_legacy_job
+
+
+SAMPLE_JOB = {
+    "project_id": "812345",
+    "project_link": "https://mostaql.com/project/812345-تصميم-موقع-الكتروني",
+    "project_title": "تصميم موقع الكتروني لشركة ناشئة",
+    "project_details": "نحتاج الى تصميم موقع الكتروني متجاوب يعمل على جميع الاجهزة. " * 8,
+    "project_date_published": "2024-01-15T00:00:00",
+    "project_budget": "$250.00 - $500.00",
+    "project_duration": "14 Days",
+    "project_owner_name": "محمد أحمد",
+    "project_owner_registration_date": "15 يناير 2023",
+    "project_owner_employment_rate": "85.71%",
+    "project_number_of_bids": "12",
+}
+
+
+def _report(name: str, raw: bytes | str, encode, decode, iterations: int) -> None:
+    size = len(raw.encode() if isinstance(raw, str) else raw)
+    encode_us = timeit.timeit(encode, number=iterations) / iterations * 1e6
+    decode_us = timeit.timeit(decode, number=iterations) / iterations * 1e6
+    print(f"{name:<16} {size:>8} B {encode_us:>10.2f} us {decode_us:>10.2f} us")
+
+
+def main(iterations: int = 100_000) -> None:
+    envelope = JobEnvelope(category="development", data=dict(SAMPLE_JOB))
+
+    legacy_json = json.dumps([envelope.category, envelope.data])
+    legacy_orjson = encode_legacy_job(envelope)
+    versioned = encode_job(envelope)
+
+    print(f"{'format':<16} {'size':>10} {'encode':>13} {'decode':>13}")
+    _report(
+        "legacy json", legacy_json,
+        lambda: json.dumps([envelope.category, envelope.data]),
+        lambda: json.loads(legacy_json),
+        iterations,
+    )
+    _report(
+        "legacy orjson", legacy_orjson,
+        lambda: encode_legacy_job(envelope),
+        lambda: decode_job(legacy_orjson),
+        iterations,
+    )
+    _report(
+        "envelope", versioned,
+        lambda: encode_job(envelope),
+        lambda: decode_job(versioned),
+        iterations,
+    )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,138 @@
+"""Load test the notification fan-out against the mock platforms.
+
+Seeds a throwaway user with N subscriptions in a throwaway category, split
+between Telegram chats and Discord webhooks that point at an in-process
+``benchmarks.mock_servers`` app, then drives ``notifier`` for a number of
+jobs and reports throughput, p99 delivery latency, the 429 rate and
+memory. Everything seeded is removed again.
+
+Needs the configured Postgres (migrated) and Redis. Failed deliveries are
+parked under a separate retry key, so a running consumer never picks
+them up.
+
+Usage:
+    python -m benchmarks.fanout [subscriptions] [jobs] [port]
+"""
+
+import asyncio
+import resource
+import sys
+import time
+import tracemalloc
+import uuid
+from typing import List
+
+import uvicorn
+from sqlalchemy import delete
+
+from config import settings
+from database import AsyncSessionLocal
+import models
+from clients import get_redis_client, close_http_clients
+from core.queue import consumer
+from benchmarks.envelope import SAMPLE_JOB
+from benchmarks.mock_servers import MockStats, create_mock_app
+
+
+LOADTEST_RETRY_QUEUE = "loadtest:retry"
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+async def _seed(category: str, count: int, port: int) -> int:
+    """Create a user with ``count`` subscriptions, returning its id."""
+    async with AsyncSessionLocal() as db:
+        user = models.User(
+            email=f"{category}@loadtest.invalid",
+            password_hash="!",
+            max_categories=settings.PRIORITY_PREMIUM_MIN_CATEGORIES,
+        )
+        db.add(user)
+        await db.flush()
+        for i in range(count):
+            if i % 2:
+                platform = models.PlatformEnum.DISCORD
+                target = f"http://127.0.0.1:{port}/api/webhooks/{i}/loadtest"
+            else:
+                platform = models.PlatformEnum.TELEGRAM
+                target = str(1_000_000 + i)
+            db.add(models.Subscription(user_id=user.id, category=category, platform=platform, target_address=target))
+        await db.commit()
+        return user.id
+
+
+async def _cleanup(category: str, user_id: int) -> None:
+    async with AsyncSessionLocal() as db:
+        await db.execute(delete(models.Subscription).where(models.Subscription.user_id == user_id))
+        await db.execute(delete(models.User).where(models.User.id == user_id))
+        await db.execute(delete(models.Job).where(models.Job.category == category))
+        await db.commit()
+    redis_client = await get_redis_client()
+    await redis_client.delete(LOADTEST_RETRY_QUEUE)
+
+
+async def run(subscriptions: int = 200, jobs: int = 3, port: int = 8081) -> None:
+    stats = MockStats()
+    server = uvicorn.Server(uvicorn.Config(create_mock_app(stats=stats), host="127.0.0.1", port=port, log_level="warning"))
+    server_task = asyncio.create_task(server.serve())
+    while not server.started:
+        await asyncio.sleep(0.05)
+
+    settings.TELEGRAM_API_BASE = f"http://127.0.0.1:{port}"
+    settings.TELEGRAM_TOKEN = settings.TELEGRAM_TOKEN or "loadtest"
+    consumer.retry_scheduler.key = LOADTEST_RETRY_QUEUE
+
+    category = f"loadtest-{uuid.uuid4().hex[:8]}"
+    user_id = await _seed(category, subscriptions, port)
+    latencies: List[float] = []
+
+    try:
+        tracemalloc.start()
+        started = time.time()
+        for n in range(jobs):
+            seen = {platform: len(times) for platform, times in stats.accepted_at.items()}
+            data = dict(SAMPLE_JOB, project_id=f"{category}-{n}")
+            dispatched_at = time.time()
+            await consumer.notifier(category, data, None, dispatched_at)
+            for platform, times in stats.accepted_at.items():
+                latencies.extend(t - dispatched_at for t in times[seen.get(platform, 0):])
+        elapsed = time.time() - started
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        redis_client = await get_redis_client()
+        retrying = await redis_client.zcard(LOADTEST_RETRY_QUEUE)
+    finally:
+        await _cleanup(category, user_id)
+        await close_http_clients()
+        server.should_exit = True
+        await server_task
+
+    requests = sum(stats.requests.values())
+    accepted = sum(stats.accepted.values())
+    rate_limited = sum(stats.rate_limited.values())
+
+    print(f"subscriptions      {subscriptions}")
+    print(f"jobs               {jobs}")
+    print(f"delivered          {accepted}/{subscriptions * jobs} ({retrying} parked for retry)")
+    print(f"throughput         {accepted / elapsed:.1f} msg/s")
+    print(f"latency p50        {_percentile(latencies, 50) * 1000:.0f} ms")
+    print(f"latency p99        {_percentile(latencies, 99) * 1000:.0f} ms")
+    print(f"429 rate           {rate_limited / requests if requests else 0:.2%}")
+    for platform in sorted(stats.requests):
+        print(
+            f"  {platform:<16} {stats.accepted[platform]} accepted, "
+            f"{stats.rate_limited[platform]} rate limited of {stats.requests[platform]}"
+        )
+    print(f"peak traced memory {peak / 1024 / 1024:.1f} MiB")
+    print(f"max rss            {resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024:.1f} MiB")
+
+
+if __name__ == "__main__":
+    args = [int(arg) for arg in sys.argv[1:4]]
+    asyncio.run(run(*args))
@@ -0,0 +1,164 @@
+"""Local stand-ins for the Telegram Bot API and Discord webhooks.
+
+Both endpoints answer like the real platforms, including their rate limits:
+
+- ``POST /bot{token}/sendMessage`` allows ``telegram_global_rate`` messages
+  per second overall and ``telegram_chat_rate`` per chat, and answers 429
+  with ``parameters.retry_after`` beyond that.
+- ``POST /api/webhooks/{id}/{token}`` allows ``discord_webhook_limit``
+  messages per ``discord_webhook_window`` seconds per webhook, sends the
+  ``X-RateLimit-*`` headers and answers 429 with ``Retry-After``.
+
+Every request waits a random, roughly log-normal latency first, and a
+share of requests can fail with a 502 to exercise retries.
+
+Usage:
+    python -m benchmarks.mock_servers [port]
+"""
+
+import asyncio
+import math
+import random
+import sys
+import time
+from collections import defaultdict, deque
+from dataclasses import dataclass, field
+from typing import Deque, Dict, List, Optional
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, Response
+
+
+@dataclass
+class MockConfig:
+    """Behaviour of the mock platforms."""
+
+    latency_ms: float = 40
+    # sigma of the log-normal latency, 0 for a fixed latency
+    latency_jitter: float = 0.5
+    error_rate: float = 0.0
+    telegram_global_rate: float = 30
+    telegram_chat_rate: float = 1
+    discord_webhook_limit: int = 5
+    discord_webhook_window: float = 2
+
+
+@dataclass
+class MockStats:
+    """What the mock platforms saw, for the load test report."""
+
+    requests: Dict[str, int] = field(default_factory=lambda: defaultdict(int))
+    accepted: Dict[str, int] = field(default_factory=lambda: defaultdict(int))
+    rate_limited: Dict[str, int] = field(default_factory=lambda: defaultdict(int))
+    # wall clock time of every accepted message
+    accepted_at: Dict[str, List[float]] = field(default_factory=lambda: defaultdict(list))
+
+    def reset(self) -> None:
+        for counter in (self.requests, self.accepted, self.rate_limited, self.accepted_at):
+            counter.clear()
+
+
+class SlidingWindow:
+    """Per-key sliding window limiter, like the platforms enforce."""
+
+    def __init__(self, limit: int, window: float):
+        self.limit = limit
+        self.window = window
+        self._hits: Dict[str, Deque[float]] = defaultdict(deque)
+
+    def hit(self, key: str) -> float:
+        """Record a request, returning 0 if allowed or the seconds to wait."""
+        now = time.monotonic()
+        hits = self._hits[key]
+        while hits and now - hits[0] >= self.window:
+            hits.popleft()
+        if len(hits) >= self.limit:
+            return self.window - (now - hits[0])
+        hits.append(now)
+        return 0.0
+
+    def remaining(self, key: str) -> int:
+        return max(0, self.limit - len(self._hits[key]))
+
+
+def create_mock_app(config: Optional[MockConfig] = None, stats: Optional[MockStats] = None) -> FastAPI:
+    """Build the mock platform app, recording into ``stats``."""
+    config = config or MockConfig()
+    stats = stats if stats is not None else MockStats()
+
+    app = FastAPI(title="First mock platforms")
+    app.state.stats = stats
+
+    telegram_global = SlidingWindow(max(1, int(config.telegram_global_rate)), 1)
+    telegram_chats = SlidingWindow(1, 1 / config.telegram_chat_rate)
+    discord_webhooks = SlidingWindow(config.discord_webhook_limit, config.discord_webhook_window)
+
+    async def simulate_latency() -> None:
+        latency = config.latency_ms / 1000
+        if config.latency_jitter:
+            latency = random.lognormvariate(math.log(latency), config.latency_jitter)
+        await asyncio.sleep(latency)
+
+    @app.post("/bot{token}/sendMessage")
+    async def send_message(token: str, request: Request):
+        stats.requests["telegram"] += 1
+        body = await request.json()
+        chat_id = str(body.get("chat_id"))
+        await simulate_latency()
+
+        if random.random() < config.error_rate:
+            return JSONResponse({"ok": False, "error_code": 502, "description": "Bad Gateway"}, status_code=502)
+
+        wait = telegram_global.hit("global") or telegram_chats.hit(chat_id)
+        if wait:
+            stats.rate_limited["telegram"] += 1
+            retry_after = max(1, math.ceil(wait))
+            return JSONResponse(
+                {
+                    "ok": False,
+                    "error_code": 429,
+                    "description": f"Too Many Requests: retry after {retry_after}",
+                    "parameters": {"retry_after": retry_after},
+                },
+                status_code=429,
+            )
+
+        stats.accepted["telegram"] += 1
+        stats.accepted_at["telegram"].append(time.time())
+        return JSONResponse({"ok": True, "result": {"message_id": stats.accepted["telegram"], "chat": {"id": chat_id}}})
+
+    @app.post("/api/webhooks/{webhook_id}/{webhook_token}")
+    async def execute_webhook(webhook_id: str, webhook_token: str):
+        stats.requests["discord"] += 1
+        await simulate_latency()
+
+        if random.random() < config.error_rate:
+            return JSONResponse({"message": "Bad Gateway", "code": 0}, status_code=502)
+
+        wait = discord_webhooks.hit(webhook_id)
+        headers = {
+            "X-RateLimit-Limit": str(config.discord_webhook_limit),
+            "X-RateLimit-Remaining": str(discord_webhooks.remaining(webhook_id)),
+            "X-RateLimit-Reset-After": f"{wait or config.discord_webhook_window:.3f}",
+            "X-RateLimit-Bucket": f"webhook-{webhook_id}",
+        }
+        if wait:
+            stats.rate_limited["discord"] += 1
+            headers["Retry-After"] = str(max(1, math.ceil(wait)))
+            return JSONResponse(
+                {"message": "You are being rate limited.", "retry_after": round(wait, 3), "global": False},
+                status_code=429,
+                headers=headers,
+            )
+
+        stats.accepted["discord"] += 1
+        stats.accepted_at["discord"].append(time.time())
+        return Response(status_code=204, headers=headers)
+
+    return app
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    uvicorn.run(create_mock_app(), host="127.0.0.1", port=int(sys.argv[1]) if len(sys.argv) > 1 else 8081)
@@ -0,0 +1,63 @@
+"""Benchmark the normalizer's parsers.
+
+Times each parser on typical scraped values, with ASCII and with
+Arabic-Indic digits, and a whole ``normalize_data`` pass per job.
+
+Usage:
+    python -m benchmarks.normalizer [iterations]
+"""
+
+import asyncio
+import sys
+import time
+import timeit
+
+from core.processing.normalizer import (
+    clean_duration,
+    normalize_data,
+    parse_arabic_date,
+    parse_budget,
+    parse_rate,
+    parse_registration_date,
+)
+from benchmarks.envelope import SAMPLE_JOB
+
+
+CASES = [
+    ("parse_budget", parse_budget, "$250.00 - $500.00"),
+    ("parse_budget ar", parse_budget, "$٢٥٠٫٠٠ - $٥٠٠٫٠٠"),
+    ("parse_rate", parse_rate, "85.71%"),
+    ("parse_rate ar", parse_rate, "٨٥٫٧١٪"),
+    ("parse_rate unset", parse_rate, "لم يحسب بعد"),
+    ("parse_arabic_date", parse_arabic_date, "15 يناير 2024"),
+    ("parse_arabic_date ar", parse_arabic_date, "١٥ يناير ٢٠٢٤"),
+    ("parse_registration", parse_registration_date, "3 أغسطس 2021"),
+    ("clean_duration", clean_duration, "14 يوم"),
+]
+
+
+async def _normalize_per_job(raw: dict, rounds: int) -> float:
+    started = time.perf_counter()
+    for _ in range(rounds):
+        await normalize_data({"development": [dict(raw)]})
+    return (time.perf_counter() - started) / rounds
+
+
+def main(iterations: int = 100_000) -> None:
+    print(f"{'parser':<22} {'per call':>12}")
+    for name, parser, value in CASES:
+        per_call = timeit.timeit(lambda: parser(value), number=iterations) / iterations * 1e6
+        print(f"{name:<22} {per_call:>9.2f} us")
+
+    raw = dict(
+        SAMPLE_JOB,
+        project_date_published="15 يناير 2024",
+        project_duration="14 يوم",
+        project_owner_registration_date="15 يناير 2023",
+    )
+    per_job = asyncio.run(_normalize_per_job(raw, iterations)) * 1e6
+    print(f"{'normalize_data / job':<22} {per_job:>9.2f} us")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,82 @@
+"""Check that the fan-out queries are planned with indexes.
+
+EXPLAINs the subscriber index's refresh queries (see
+``core.subscriptions.index.subscriber_query``) with sequential scans
+disabled, so the planner picks an index whenever one applies even on a
+small development database. Exits with status 1 if a plan uses none of
+the indexes expected for its query or scans one of the tables
+sequentially, i.e. an index was dropped or a query no longer matches it.
+
+Needs the configured Postgres (migrated).
+
+Usage:
+    python -m benchmarks.query_plans
+"""
+
+import asyncio
+import sys
+from typing import Any, Dict, FrozenSet, Iterator, List, Tuple
+
+import orjson
+from sqlalchemy import Select, text
+
+from database import engine
+import models
+from core.subscriptions import subscriber_query
+
+
+CHECKED_TABLES = {"subscriptions", "users"}
+
+
+def _queries() -> List[Tuple[str, Select, FrozenSet[str]]]:
+    # (name, query, indexes the query may be planned with). The plain user_id
+    # index stays for the API, which also lists inactive subscriptions, so
+    # the planner picks either one for the refresh by cost
+    return [
+        (
+            "subscriptions by id",
+            subscriber_query(models.Subscription.id.in_([1, 2, 3])),
+            frozenset({"subscriptions_pkey"}),
+        ),
+        (
+            "subscribers of users",
+            subscriber_query(models.Subscription.user_id.in_([1, 2, 3])),
+            frozenset({"ix_subscriptions_active_user_id", "ix_subscriptions_user_id"}),
+        ),
+    ]
+
+
+def _nodes(plan: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    yield plan
+    for child in plan.get("Plans", []):
+        yield from _nodes(child)
+
+
+async def check_plans() -> bool:
+    """EXPLAIN every query, printing its scans. Returns False on a missing index or a sequential scan."""
+    ok = True
+    async with engine.connect() as conn:
+        await conn.execute(text("SET enable_seqscan = off"))
+        for name, query, expected_indexes in _queries():
+            sql = str(query.compile(dialect=conn.dialect, compile_kwargs={"literal_binds": True}))
+            raw = (await conn.execute(text(f"EXPLAIN (FORMAT JSON) {sql}"))).scalar()
+            plan = (orjson.loads(raw) if isinstance(raw, str) else raw)[0]["Plan"]
+
+            scans = [node for node in _nodes(plan) if "Relation Name" in node]
+            seq_scans = [
+                node["Relation Name"] for node in scans
+                if node["Node Type"] == "Seq Scan" and node["Relation Name"] in CHECKED_TABLES
+            ]
+            missing = not expected_indexes & {node.get("Index Name") for node in scans}
+            failed = missing or bool(seq_scans)
+            status = "FAIL" if failed else "ok"
+            print(f"{status:<5} {name} (expects {' or '.join(sorted(expected_indexes))})")
+            for node in scans:
+                print(f"      {node['Node Type']} on {node['Relation Name']} {node.get('Index Name', '')}".rstrip())
+            ok = ok and not failed
+    await engine.dispose()
+    return ok
+
+
+if __name__ == "__main__":
+    sys.exit(0 if asyncio.run(check_plans()) else 1)
@@ -1,4 +1,6 @@
-from typing import Optional
+from typing import Dict, Optional
+
+import httpx
 import redis.asyncio as redis
 
 from config import settings
@@ -45,3 +47,52 @@ async def get_redis_client() -> redis.Redis:
         raise RuntimeError("Redis authentication failed. Check REDIS_PASS.")
     except redis.ConnectionError:
         raise RuntimeError("Redis connection failed. Is Redis running?")
+
+
+class HttpClientManager:
+    """singleton holding one keep-alive httpx client per host"""
+
+    _instance: Optional["HttpClientManager"] = None
+    _clients: Dict[str, httpx.AsyncClient]
+
+    def __new__(cls) -> "HttpClientManager":
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._clients = {}
+        return cls._instance
+
+    def get(self, host: str) -> httpx.AsyncClient:
+        """get or create the pooled client for a host"""
+        client = self._clients.get(host)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                http2=settings.HTTP2_ENABLED,
+                timeout=settings.HTTP_TIMEOUT_SECONDS,
+                limits=httpx.Limits(
+                    max_connections=settings.HTTP_MAX_CONNECTIONS,
+                    max_keepalive_connections=settings.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+                    keepalive_expiry=settings.HTTP_KEEPALIVE_EXPIRY_SECONDS,
+                ),
+            )
+            self._clients[host] = client
+        return client
+
+    async def close(self) -> None:
+        """close every pooled client"""
+        clients, self._clients = self._clients, {}
+        for client in clients.values():
+            await client.aclose()
+
+
+_http_singleton = HttpClientManager()
+
+
+def get_http_client(url_or_host: str) -> httpx.AsyncClient:
+    """get the shared http client for the host of a URL (or a bare host)"""
+    host = httpx.URL(url_or_host).host or url_or_host
+    return _http_singleton.get(host)
+
+
+async def close_http_clients() -> None:
+    """close all shared http clients, call on service shutdown"""
+    await _http_singleton.close()
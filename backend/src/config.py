@@ -1,6 +1,6 @@
-from typing import ClassVar
+from typing import ClassVar, Optional
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from pydantic import computed_field
+from pydantic import computed_field, field_validator
 
 
 class Settings(BaseSettings):
@@ -16,8 +16,47 @@ class Settings(BaseSettings):
 
     QUEUE_MAIN: ClassVar[str] = "task_queue"
     QUEUE_PROCESSING: ClassVar[str] = "task_queue:processing"
-    
+    QUEUE_CATEGORY_TEMPLATE: ClassVar[str] = "task_queue:{category}"
+    DELIVERY_RETRY_QUEUE: ClassVar[str] = "delivery:retry"
+    DELIVERY_FAILURE_LOG: ClassVar[str] = "delivery:failures"
+    QUARANTINE_FAILURES_KEY: ClassVar[str] = "quarantine:failures:{platform}:{target}"
+    SUBSCRIPTION_EVENTS_CHANNEL: ClassVar[str] = "subscriptions:changes"
+
+    # Consumer workers per category, rebalanced toward the deepest queues
+    CONSUMER_WORKERS_PER_CATEGORY: int = 1
+    CONSUMER_MAX_WORKERS: int = 24
+    CONSUMER_REBALANCE_INTERVAL: int = 10
+
+    # Delivery tiers: users with at least this many categories are premium
+    PRIORITY_PREMIUM_MIN_CATEGORIES: int = 2
+    PRIORITY_HIGH_WEIGHT: int = 8
+    PRIORITY_NORMAL_WEIGHT: int = 1
+    PRIORITY_MAX_WAIT_SECONDS: int = 60
+
+    # Backpressure: the publisher waits while the deepest tier queue is above
+    # the high-water mark, the consumer sheds delivery of jobs older than
+    # QUEUE_MAX_JOB_AGE_SECONDS (0 disables)
+    QUEUE_HIGH_WATER_MARK: int = 500
+    QUEUE_BACKPRESSURE_MAX_WAIT_SECONDS: int = 120
+    QUEUE_MAX_JOB_AGE_SECONDS: int = 1800
+    # "drop" skips delivery of stale jobs, "digest" sends them batched
+    QUEUE_STALE_JOB_POLICY: str = "drop"
+
+    # 0 = legacy [category, job] JSON, keep it until every consumer reads envelopes,
+    # 2 = envelope without the typed job values
+    QUEUE_ENVELOPE_VERSION: int = 3
+
+    @field_validator("QUEUE_ENVELOPE_VERSION")
+    @classmethod
+    def _check_envelope_version(cls, version: int) -> int:
+        # fail at startup rather than on every publish, version 1 is read-only
+        if version not in (0, 2, 3):
+            raise ValueError(f"QUEUE_ENVELOPE_VERSION must be 0, 2 or 3, not {version}")
+        return version
 
+    # Metrics (0 disables the Prometheus endpoint)
+    METRICS_PORT: int = 9100
+    METRICS_QUEUE_DEPTH_INTERVAL: int = 15
 
     # Redis 
     REDIS_HOST: str = "localhost"
@@ -36,6 +75,28 @@ class Settings(BaseSettings):
     def DATABASE_URL(self) -> str:
         return f"postgresql+asyncpg://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}@{self.POSTGRES_HOST}:{self.POSTGRES_PORT}/{self.POSTGRES_DB}"
 
+    # Optional read replica (same credentials and database) for read-only
+    # API queries, unset sends everything to the primary
+    POSTGRES_READ_HOST: Optional[str] = None
+    POSTGRES_READ_PORT: Optional[int] = None
+
+    @computed_field
+    @property
+    def DATABASE_READ_URL(self) -> Optional[str]:
+        if not self.POSTGRES_READ_HOST:
+            return None
+        port = self.POSTGRES_READ_PORT or self.POSTGRES_PORT
+        return f"postgresql+asyncpg://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}@{self.POSTGRES_READ_HOST}:{port}/{self.POSTGRES_DB}"
+
+    # Connection pools of each process, set per service in docker-compose
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_READ_POOL_SIZE: int = 5
+    DB_READ_MAX_OVERFLOW: int = 10
+    # an unreachable replica is skipped for DB_READ_RETRY_SECONDS
+    DB_READ_CONNECT_TIMEOUT_SECONDS: float = 2
+    DB_READ_RETRY_SECONDS: float = 30
+
     # Auth 
     SECRET_KEY: str
     ALGORITHM: str = "HS256"
@@ -44,10 +105,79 @@ class Settings(BaseSettings):
     ACCESS_TOKEN_TYPE: ClassVar[str] = "access"
     REFRESH_TOKEN_TYPE: ClassVar[str] = "refresh"
 
+    # Outbound HTTP (pooled per host, HTTP/2 needs the h2 package)
+    HTTP2_ENABLED: bool = False
+    HTTP_TIMEOUT_SECONDS: float = 10
+    HTTP_MAX_CONNECTIONS: int = 100
+    HTTP_MAX_KEEPALIVE_CONNECTIONS: int = 20
+    HTTP_KEEPALIVE_EXPIRY_SECONDS: float = 30
+
+    # Outbound rate limits (messages per second)
+    TELEGRAM_GLOBAL_RATE: float = 30
+    TELEGRAM_CHAT_RATE: float = 1
+    TELEGRAM_GROUP_RATE: float = 20 / 60
+    DISCORD_GLOBAL_RATE: float = 50
+    DISCORD_WEBHOOK_RATE: float = 5 / 2
+
+    # Concurrent deliveries per job fan-out
+    FANOUT_CONCURRENCY: int = 50
+
+    # Rendered notification payloads shared between replicas through Redis
+    RENDER_CACHE_REDIS: bool = True
+    RENDER_CACHE_TTL_SECONDS: int = 60 * 60
+
+    # Batched (digest) delivery
+    BATCH_WINDOW_SECONDS: float = 60
+    BATCH_MAX_ITEMS: int = 10
+
+    # Delivery retries (exponential backoff with full jitter)
+    DELIVERY_MAX_ATTEMPTS: int = 5
+    DELIVERY_RETRY_BASE_DELAY: float = 2
+    DELIVERY_RETRY_MAX_DELAY: float = 300
+
+    # Quarantine of dead targets (deleted webhooks, blocked chats)
+    QUARANTINE_FAILURE_THRESHOLD: int = 3
+    # consecutive failures further apart than this start over
+    QUARANTINE_FAILURE_WINDOW_SECONDS: int = 86400
+    DELIVERY_FAILURE_LOG_MAXLEN: int = 10000
+
+    # Write-behind persistence of consumed jobs
+    JOB_WRITE_BATCH_SIZE: int = 100
+    JOB_WRITE_FLUSH_SECONDS: float = 2
+    JOB_WRITE_BUFFER_MAX: int = 10000
+
+    # Consumer's in-memory subscriber index, rebuilt from the DB this often
+    SUBSCRIBER_INDEX_RESYNC_SECONDS: int = 300
+
+    # Monthly partitions of the jobs table, created this many months ahead
+    JOB_PARTITIONS_AHEAD: int = 3
+    # months of jobs kept in the jobs table, 0 keeps everything
+    JOB_RETENTION_MONTHS: int = 12
+    # "archive" moves expired partitions to JOB_ARCHIVE_SCHEMA, "drop" deletes them
+    JOB_RETENTION_POLICY: str = "archive"
+    JOB_ARCHIVE_SCHEMA: ClassVar[str] = "jobs_archive"
+    JOB_PARTITION_MAINTENANCE_SECONDS: int = 6 * 60 * 60
+    # a job seen again within this many days is not stored twice
+    JOB_DEDUP_WINDOW_DAYS: int = 7
+
+    # Jobs API: the unfiltered first page of each category is cached in
+    # Redis, the consumer bumps the category's generation when it stores jobs
+    JOBS_PAGE_SIZE: int = 20
+    JOBS_MAX_PAGE_SIZE: int = 100
+    JOBS_PAGE_CACHE_TTL_SECONDS: int = 300
+    JOBS_PAGE_CACHE_KEY: ClassVar[str] = "jobs:page:{category}:{generation}"
+    JOBS_GENERATION_KEY: ClassVar[str] = "jobs:generation:{category}"
+    # category name used in the keys for the page across all categories
+    JOBS_ALL_CATEGORIES: ClassVar[str] = "all"
+    # ranking sorts every match, so search only goes this many pages deep
+    JOBS_SEARCH_MAX_PAGES: int = 10
+
     # Telegram 
     TELEGRAM_TOKEN: str
     TELEGRAM_BOT_USERNAME: str
     TELEGRAM_TOKENS_TTL: int = 60 * 5  # 5 minutes
+    # point at a local stand-in server for load tests
+    TELEGRAM_API_BASE: str = "https://api.telegram.org"
 
     # Optional
     ALERT_WEBHOOK: str = ""
@@ -0,0 +1,18 @@
+# Maintenance module
+from .partitions import (
+    maintain_partitions,
+    ensure_partitions,
+    list_partitions,
+    expired_partitions,
+    retire_partition,
+    partition_name,
+)
+
+__all__ = [
+    "maintain_partitions",
+    "ensure_partitions",
+    "list_partitions",
+    "expired_partitions",
+    "retire_partition",
+    "partition_name",
+]
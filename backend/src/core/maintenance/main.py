@@ -0,0 +1,32 @@
+"""Main entry point for the database maintenance service."""
+
+import asyncio
+import traceback
+
+from core.maintenance.partitions import maintain_partitions
+from logging_config import get_maintenance_logger
+from config import settings
+
+logger = get_maintenance_logger()
+
+
+async def run_maintenance_loop() -> None:
+    """
+    Run partition maintenance in an infinite loop.
+
+    Runs once on start and then every JOB_PARTITION_MAINTENANCE_SECONDS.
+    """
+    logger.info(f"Starting maintenance loop (interval: {settings.JOB_PARTITION_MAINTENANCE_SECONDS}s)")
+
+    while True:
+        try:
+            created, retired = await maintain_partitions()
+            logger.info(f"Partition maintenance done: {len(created)} created, {len(retired)} retired")
+        except Exception as e:
+            logger.critical(f"Partition maintenance crashed: {e}\n{traceback.format_exc()}")
+
+        await asyncio.sleep(settings.JOB_PARTITION_MAINTENANCE_SECONDS)
+
+
+if __name__ == "__main__":
+    asyncio.run(run_maintenance_loop())
@@ -0,0 +1,162 @@
+"""Monthly partitions of the jobs table.
+
+``jobs`` is range partitioned on ``created_at``, one partition per month
+named ``jobs_YYYY_MM``. Maintenance keeps ``JOB_PARTITIONS_AHEAD`` months
+of partitions ready for inserts and retires partitions that ended more
+than ``JOB_RETENTION_MONTHS`` ago: they are detached and then moved to the
+``JOB_ARCHIVE_SCHEMA`` schema or dropped, both of which only touch the
+catalog, never the rows. Archived partitions are plain tables that can be
+dumped and dropped whenever convenient.
+"""
+
+import re
+from datetime import date, datetime, timezone
+from typing import List, Optional, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from config import settings
+from database import engine
+from logging_config import get_maintenance_logger
+
+
+logger = get_maintenance_logger()
+
+PARENT_TABLE = "jobs"
+_PARTITION_NAME_RE = re.compile(rf"^{PARENT_TABLE}_(\d{{4}})_(\d{{2}})$")
+
+# any constant works, it only has to be the same for every maintenance run
+MAINTENANCE_LOCK_ID = 4_600_046
+
+
+def month_start(value: date) -> date:
+    return date(value.year, value.month, 1)
+
+
+def add_months(month: date, months: int) -> date:
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    return f"{PARENT_TABLE}_{month.year:04d}_{month.month:02d}"
+
+
+def partition_month(name: str) -> Optional[date]:
+    """The month a partition holds, None for tables not named by month."""
+    match = _PARTITION_NAME_RE.match(name)
+    return date(int(match.group(1)), int(match.group(2)), 1) if match else None
+
+
+async def ensure_partitions(conn: AsyncConnection, first: date, last: date) -> List[str]:
+    """
+    Create the missing monthly partitions from ``first`` to ``last``.
+
+    Args:
+        conn: Connection to run the DDL on.
+        first: A day in the first month to cover.
+        last: A day in the last month to cover.
+
+    Returns:
+        Names of the partitions created.
+    """
+    existing = set(await list_partitions(conn))
+    created = []
+    month = month_start(first)
+    while month <= month_start(last):
+        name = partition_name(month)
+        if name not in existing:
+            await conn.execute(text(
+                f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF {PARENT_TABLE} "
+                f"FOR VALUES FROM ('{month.isoformat()}') TO ('{add_months(month, 1).isoformat()}')"
+            ))
+            created.append(name)
+        month = add_months(month, 1)
+    return created
+
+
+async def list_partitions(conn: AsyncConnection) -> List[str]:
+    """Names of the partitions currently attached to the jobs table."""
+    result = await conn.execute(text(
+        "SELECT child.relname FROM pg_inherits "
+        "JOIN pg_class parent ON parent.oid = pg_inherits.inhparent "
+        "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+        "WHERE parent.relname = :parent ORDER BY child.relname"
+    ), {"parent": PARENT_TABLE})
+    return list(result.scalars())
+
+
+def expired_partitions(partitions: List[str], today: date, retention_months: int) -> List[str]:
+    """
+    Pick the partitions whose whole month is older than the retention period.
+
+    Args:
+        partitions: Attached partition names.
+        today: The current date.
+        retention_months: Months to keep, 0 keeps everything.
+    """
+    if retention_months <= 0:
+        return []
+    cutoff = add_months(month_start(today), -retention_months)
+    return [
+        name for name in partitions
+        if (month := partition_month(name)) is not None and add_months(month, 1) <= cutoff
+    ]
+
+
+async def retire_partition(conn: AsyncConnection, name: str, policy: str = settings.JOB_RETENTION_POLICY) -> None:
+    """
+    Detach a partition and archive or drop it.
+
+    Needs an AUTOCOMMIT connection, a concurrent detach cannot run inside
+    a transaction block.
+    """
+    # CONCURRENTLY only waits for queries on the partition instead of
+    # locking the whole jobs table against inserts
+    await conn.execute(text(f"ALTER TABLE {PARENT_TABLE} DETACH PARTITION {name} CONCURRENTLY"))
+    if policy == "drop":
+        await conn.execute(text(f"DROP TABLE {name}"))
+        logger.info(f"Dropped expired partition {name}")
+    else:
+        await conn.execute(text(f"CREATE SCHEMA IF NOT EXISTS {settings.JOB_ARCHIVE_SCHEMA}"))
+        await conn.execute(text(f"ALTER TABLE {name} SET SCHEMA {settings.JOB_ARCHIVE_SCHEMA}"))
+        logger.info(f"Archived expired partition {name} to {settings.JOB_ARCHIVE_SCHEMA}.{name}")
+
+
+async def maintain_partitions(
+    db_engine: AsyncEngine = engine,
+    ahead: int = settings.JOB_PARTITIONS_AHEAD,
+    retention_months: int = settings.JOB_RETENTION_MONTHS,
+) -> Tuple[List[str], List[str]]:
+    """
+    Create upcoming partitions and retire expired ones.
+
+    Only one maintenance run at a time does anything, others return
+    straight away.
+
+    Returns:
+        Names of the partitions created and of those retired.
+    """
+    today = datetime.now(timezone.utc).date()
+    async with db_engine.connect() as conn:
+        conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+        locked = await conn.scalar(text("SELECT pg_try_advisory_lock(:id)"), {"id": MAINTENANCE_LOCK_ID})
+        if not locked:
+            logger.info("Partition maintenance already running elsewhere, skipping")
+            return [], []
+        try:
+            created = await ensure_partitions(conn, today, add_months(month_start(today), ahead))
+            for name in created:
+                logger.info(f"Created partition {name}")
+
+            retired = []
+            for name in expired_partitions(await list_partitions(conn), today, retention_months):
+                try:
+                    await retire_partition(conn, name)
+                    retired.append(name)
+                except Exception as e:
+                    logger.error(f"Failed to retire partition {name}: {e}")
+            return created, retired
+        finally:
+            await conn.execute(text("SELECT pg_advisory_unlock(:id)"), {"id": MAINTENANCE_LOCK_ID})
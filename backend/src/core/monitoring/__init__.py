@@ -0,0 +1,32 @@
+# Monitoring module
+from .metrics import (
+    PIPELINE_STAGE_LATENCY,
+    DELIVERY_LATENCY,
+    QUEUE_DEPTH,
+    CONSUMER_WORKERS,
+    BACKPRESSURE_DECISIONS,
+    DELIVERY_RETRIES,
+    DELIVERIES,
+    FANOUT_DURATION,
+    FANOUT_COALESCED,
+    TARGETS_QUARANTINED,
+    observe_stage,
+    observe_delivery,
+    start_metrics_server,
+)
+
+__all__ = [
+    "PIPELINE_STAGE_LATENCY",
+    "DELIVERY_LATENCY",
+    "QUEUE_DEPTH",
+    "CONSUMER_WORKERS",
+    "BACKPRESSURE_DECISIONS",
+    "DELIVERY_RETRIES",
+    "DELIVERIES",
+    "FANOUT_DURATION",
+    "FANOUT_COALESCED",
+    "TARGETS_QUARANTINED",
+    "observe_stage",
+    "observe_delivery",
+    "start_metrics_server",
+]
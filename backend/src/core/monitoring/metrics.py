@@ -0,0 +1,119 @@
+"""Prometheus metrics shared by the scraper and consumer services."""
+
+from typing import Optional
+
+from prometheus_client import Counter, Gauge, Histogram, start_http_server
+
+from config import settings
+from logging_config import setup_logging
+
+
+logger = setup_logging("first.monitoring")
+
+# seconds, from sub-second hops up to a full scrape interval and beyond
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600)
+
+PIPELINE_STAGE_LATENCY = Histogram(
+    "first_pipeline_stage_latency_seconds",
+    "Latency between two pipeline stages of a job",
+    ["stage", "category", "tier"],
+    buckets=LATENCY_BUCKETS,
+)
+
+DELIVERY_LATENCY = Histogram(
+    "first_delivery_latency_seconds",
+    "Latency from a pipeline stage until a platform accepted the notification",
+    ["stage", "category", "platform"],
+    buckets=LATENCY_BUCKETS,
+)
+
+QUEUE_DEPTH = Gauge(
+    "first_queue_depth",
+    "Number of entries waiting in a Redis queue",
+    ["queue"],
+)
+
+CONSUMER_WORKERS = Gauge(
+    "first_consumer_workers",
+    "Number of consumer workers assigned to a queue shard",
+    ["shard"],
+)
+
+BACKPRESSURE_DECISIONS = Counter(
+    "first_backpressure_decisions_total",
+    "Backpressure and load shedding decisions taken for queued jobs",
+    ["component", "decision"],
+)
+
+DELIVERY_RETRIES = Counter(
+    "first_delivery_retries_total",
+    "Delivery retry decisions and outcomes",
+    ["platform", "outcome"],
+)
+
+DELIVERIES = Counter(
+    "first_deliveries_total",
+    "Settled deliveries by outcome (delivered, retrying, failed)",
+    ["platform", "outcome"],
+)
+
+FANOUT_DURATION = Histogram(
+    "first_fanout_duration_seconds",
+    "Time from the start of a job's fan-out until every delivery settled",
+    ["category", "tier"],
+    buckets=LATENCY_BUCKETS,
+)
+
+FANOUT_COALESCED = Counter(
+    "first_fanout_coalesced_total",
+    "Sends skipped because another subscription shares the delivery target",
+    ["category", "platform"],
+)
+
+TARGETS_QUARANTINED = Counter(
+    "first_targets_quarantined_total",
+    "Delivery targets deactivated after repeated permanent failures",
+    ["platform"],
+)
+
+
+def observe_stage(
+    stage: str,
+    category: str,
+    start: Optional[float],
+    end: Optional[float],
+    tier: str = "all"
+) -> None:
+    """
+    Record the latency between two stage timestamps.
+
+    Missing timestamps (e.g. legacy queue entries) are skipped.
+    """
+    if start is None or end is None:
+        return
+    PIPELINE_STAGE_LATENCY.labels(stage=stage, category=category, tier=tier).observe(
+        max(0.0, end - start)
+    )
+
+
+def observe_delivery(
+    stage: str,
+    category: str,
+    platform: str,
+    start: Optional[float],
+    end: float
+) -> None:
+    """Record the latency from a stage timestamp until a delivery was accepted."""
+    if start is None:
+        return
+    DELIVERY_LATENCY.labels(stage=stage, category=category, platform=platform).observe(
+        max(0.0, end - start)
+    )
+
+
+def start_metrics_server() -> None:
+    """Expose the metrics endpoint if METRICS_PORT is configured."""
+    if not settings.METRICS_PORT:
+        return
+    start_http_server(settings.METRICS_PORT)
+    logger.info(f"Metrics exposed on port {settings.METRICS_PORT}")
@@ -1,12 +1,23 @@
 # Notifications module
-from .base import BaseNotifier
-from .discord import discord_format, notify_discord
-from .telegram import telegram_format, notify_telegram
+from .base import BaseNotifier, DeliveryResult
+from .registry import get_notifier, get_notifiers, register_notifier
+from .discord import DiscordNotifier, discord_format, notify_discord
+from .telegram import TelegramNotifier, telegram_format, notify_telegram
+from .retry import RetryItem, RetryPolicy, RetryScheduler
 
 __all__ = [
     "BaseNotifier",
+    "DeliveryResult",
+    "get_notifier",
+    "get_notifiers",
+    "register_notifier",
+    "DiscordNotifier",
     "discord_format",
     "notify_discord",
+    "TelegramNotifier",
     "telegram_format",
     "notify_telegram",
+    "RetryItem",
+    "RetryPolicy",
+    "RetryScheduler",
 ]
@@ -1,14 +1,91 @@
 """Abstract base class for notification platforms."""
 
+import asyncio
+import time
 from abc import ABC, abstractmethod
-from typing import Dict
+from dataclasses import dataclass, field
+from typing import Any, ClassVar, Dict, FrozenSet, List, Mapping, Optional, Sequence
+
+import httpx
+import orjson
+
+from config import settings
+from core.notifications.rate_limit import KeyedRateLimiter
+
+
+@dataclass
+class DeliveryResult:
+    """
+    Outcome of a single delivery attempt.
+
+    Truthy when the platform accepted the message, so callers that only
+    need success can keep treating it as a bool.
+    """
+
+    ok: bool
+    status_code: Optional[int] = None
+    # seconds the platform asked us to wait before trying again
+    retry_after: Optional[float] = None
+    # rate limits, server errors and timeouts are worth retrying
+    retryable: bool = False
+    error: Optional[str] = None
+    # when the attempt finished, batch sends settle after the whole batch
+    completed_at: float = field(default_factory=time.time)
+    # response headers, the notifier's rate limiter learns from them
+    headers: Mapping[str, str] = field(default_factory=dict, repr=False)
+
+    def __bool__(self) -> bool:
+        return self.ok
+
+    @classmethod
+    def from_response(
+        cls,
+        response: httpx.Response,
+        ok: bool,
+        retry_after: Optional[float] = None
+    ) -> "DeliveryResult":
+        status = response.status_code
+        return cls(
+            ok=ok,
+            status_code=status,
+            retry_after=retry_after,
+            retryable=not ok and (status == 429 or status >= 500),
+            error=None if ok else response.text[:200],
+            headers=response.headers,
+        )
+
+    @classmethod
+    def from_exception(cls, error: Exception) -> "DeliveryResult":
+        return cls(
+            ok=False,
+            retryable=isinstance(error, httpx.TransportError),
+            error=str(error) or type(error).__name__,
+        )
 
 
 class BaseNotifier(ABC):
-    """Abstract base class for notification services."""
-    
+    """
+    Abstract base class for notification services.
+
+    Each platform is a plugin registered under its ``platform`` name (see
+    ``core.notifications.registry``). A plugin owns its connection pool,
+    rate limiter and retry policy, so the consumer only deals with
+    rendered payloads and ``DeliveryResult``s.
+    """
+
+    platform: ClassVar[str]
+    # statuses meaning the target is gone for good, see ``is_permanent``
+    permanent_statuses: ClassVar[FrozenSet[int]] = frozenset({403, 404})
+    # paces every send, see ``core.notifications.rate_limit``; None sends unpaced
+    limiter: ClassVar[Optional[KeyedRateLimiter]] = None
+
+    def __init__(self, retry_policy: Any = None, concurrency: int = settings.FANOUT_CONCURRENCY):
+        # None falls back to the retry scheduler's default policy
+        self.retry_policy = retry_policy
+        self.concurrency = concurrency
+
     @abstractmethod
-    async def format_message(self, category: str, data: Dict[str, str]) -> dict:
+    async def format_message(self, category: str, data: Dict[str, str]) -> Any:
         """
         Format job data for the specific platform.
         
@@ -17,20 +94,88 @@ class BaseNotifier(ABC):
             data: The job data dictionary.
             
         Returns:
-            Formatted message dictionary for the platform.
+            Formatted message for the platform.
         """
         pass
     
     @abstractmethod
-    async def send(self, target: str, message: dict) -> bool:
+    async def deliver(self, target: str, message: Any) -> DeliveryResult:
         """
-        Send a notification to the target.
-        
+        Post a notification to the target, without any pacing.
+
         Args:
             target: The target address (webhook URL, chat ID, etc.).
-            message: The formatted message to send.
-            
+            message: The formatted message, or a payload from ``render``.
+
         Returns:
-            True if successful, False otherwise.
+            The delivery result, truthy if the platform accepted it.
         """
         pass
+
+    async def send(self, target: str, message: Any) -> DeliveryResult:
+        """
+        Send a notification to the target once ``limiter`` allows it.
+
+        The limiter then observes the result, so 429s and rate limit
+        headers slow down the following sends.
+
+        Args:
+            target: The target address (webhook URL, chat ID, etc.).
+            message: The formatted message, or a payload from ``render``.
+
+        Returns:
+            The delivery result, truthy if the platform accepted it.
+        """
+        if self.limiter is None:
+            return await self.deliver(target, message)
+
+        await self.limiter.acquire(target)
+        result = await self.deliver(target, message)
+        self.limiter.observe(target, result)
+        return result
+
+    def serialize(self, message: Any) -> bytes:
+        """Serialize a formatted message into the payload ``send`` accepts."""
+        return orjson.dumps(message)
+
+    async def render(self, category: str, data: Dict[str, str]) -> bytes:
+        """Format and serialize a job's message once for every target."""
+        return self.serialize(await self.format_message(category, data))
+
+    async def send_many(self, targets: Sequence[str], message: Any) -> List[DeliveryResult]:
+        """
+        Send the same message to many targets.
+
+        The default sends concurrently, at most ``concurrency`` at a time;
+        platforms with a real batch endpoint can override it.
+
+        Returns:
+            One result per target, in the order of ``targets``.
+        """
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def send_one(target: str) -> DeliveryResult:
+            async with semaphore:
+                try:
+                    return await self.send(target, message)
+                except Exception as e:
+                    return DeliveryResult.from_exception(e)
+
+        return list(await asyncio.gather(*(send_one(target) for target in targets)))
+
+    def is_permanent(self, result: DeliveryResult) -> bool:
+        """Whether a failed delivery means the target will never accept messages."""
+        return not result and result.status_code in self.permanent_statuses
+
+    def digest_item(self, category: str, data: Dict[str, str]) -> Any:
+        """
+        Format a job as one JSON-serializable entry of a digest.
+
+        The default keeps the job itself, ``digest`` then sends each one
+        as a regular message.
+        """
+        return {"category": category, "data": data}
+
+    async def digest(self, items: List[Any]) -> List[bytes]:
+        """Merge digest entries into serialized payloads."""
+        return [await self.render(item["category"], item["data"]) for item in items]
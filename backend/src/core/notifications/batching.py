@@ -0,0 +1,102 @@
+"""Micro-batched digest delivery for subscriptions in batched mode.
+
+Jobs bound for the same target are buffered in Redis
+(``digest:{platform}:{target}``) and a sorted set tracks when each buffer
+is due. A buffer is flushed ``BATCH_WINDOW_SECONDS`` after its first job,
+or right away once it holds ``BATCH_MAX_ITEMS`` jobs. Discord buffers are
+sent as multi-embed webhook messages, Telegram buffers as digest messages.
+"""
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, Set
+
+import orjson
+
+from config import settings
+from clients import get_redis_client
+from core.notifications.registry import get_notifier
+from logging_config import get_notifications_logger
+
+
+logger = get_notifications_logger()
+
+DIGEST_DUE_KEY = "digest:due"
+
+# (platform, target, payload, category) -> awaitable delivery
+Send = Callable[[str, str, bytes, str], Awaitable[Any]]
+
+
+def _buffer_key(platform: str, target: str) -> str:
+    return f"digest:{platform}:{target}"
+
+
+class DigestBatcher:
+    """Buffer jobs per target and flush them as digests."""
+
+    def __init__(
+        self,
+        send: Send,
+        window: float = settings.BATCH_WINDOW_SECONDS,
+        max_items: int = settings.BATCH_MAX_ITEMS,
+        poll_interval: float = 1
+    ):
+        self.send = send
+        self.window = window
+        self.max_items = max_items
+        self.poll_interval = poll_interval
+        self._in_flight: Set[asyncio.Task] = set()
+
+    async def add(self, platform: str, target: str, category: str, data: Dict[str, str]) -> None:
+        """Append a job to the target's buffer and schedule the flush."""
+        redis_client = await get_redis_client()
+        item = orjson.dumps(get_notifier(platform).digest_item(category, data))
+        member = f"{platform}|{target}"
+
+        length = await redis_client.rpush(_buffer_key(platform, target), item)
+        if length >= self.max_items:
+            await redis_client.zadd(DIGEST_DUE_KEY, {member: time.time()})
+        else:
+            # the first job of a buffer starts its window
+            await redis_client.zadd(DIGEST_DUE_KEY, {member: time.time() + self.window}, nx=True)
+
+    async def run(self) -> None:
+        """Flush due buffers until cancelled."""
+        redis_client = await get_redis_client()
+
+        while True:
+            try:
+                due = await redis_client.zrangebyscore(DIGEST_DUE_KEY, "-inf", time.time())
+                for member in due:
+                    # claiming by ZREM keeps several consumers from flushing twice
+                    if await redis_client.zrem(DIGEST_DUE_KEY, member):
+                        platform, target = member.split("|", 1)
+                        task = asyncio.create_task(self.flush(platform, target))
+                        self._in_flight.add(task)
+                        task.add_done_callback(self._in_flight.discard)
+            except Exception as e:
+                logger.error(f"Digest flush loop failed: {e}")
+
+            await asyncio.sleep(self.poll_interval)
+
+    async def flush(self, platform: str, target: str) -> None:
+        """Send up to ``max_items`` buffered jobs of a target as a digest."""
+        redis_client = await get_redis_client()
+        key = _buffer_key(platform, target)
+
+        raw_items = await redis_client.lpop(key, self.max_items) or []
+        remaining = await redis_client.llen(key)
+        if remaining:
+            due = time.time() if remaining >= self.max_items else time.time() + self.window
+            await redis_client.zadd(DIGEST_DUE_KEY, {f"{platform}|{target}": due}, nx=True)
+
+        if not raw_items:
+            return
+
+        try:
+            items = [orjson.loads(raw) for raw in raw_items]
+            for payload in await get_notifier(platform).digest(items):
+                await self.send(platform, target, payload, "digest")
+            logger.debug(f"Flushed digest of {len(items)} jobs to {platform} target")
+        except Exception as e:
+            logger.error(f"Failed to flush digest for {platform}: {e}")
@@ -1,10 +1,16 @@
 """Discord notification functionality."""
 
 from datetime import datetime, timezone
-from typing import Dict
+from typing import Dict, List, Optional
 
 import httpx
+import orjson
 
+from clients import get_http_client
+from core.notifications.base import BaseNotifier, DeliveryResult
+from core.notifications.rate_limit import discord_limiter
+from core.notifications.registry import get_notifier, register_notifier
+from core.notifications.retry import RetryPolicy
 from logging_config import get_notifications_logger
 
 
@@ -90,21 +96,104 @@ async def discord_format(category: str, data: Dict[str, str]) -> dict:
     }
 
 
-async def notify_discord(webhook_url: str, data: dict) -> bool:
+# Discord accepts at most 10 embeds per webhook message
+DISCORD_MAX_EMBEDS = 10
+
+
+def discord_digest_embed(category: str, data: Dict[str, str]) -> dict:
     """
-    Send a notification to a Discord webhook.
+    Format a job as one compact embed for a batched message.
+    """
+    return {
+        "title": data.get("project_title", "Unknown Title")[:256],
+        "url": data.get("project_link", ""),
+        "color": 0x800080,
+        "description": (
+            f"{category} · Budget: {data.get('project_budget', 'N/A')} · "
+            f"Duration: {data.get('project_duration', 'N/A')} · "
+            f"Bids: {data.get('project_number_of_bids', '0')}"
+        ),
+    }
+
+
+def discord_digest_format(embeds: List[dict]) -> List[dict]:
+    """
+    Merge digest embeds into as few webhook messages as possible.
     """
+    return [
+        {
+            "username": "First",
+            "avatar_url": "https://alshabili.site/logo.png",
+            "embeds": embeds[i:i + DISCORD_MAX_EMBEDS],
+        }
+        for i in range(0, len(embeds), DISCORD_MAX_EMBEDS)
+    ]
+
+
+def discord_retry_after(response: httpx.Response) -> Optional[float]:
+    """Read the retry delay of a Discord 429 from its header or body."""
+    header = response.headers.get("Retry-After")
+    if header is not None:
+        try:
+            return float(header)
+        except ValueError:
+            pass
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(webhook_url, json=data, timeout=10)
-            
+        return response.json().get("retry_after")
+    except ValueError:
+        return None
+
+
+async def notify_discord(webhook_url: str, data: dict | bytes) -> DeliveryResult:
+    """
+    Send a notification to a Discord webhook.
+
+    Goes through the registered ``DiscordNotifier``, so it waits for the
+    webhook's rate limit bucket before sending. ``data`` may be a
+    pre-serialized JSON payload, which is sent as is.
+    """
+    return await get_notifier(DiscordNotifier.platform).send(webhook_url, data)
+
+
+@register_notifier
+class DiscordNotifier(BaseNotifier):
+    """Discord webhook notifier, paced by ``discord_limiter``."""
+
+    platform = "discord"
+    # 401/403/404 mean the webhook was deleted or its token revoked
+    permanent_statuses = frozenset({401, 403, 404})
+    limiter = discord_limiter
+
+    def __init__(self):
+        super().__init__(retry_policy=RetryPolicy())
+
+    async def format_message(self, category: str, data: Dict[str, str]) -> dict:
+        return await discord_format(category, data)
+
+    async def deliver(self, target: str, message: dict | bytes) -> DeliveryResult:
+        try:
+            client = get_http_client(target)
+            if isinstance(message, bytes):
+                response = await client.post(
+                    target, content=message, headers={"Content-Type": "application/json"}
+                )
+            else:
+                response = await client.post(target, json=message)
+
             if response.status_code in (200, 204):
                 logger.debug(f"Discord notification sent successfully")
-                return True
-            
+                return DeliveryResult.from_response(response, ok=True)
+
             logger.warning(f"Discord webhook failed: status {response.status_code}")
-            return False
-            
-    except Exception as e:
-        logger.warning(f"Discord notification error: {e}")
-        return False
+            retry_after = discord_retry_after(response) if response.status_code == 429 else None
+            return DeliveryResult.from_response(response, ok=False, retry_after=retry_after)
+
+        except Exception as e:
+            logger.warning(f"Discord notification error: {e}")
+            return DeliveryResult.from_exception(e)
+
+    def digest_item(self, category: str, data: Dict[str, str]) -> dict:
+        return discord_digest_embed(category, data)
+
+    async def digest(self, items: List[dict]) -> List[bytes]:
+        return [orjson.dumps(message) for message in discord_digest_format(items)]
@@ -0,0 +1,123 @@
+"""Quarantine of delivery targets that keep failing permanently.
+
+A deleted Discord webhook (404) or a chat that blocked the bot (Telegram
+403) will never accept a message again. Consecutive permanent failures
+are counted per target in Redis and every successful delivery resets the
+count, whichever consumer made it. Deliveries resent by the retry
+scheduler are settled the same way: a retry that succeeds resets the
+count and one that fails permanently counts towards it. Once
+QUARANTINE_FAILURE_THRESHOLD is reached, every subscription on that
+target is deactivated and stamped with ``quarantined_at``, so the fan-out
+query no longer returns it. Each permanent failure is also appended to a
+capped Redis stream.
+"""
+
+import time
+from datetime import datetime, timezone
+from typing import List
+
+from sqlalchemy import update
+
+from config import settings
+from clients import get_redis_client
+from database import AsyncSessionLocal
+import models
+from core.monitoring import TARGETS_QUARANTINED
+from core.notifications.base import DeliveryResult
+from core.notifications.registry import get_notifier
+from core.subscriptions import subscription_changed
+from logging_config import get_notifications_logger
+
+
+logger = get_notifications_logger()
+
+
+def is_permanent_failure(platform: str, result: DeliveryResult) -> bool:
+    """Whether a failed delivery means the target will never accept messages."""
+    return get_notifier(platform).is_permanent(result)
+
+
+def _failures_key(platform: str, target: str) -> str:
+    return settings.QUARANTINE_FAILURES_KEY.format(platform=platform, target=target)
+
+
+async def record_success(platform: str, targets: List[str]) -> None:
+    """
+    Reset the failure counts of targets that accepted a message.
+
+    The counts are deleted unconditionally, another consumer or a previous
+    run may have counted the failures, in a single DEL for the whole batch.
+    """
+    if not targets:
+        return
+    redis_client = await get_redis_client()
+    await redis_client.delete(*(_failures_key(platform, target) for target in targets))
+
+
+async def record_failure(platform: str, target: str, category: str, result: DeliveryResult) -> bool:
+    """
+    Count a permanent failure and quarantine the target at the threshold.
+
+    Args:
+        platform: The delivery platform.
+        target: The target address.
+        category: The category of the job that failed.
+        result: The failed delivery result.
+
+    Returns:
+        True if the target was quarantined.
+    """
+    redis_client = await get_redis_client()
+    key = _failures_key(platform, target)
+
+    async with redis_client.pipeline(transaction=False) as pipe:
+        pipe.incr(key)
+        pipe.expire(key, settings.QUARANTINE_FAILURE_WINDOW_SECONDS)
+        pipe.xadd(
+            settings.DELIVERY_FAILURE_LOG,
+            {
+                "platform": platform,
+                "target": target,
+                "category": category,
+                "status": result.status_code or 0,
+                "error": result.error or "",
+                "at": int(time.time()),
+            },
+            maxlen=settings.DELIVERY_FAILURE_LOG_MAXLEN,
+            approximate=True,
+        )
+        failures, _, _ = await pipe.execute()
+
+    if failures < settings.QUARANTINE_FAILURE_THRESHOLD:
+        return False
+
+    await redis_client.delete(key)
+    await quarantine_target(platform, target)
+    return True
+
+
+async def quarantine_target(platform: str, target: str) -> int:
+    """
+    Deactivate every active subscription on a target.
+
+    Returns:
+        The number of subscriptions quarantined.
+    """
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(
+            update(models.Subscription)
+            .where(
+                models.Subscription.platform == models.PlatformEnum(platform),
+                models.Subscription.target_address == target,
+                models.Subscription.is_active.is_(True)
+            )
+            .values(is_active=False, quarantined_at=datetime.now(timezone.utc))
+            .returning(models.Subscription.id)
+        )
+        subscription_ids = result.scalars().all()
+        await db.commit()
+
+    await subscription_changed(*subscription_ids)
+    TARGETS_QUARANTINED.labels(platform=platform).inc()
+    logger.warning(f"Quarantined {len(subscription_ids)} {platform} subscriptions after repeated permanent failures")
+    return len(subscription_ids)
@@ -0,0 +1,197 @@
+"""Token bucket rate limiting for outbound notifications.
+
+Sends wait for a token instead of failing, keyed by platform and target:
+
+- Telegram: one global bucket (``TELEGRAM_GLOBAL_RATE`` msg/s) plus one
+  bucket per chat, slower for group chats (negative chat ids).
+- Discord: one global bucket plus one per webhook whose limits are learned
+  from the ``X-RateLimit-*`` headers of every response.
+
+A 429 pauses the affected bucket for the advertised retry delay.
+"""
+
+import asyncio
+import time
+from typing import TYPE_CHECKING, Dict, Mapping, Optional, Tuple
+
+from config import settings
+
+if TYPE_CHECKING:
+    from core.notifications.base import DeliveryResult
+
+
+class TokenBucket:
+    """Async token bucket, waiters are served in arrival order."""
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.base_rate = rate
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+        self.paused_until = 0.0
+        # end of a server advertised window, see reshape()
+        self.reset_at = 0.0
+        self._lock = asyncio.Lock()
+
+    def _refill(self, now: float) -> None:
+        if self.reset_at and now >= self.reset_at:
+            # the server's window is over, its whole limit is available again
+            self.tokens = self.capacity
+            self.rate = self.base_rate
+            self.reset_at = 0.0
+        else:
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    def _wait_time(self, now: float) -> float:
+        wait = (1 - self.tokens) / self.rate if self.rate > 0 else float("inf")
+        if self.reset_at:
+            wait = min(wait, self.reset_at - now)
+        return max(wait, 0.0)
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and take it."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self.paused_until:
+                    await asyncio.sleep(self.paused_until - now)
+                    continue
+
+                self._refill(now)
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep(self._wait_time(now))
+
+    def pause(self, seconds: float) -> None:
+        """Stop handing out tokens for the given number of seconds."""
+        self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+        self.tokens = 0
+
+    def reshape(self, limit: int, remaining: int, reset_after: float) -> None:
+        """
+        Adopt the window advertised by the server: ``remaining`` more
+        requests in the next ``reset_after`` seconds, then ``limit`` again.
+
+        Reset-After is the time left in the window, not its length, so no
+        steady rate is derived from it. What is left of the window is
+        spread over the time until the reset instead.
+        """
+        now = time.monotonic()
+        self._refill(now)
+        if limit > 0:
+            self.capacity = float(limit)
+        if reset_after <= 0:
+            return
+
+        self.reset_at = now + reset_after
+        if remaining <= 0:
+            self.pause(reset_after)
+            return
+        self.tokens = min(self.tokens, float(remaining))
+        self.rate = (remaining - self.tokens) / reset_after
+
+    @property
+    def idle(self) -> bool:
+        """Whether the bucket is full and could be dropped without effect."""
+        self._refill(time.monotonic())
+        return self.tokens >= self.capacity and not self._lock.locked()
+
+
+class KeyedRateLimiter:
+    """A global bucket plus one bucket per target."""
+
+    def __init__(self, global_rate: float, target_rate: float, max_buckets: int = 10_000):
+        self.global_bucket = TokenBucket(global_rate)
+        self.target_rate = target_rate
+        self.max_buckets = max_buckets
+        self._buckets: Dict[str, TokenBucket] = {}
+
+    def _target_rate(self, target: str) -> float:
+        return self.target_rate
+
+    def bucket(self, target: str) -> TokenBucket:
+        """Get or create the bucket of a target."""
+        bucket = self._buckets.get(target)
+        if bucket is None:
+            if len(self._buckets) >= self.max_buckets:
+                self._prune()
+            bucket = self._buckets[target] = TokenBucket(self._target_rate(target))
+        return bucket
+
+    async def acquire(self, target: str) -> None:
+        """Wait for both the target and the global budget."""
+        await self.bucket(target).acquire()
+        await self.global_bucket.acquire()
+
+    def observe(self, target: str, result: "DeliveryResult") -> None:
+        """Pause the target bucket when the platform answered 429."""
+        if result.status_code == 429 and result.retry_after:
+            self.bucket(target).pause(result.retry_after)
+
+    def _prune(self) -> None:
+        for key in [key for key, bucket in self._buckets.items() if bucket.idle]:
+            del self._buckets[key]
+
+
+class TelegramRateLimiter(KeyedRateLimiter):
+    """Telegram's global and per-chat limits."""
+
+    def __init__(self):
+        super().__init__(settings.TELEGRAM_GLOBAL_RATE, settings.TELEGRAM_CHAT_RATE)
+
+    def _target_rate(self, target: str) -> float:
+        # group and channel ids are negative and get a much lower limit
+        if str(target).startswith("-"):
+            return settings.TELEGRAM_GROUP_RATE
+        return self.target_rate
+
+
+class DiscordRateLimiter(KeyedRateLimiter):
+    """Discord's global limit plus per-webhook buckets learned from headers."""
+
+    def __init__(self):
+        super().__init__(settings.DISCORD_GLOBAL_RATE, settings.DISCORD_WEBHOOK_RATE)
+
+    def observe(self, target: str, result: "DeliveryResult") -> None:
+        """Update the webhook bucket from the response rate limit headers."""
+        headers = result.headers
+        limit, remaining, reset_after = parse_discord_headers(headers)
+
+        if result.status_code == 429:
+            retry_after = reset_after or _to_float(headers.get("Retry-After")) or 1.0
+            if headers.get("X-RateLimit-Global", "").lower() == "true":
+                self.global_bucket.pause(retry_after)
+            else:
+                self.bucket(target).pause(retry_after)
+            return
+
+        if remaining is not None and reset_after is not None:
+            self.bucket(target).reshape(limit or 0, remaining, reset_after)
+
+
+def _to_float(value: Optional[str]) -> Optional[float]:
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+def parse_discord_headers(
+    headers: Mapping[str, str]
+) -> Tuple[Optional[int], Optional[int], Optional[float]]:
+    """Extract (limit, remaining, reset_after) from Discord rate limit headers."""
+    limit = _to_float(headers.get("X-RateLimit-Limit"))
+    remaining = _to_float(headers.get("X-RateLimit-Remaining"))
+    reset_after = _to_float(headers.get("X-RateLimit-Reset-After"))
+    return (
+        int(limit) if limit is not None else None,
+        int(remaining) if remaining is not None else None,
+        reset_after,
+    )
+
+
+telegram_limiter = TelegramRateLimiter()
+discord_limiter = DiscordRateLimiter()
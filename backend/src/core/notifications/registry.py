@@ -0,0 +1,36 @@
+"""Registry of notifier plugins, keyed by platform name.
+
+Platforms register an instance of their ``BaseNotifier`` with
+``register_notifier``; the consumer, retry scheduler, render cache and
+digest batcher look plugins up here instead of branching on platform.
+Adding a channel means adding a module that registers itself and
+importing it from ``core.notifications``.
+"""
+
+from typing import Dict, Type, TypeVar
+
+from core.notifications.base import BaseNotifier
+
+
+N = TypeVar("N", bound=Type[BaseNotifier])
+
+_notifiers: Dict[str, BaseNotifier] = {}
+
+
+def register_notifier(cls: N) -> N:
+    """Class decorator registering a default instance of a notifier."""
+    _notifiers[cls.platform] = cls()
+    return cls
+
+
+def get_notifier(platform: str) -> BaseNotifier:
+    """Return the notifier of a platform, raising ValueError if unknown."""
+    notifier = _notifiers.get(platform)
+    if notifier is None:
+        raise ValueError(f"Unknown platform: {platform}")
+    return notifier
+
+
+def get_notifiers() -> Dict[str, BaseNotifier]:
+    """Return every registered notifier by platform."""
+    return dict(_notifiers)
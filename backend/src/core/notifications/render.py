@@ -0,0 +1,76 @@
+"""Render each job's notification once per platform.
+
+The message only depends on ``(category, data)``, so a job is formatted and
+serialized to JSON once per platform and the same bytes are sent to every
+target. Renders are also shared through Redis so several consumer replicas
+(and the per-tier copies of a job) don't redo the work.
+"""
+
+from typing import Dict, Optional
+
+
+from config import settings
+from clients import get_redis_client
+from core.notifications.registry import get_notifier
+from logging_config import get_notifications_logger
+
+
+logger = get_notifications_logger()
+
+# bump whenever a formatter changes so stale renders are not reused
+TEMPLATE_VERSION = 1
+
+
+async def render_payload(platform: str, category: str, data: Dict[str, str]) -> bytes:
+    """Format and serialize a job's message for a platform."""
+    return await get_notifier(platform).render(category, data)
+
+
+class RenderCache:
+    """Per-job cache of pre-serialized payloads, backed by Redis."""
+
+    def __init__(self, category: str, data: Dict[str, str], use_redis: bool = settings.RENDER_CACHE_REDIS):
+        self.category = category
+        self.data = data
+        self.use_redis = use_redis
+        self._payloads: Dict[str, bytes] = {}
+
+    def _key(self, platform: str) -> Optional[str]:
+        project_id = self.data.get("project_id")
+        if not project_id:
+            return None
+        return f"render:{project_id}:{platform}:v{TEMPLATE_VERSION}"
+
+    async def get(self, platform: str) -> bytes:
+        """Return the payload for a platform, rendering it at most once."""
+        payload = self._payloads.get(platform)
+        if payload is not None:
+            return payload
+
+        key = self._key(platform) if self.use_redis else None
+        if key is not None:
+            payload = await self._load(key)
+
+        if payload is None:
+            payload = await render_payload(platform, self.category, self.data)
+            if key is not None:
+                await self._store(key, payload)
+
+        self._payloads[platform] = payload
+        return payload
+
+    async def _load(self, key: str) -> Optional[bytes]:
+        try:
+            redis_client = await get_redis_client()
+            cached = await redis_client.get(key)
+            return cached.encode() if cached is not None else None
+        except Exception as e:
+            logger.warning(f"Render cache read failed: {e}")
+            return None
+
+    async def _store(self, key: str, payload: bytes) -> None:
+        try:
+            redis_client = await get_redis_client()
+            await redis_client.set(key, payload, ex=settings.RENDER_CACHE_TTL_SECONDS, nx=True)
+        except Exception as e:
+            logger.warning(f"Render cache write failed: {e}")
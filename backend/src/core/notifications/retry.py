@@ -0,0 +1,198 @@
+"""Delivery retry policy and durable retry scheduling.
+
+Failed deliveries are classified by their ``DeliveryResult``:
+
+- 429 responses wait for the platform's ``Retry-After`` / ``retry_after``.
+- 5xx responses and transport errors (timeouts, resets) back off
+  exponentially with full jitter.
+- Any other 4xx is permanent and never retried.
+
+Retries are parked in a Redis sorted set scored by their due time, so a
+waiting retry never blocks other deliveries and survives a restart. A pump
+task moves due retries back into flight.
+"""
+
+import asyncio
+import random
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Optional, Set
+
+import orjson
+
+from config import settings
+from clients import get_redis_client
+from core.monitoring import DELIVERY_RETRIES, observe_delivery
+from core.notifications.base import DeliveryResult
+from core.notifications.quarantine import is_permanent_failure, record_failure, record_success
+from core.notifications.registry import get_notifier
+from logging_config import get_notifications_logger
+
+
+logger = get_notifications_logger()
+
+@dataclass
+class RetryItem:
+    """A delivery waiting for its next attempt."""
+
+    platform: str
+    target: str
+    message: Any
+    category: str
+    # number of attempts already made
+    attempt: int = 1
+    trace_id: Optional[str] = None
+    detected_at: Optional[float] = None
+
+    def encode(self) -> bytes:
+        fields = asdict(self)
+        # pre-serialized payloads are UTF-8 JSON, store them as text
+        if isinstance(self.message, bytes):
+            fields["message"] = self.message.decode()
+            fields["message_is_bytes"] = True
+        return orjson.dumps(fields)
+
+    @classmethod
+    def decode(cls, raw: str | bytes) -> "RetryItem":
+        fields = orjson.loads(raw)
+        if fields.pop("message_is_bytes", False):
+            fields["message"] = fields["message"].encode()
+        return cls(**fields)
+
+
+class RetryPolicy:
+    """Decide whether and when a failed delivery is retried."""
+
+    def __init__(
+        self,
+        max_attempts: int = settings.DELIVERY_MAX_ATTEMPTS,
+        base_delay: float = settings.DELIVERY_RETRY_BASE_DELAY,
+        max_delay: float = settings.DELIVERY_RETRY_MAX_DELAY
+    ):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    def next_delay(self, result: DeliveryResult, attempt: int) -> Optional[float]:
+        """
+        Seconds until the next attempt, or None if the delivery is final.
+
+        Args:
+            result: The result of the last attempt.
+            attempt: Number of attempts made so far.
+        """
+        if result.ok or not result.retryable or attempt >= self.max_attempts:
+            return None
+
+        if result.retry_after:
+            return float(result.retry_after)
+
+        # full jitter keeps retries of a burst from arriving together
+        ceiling = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        return random.uniform(0, ceiling)
+
+
+class RetryScheduler:
+    """
+    Park failed deliveries in Redis and resend them once they are due.
+
+    Retries go through the platform's registered notifier and follow its
+    own retry policy, ``policy`` covers notifiers without one.
+    """
+
+    def __init__(
+        self,
+        policy: Optional[RetryPolicy] = None,
+        key: str = settings.DELIVERY_RETRY_QUEUE,
+        poll_interval: float = 0.5,
+        batch_size: int = 100
+    ):
+        self.policy = policy or RetryPolicy()
+        self.key = key
+        self.poll_interval = poll_interval
+        self.batch_size = batch_size
+        self._in_flight: Set[asyncio.Task] = set()
+
+    async def schedule(self, item: RetryItem, result: DeliveryResult) -> bool:
+        """
+        Park a failed delivery if the policy allows another attempt.
+
+        Returns:
+            True if a retry was scheduled, False if the delivery is final.
+        """
+        delay = self._policy(item.platform).next_delay(result, item.attempt)
+        if delay is None:
+            outcome = "gave_up" if result.retryable else "permanent"
+            DELIVERY_RETRIES.labels(platform=item.platform, outcome=outcome).inc()
+            logger.warning(
+                f"Giving up on {item.platform} delivery to {item.target} after "
+                f"{item.attempt} attempts (status {result.status_code}, {result.error})"
+            )
+            return False
+
+        redis_client = await get_redis_client()
+        await redis_client.zadd(self.key, {item.encode(): time.time() + delay})
+        DELIVERY_RETRIES.labels(platform=item.platform, outcome="scheduled").inc()
+        logger.debug(f"Retrying {item.platform} delivery to {item.target} in {delay:.1f}s")
+        return True
+
+    def _policy(self, platform: str) -> RetryPolicy:
+        try:
+            return get_notifier(platform).retry_policy or self.policy
+        except ValueError:
+            return self.policy
+
+    async def run(self) -> None:
+        """Resend due retries until cancelled."""
+        redis_client = await get_redis_client()
+
+        while True:
+            due = []
+            try:
+                due = await redis_client.zrangebyscore(
+                    self.key, "-inf", time.time(), start=0, num=self.batch_size
+                )
+                for raw in due:
+                    # claiming by ZREM keeps several consumers from sending twice
+                    if await redis_client.zrem(self.key, raw):
+                        task = asyncio.create_task(self._retry(raw))
+                        self._in_flight.add(task)
+                        task.add_done_callback(self._in_flight.discard)
+            except Exception as e:
+                logger.error(f"Retry pump failed: {e}")
+
+            if len(due) < self.batch_size:
+                await asyncio.sleep(self.poll_interval)
+
+    async def _retry(self, raw: str) -> None:
+        try:
+            item = RetryItem.decode(raw)
+        except (ValueError, TypeError) as e:
+            logger.error(f"Dropping malformed retry item: {e}")
+            return
+
+        try:
+            notifier = get_notifier(item.platform)
+        except ValueError as e:
+            logger.error(f"Dropping retry item: {e}")
+            return
+
+        # settled like a first attempt, so retried targets reach the quarantine too
+        result = await notifier.send(item.target, item.message)
+        if result:
+            await record_success(item.platform, [item.target])
+            DELIVERY_RETRIES.labels(platform=item.platform, outcome="succeeded").inc()
+            observe_delivery("detect_to_delivery", item.category, item.platform, item.detected_at, time.time())
+            return
+
+        if is_permanent_failure(item.platform, result):
+            DELIVERY_RETRIES.labels(platform=item.platform, outcome="permanent").inc()
+            logger.warning(
+                f"Giving up on {item.platform} delivery to {item.target} after "
+                f"{item.attempt + 1} attempts (status {result.status_code}, {result.error})"
+            )
+            await record_failure(item.platform, item.target, item.category, result)
+            return
+
+        item.attempt += 1
+        await self.schedule(item, result)
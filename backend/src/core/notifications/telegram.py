@@ -1,14 +1,20 @@
-from typing import Dict
+from typing import Dict, List, Optional
 
 import httpx
+import orjson
 
 from config import settings
+from clients import get_http_client
+from core.notifications.base import BaseNotifier, DeliveryResult
+from core.notifications.rate_limit import telegram_limiter
+from core.notifications.registry import get_notifier, register_notifier
+from core.notifications.retry import RetryPolicy
 from logging_config import get_notifications_logger
 
 
 logger = get_notifications_logger()
 
-TELEGRAM_API_URL = "https://api.telegram.org/bot{token}/sendMessage"
+TELEGRAM_API_URL = "{base}/bot{token}/sendMessage"
 
 
 async def telegram_format(category: str, data: Dict[str, str]) -> str:
@@ -37,43 +43,145 @@ _Powered by First_
     return message.strip()
 
 
-async def notify_telegram(chat_id: str, message: str) -> bool:
+# Telegram rejects messages longer than 4096 characters
+TELEGRAM_MAX_MESSAGE_LENGTH = 4096
+
+
+def telegram_digest_line(category: str, data: Dict[str, str]) -> str:
+    """
+    Format a job as a short entry of a digest message.
+    """
+    return (
+        f"*{data.get('project_title', 'Unknown Title')}*\n"
+        f"{category} | {data.get('project_budget', 'N/A')} | "
+        f"{data.get('project_duration', 'N/A')} | Bids: {data.get('project_number_of_bids', '0')}\n"
+        f"[View Project]({data.get('project_link', '')})"
+    )
+
+
+def telegram_digest_format(lines: List[str]) -> List[str]:
+    """
+    Join digest entries into as few messages as fit Telegram's length limit.
+    """
+    header = f" *{len(lines)} New Jobs*\n\n"
+    messages: List[str] = []
+    current = header
+
+    for line in lines:
+        entry = line[:TELEGRAM_MAX_MESSAGE_LENGTH - len(header) - 2] + "\n\n"
+        if len(current) + len(entry) > TELEGRAM_MAX_MESSAGE_LENGTH and current != header:
+            messages.append(current.strip())
+            current = header
+        current += entry
+
+    if current != header:
+        messages.append(current.strip())
+    return messages
+
+
+def telegram_body(message: str) -> bytes:
+    """
+    Serialize a sendMessage body without its chat_id.
+
+    The same bytes are reused for every chat, see ``with_chat_id``.
+    """
+    return orjson.dumps({
+        "text": message,
+        "parse_mode": "Markdown",
+        "disable_web_page_preview": True
+    })
+
+
+def with_chat_id(chat_id: str, body: bytes) -> bytes:
+    """Splice a chat_id into a pre-serialized sendMessage body."""
+    return b'{"chat_id":' + orjson.dumps(chat_id) + b"," + body[1:]
+
+
+def telegram_retry_after(response: httpx.Response) -> Optional[float]:
+    """Read ``parameters.retry_after`` from a Telegram error response."""
+    try:
+        return response.json().get("parameters", {}).get("retry_after")
+    except ValueError:
+        return None
+
+
+async def notify_telegram(chat_id: str, message: str | bytes) -> DeliveryResult:
     """
     Send a notification to a Telegram chat.
+
+    Goes through the registered ``TelegramNotifier``, so it waits for both
+    the chat and the global rate limit bucket before sending.
     
     Args:
         chat_id: The Telegram chat ID.
-        message: The formatted message to send.
+        message: The formatted message, or a body from ``telegram_body``.
         
     Returns:
-        True if successful, False otherwise.
+        The delivery result, truthy if successful.
     """
-    if not settings.TELEGRAM_TOKEN:
-        logger.warning("Telegram token not configured")
-        return False
-    
-    url = TELEGRAM_API_URL.format(token=settings.TELEGRAM_TOKEN)
-    
-    try:
-        async with httpx.AsyncClient() as client:
+    return await get_notifier(TelegramNotifier.platform).send(chat_id, message)
+
+
+# Telegram reports some dead chats as 400 with a description
+TELEGRAM_PERMANENT_ERRORS = ("chat not found", "user is deactivated", "bot was kicked")
+
+
+@register_notifier
+class TelegramNotifier(BaseNotifier):
+    """Telegram Bot API notifier, paced by ``telegram_limiter``."""
+
+    platform = "telegram"
+    # 403 means the bot was blocked or removed from the chat
+    permanent_statuses = frozenset({403})
+    limiter = telegram_limiter
+
+    def __init__(self):
+        super().__init__(retry_policy=RetryPolicy())
+
+    async def format_message(self, category: str, data: Dict[str, str]) -> str:
+        return await telegram_format(category, data)
+
+    def serialize(self, message: str) -> bytes:
+        return telegram_body(message)
+
+    async def deliver(self, target: str, message: str | bytes) -> DeliveryResult:
+        if not settings.TELEGRAM_TOKEN:
+            logger.warning("Telegram token not configured")
+            return DeliveryResult(ok=False, error="Telegram token not configured")
+
+        url = TELEGRAM_API_URL.format(base=settings.TELEGRAM_API_BASE, token=settings.TELEGRAM_TOKEN)
+
+        try:
+            client = get_http_client(url)
+            body = message if isinstance(message, bytes) else telegram_body(message)
             response = await client.post(
                 url,
-                json={
-                    "chat_id": chat_id,
-                    "text": message,
-                    "parse_mode": "Markdown",
-                    "disable_web_page_preview": True
-                },
-                timeout=10
+                content=with_chat_id(target, body),
+                headers={"Content-Type": "application/json"}
             )
-            
+
             if response.status_code == 200:
-                logger.debug(f"Telegram notification sent to {chat_id}")
-                return True
-            
+                logger.debug(f"Telegram notification sent to {target}")
+                return DeliveryResult.from_response(response, ok=True)
+
+            retry_after = telegram_retry_after(response) if response.status_code == 429 else None
             logger.warning(f"Telegram API error: {response.status_code} - {response.text}")
-            return False
-            
-    except Exception as e:
-        logger.warning(f"Telegram notification error: {e}")
+            return DeliveryResult.from_response(response, ok=False, retry_after=retry_after)
+
+        except Exception as e:
+            logger.warning(f"Telegram notification error: {e}")
+            return DeliveryResult.from_exception(e)
+
+    def is_permanent(self, result: DeliveryResult) -> bool:
+        if super().is_permanent(result):
+            return True
+        if result.status_code == 400 and result.error:
+            error = result.error.lower()
+            return any(reason in error for reason in TELEGRAM_PERMANENT_ERRORS)
         return False
+
+    def digest_item(self, category: str, data: Dict[str, str]) -> str:
+        return telegram_digest_line(category, data)
+
+    async def digest(self, items: List[str]) -> List[bytes]:
+        return [telegram_body(message) for message in telegram_digest_format(items)]
@@ -1,10 +1,28 @@
 # Processing module
 from .comparator import compare_and_process
-from .normalizer import normalize_data, parse_arabic_date, clean_duration
+from .normalizer import (
+    normalize_data,
+    parse_arabic_date,
+    clean_duration,
+    parse_budget,
+    parse_rate,
+    parse_registration_date,
+    to_ascii_digits,
+    normalize_arabic,
+    typed_values,
+    TYPED_FIELDS,
+)
 
 __all__ = [
     "compare_and_process",
     "normalize_data",
     "parse_arabic_date",
     "clean_duration",
+    "parse_budget",
+    "parse_rate",
+    "parse_registration_date",
+    "to_ascii_digits",
+    "normalize_arabic",
+    "typed_values",
+    "TYPED_FIELDS",
 ]
@@ -1,5 +1,6 @@
 """Job comparison and deduplication logic."""
 
+import time
 from typing import Dict, List, Tuple
 
 from clients import get_redis_client
@@ -16,6 +17,8 @@ async def compare_and_process(newest_jobs: Dict[str, Dict[str, str]]) -> None:
 
     # category -> [(job_id, job_link), ...]
     jobs_to_scrape: Dict[str, List[Tuple[str, str]]] = {}
+    # job_id -> unix time the job was first seen, start of the latency pipeline
+    detected_at: Dict[str, float] = {}
 
     for category, jobs_dict in newest_jobs.items():
         incoming_ids = list(jobs_dict.keys())
@@ -26,9 +29,11 @@ async def compare_and_process(newest_jobs: Dict[str, Dict[str, str]]) -> None:
         are_members = await redis_client.smismember(f"ids:{category}", incoming_ids)
 
         new_ids = []
+        seen_at = time.time()
         for job_id, is_seen in zip(incoming_ids, are_members):
             if not is_seen:
                 new_ids.append(job_id)
+                detected_at[job_id] = seen_at
                 
                 # Add to local processing list
                 if category not in jobs_to_scrape:
@@ -43,4 +48,4 @@ async def compare_and_process(newest_jobs: Dict[str, Dict[str, str]]) -> None:
     if jobs_to_scrape:
         # Import here to avoid circular dependency
         from core.scraping.job_scraper import scrape_data
-        await scrape_data(jobs_to_scrape)
+        await scrape_data(jobs_to_scrape, detected_at)
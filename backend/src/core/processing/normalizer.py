@@ -1,8 +1,13 @@
-"""Data normalization utilities for scraped job data."""
+"""Data normalization utilities for scraped job data.
+
+Parsers run once per scraped job on the scraper's hot path, so they use
+precompiled patterns and translate Arabic-Indic digits and separators
+(e.g. "٢٥٫٠٠", "٨٥٪") to ASCII with a single ``str.translate`` first.
+"""
 
 import re
-from typing import Dict, List, Optional
-from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+from datetime import datetime, timezone
 
 
 # Arabic month name mappings
@@ -12,31 +17,124 @@ ARABIC_MONTHS: Dict[str, str] = {
     "سبتمبر": "09", "أكتوبر": "10", "نوفمبر": "11", "ديسمبر": "12"
 }
 
+# Month numbers by name, including spellings without hamza
+_MONTH_NUMBERS: Dict[str, int] = {
+    **{name: int(number) for name, number in ARABIC_MONTHS.items()},
+    "ابريل": 4, "إبريل": 4, "اغسطس": 8, "اكتوبر": 10,
+}
+
+# Arabic-Indic and Eastern Arabic-Indic digits, Arabic decimal and
+# thousands separators and percent sign, mapped to their ASCII forms
+ARABIC_DIGITS = str.maketrans({
+    **{chr(0x0660 + i): str(i) for i in range(10)},
+    **{chr(0x06F0 + i): str(i) for i in range(10)},
+    "\u066b": ".",
+    "\u066c": ",",
+    "\u066a": "%",
+})
+
+# Folds Arabic spelling variants for keyword matching and search: alef
+# forms, alef maqsura, taa marbuta, hamza carriers, tatweel and diacritics.
+# The first_normalize_arabic SQL function behind job search does the same,
+# a change here needs a migration redefining it.
+ARABIC_FOLD = str.maketrans({
+    **{chr(code): None for code in range(0x064B, 0x0660)},
+    "\u0670": None,
+    "\u0640": None,
+    "أ": "ا", "إ": "ا", "آ": "ا", "ٱ": "ا",
+    "ى": "ي", "ة": "ه", "ؤ": "و", "ئ": "ي",
+})
+
+_INT_RE = re.compile(r"\d+")
+_AMOUNT_RE = re.compile(r"\d[\d,]*(?:\.\d+)?")
+_RATE_RE = re.compile(r"(\d+(?:\.\d+)?)\s*%")
+_ARABIC_DATE_RE = re.compile(r"(\d{1,2})\s+(\S+)\s+(\d{4})")
+
+# Currency symbols seen in budgets, mapped to ISO 4217 codes
+CURRENCY_SYMBOLS: Dict[str, str] = {
+    "$": "USD",
+    "€": "EUR",
+    "£": "GBP",
+}
+
+# Typed values derived from the scraped strings, stored in their own columns
+TYPED_FIELDS: Tuple[str, ...] = (
+    "project_budget_min",
+    "project_budget_max",
+    "project_budget_currency",
+    "project_duration_days",
+    "project_bids_count",
+    "project_owner_employment_pct",
+    "project_owner_registered_at",
+)
+
+
+def to_ascii_digits(value: str) -> str:
+    """
+    Replace Arabic-Indic digits and separators with their ASCII forms.
+    """
+    return value.translate(ARABIC_DIGITS)
+
+
+def normalize_arabic(text: str) -> str:
+    """
+    Normalize text for matching: fold Arabic spelling variants, drop
+    diacritics, use ASCII digits and ignore case.
+    
+    Args:
+        text: Text in Arabic, English or both.
+        
+    Returns:
+        The normalized text.
+    """
+    return to_ascii_digits(text).translate(ARABIC_FOLD).casefold()
+
 
 def parse_arabic_date(date_str: Optional[str]) -> Optional[datetime]:
     """
     Parse an Arabic date string to a datetime object.
     
     Args:
-        date_str: Date string in Arabic format (e.g., "15 يناير 2024").
+        date_str: Date string in Arabic format (e.g., "15 يناير 2024"),
+            with ASCII or Arabic-Indic digits.
         
     Returns:
         Parsed datetime object, or None if parsing fails.
     """
     if not isinstance(date_str, str):
         return None
-        
-    for arabic_month, month_num in ARABIC_MONTHS.items():
-        if arabic_month in date_str:
-            date_str = date_str.replace(arabic_month, month_num)
-            break
-    
+
+    match = _ARABIC_DATE_RE.search(to_ascii_digits(date_str))
+    if not match:
+        return None
+
+    day, month_name, year = match.groups()
+    month = _MONTH_NUMBERS.get(month_name)
+    if month is None:
+        month = int(month_name) if month_name.isdigit() else None
+    if month is None:
+        return None
+
     try:
-        return datetime.strptime(date_str, "%d %m %Y")
+        return datetime(int(year), month, int(day))
     except ValueError:
         return None
 
 
+def parse_registration_date(date_str: Optional[str]) -> Optional[datetime]:
+    """
+    Parse an owner's Arabic registration date as a UTC timestamp.
+    
+    Args:
+        date_str: Registration date (e.g., "15 يناير 2023").
+        
+    Returns:
+        Parsed timestamp, or None if parsing fails.
+    """
+    parsed = parse_arabic_date(date_str)
+    return parsed.replace(tzinfo=timezone.utc) if parsed else None
+
+
 def clean_duration(duration_str: Optional[str]) -> str:
     """
     Extract and format duration from Arabic duration string.
@@ -50,7 +148,7 @@ def clean_duration(duration_str: Optional[str]) -> str:
     if not isinstance(duration_str, str):
         return "0 Days"
         
-    match = re.search(r"\d+", duration_str)
+    match = _INT_RE.search(to_ascii_digits(duration_str))
     days = int(match.group()) if match else 0
 
     if days == 1:
@@ -58,13 +156,116 @@ def clean_duration(duration_str: Optional[str]) -> str:
     return f"{days} Days"
 
 
+def parse_number(value: str) -> Optional[float]:
+    """
+    Parse a number that may use thousands separators (e.g., "1,500.00").
+    """
+    try:
+        return float(value.replace(",", ""))
+    except ValueError:
+        return None
+
+
+def parse_budget(budget_str: Optional[str]) -> Tuple[Optional[float], Optional[float], Optional[str]]:
+    """
+    Parse a budget range into its bounds and currency.
+    
+    Args:
+        budget_str: Budget string (e.g., "$250.00 - $500.00").
+        
+    Returns:
+        Tuple of (minimum, maximum, ISO currency code), each None if unknown.
+        A single amount is both the minimum and the maximum.
+    """
+    if not isinstance(budget_str, str):
+        return None, None, None
+
+    currency = next(
+        (code for symbol, code in CURRENCY_SYMBOLS.items() if symbol in budget_str), None
+    )
+    amounts = [
+        amount for amount in map(parse_number, _AMOUNT_RE.findall(to_ascii_digits(budget_str)))
+        if amount is not None
+    ]
+    if not amounts:
+        return None, None, currency
+    return min(amounts), max(amounts), currency
+
+
+def parse_int(value: Optional[str]) -> Optional[int]:
+    """
+    Extract the first integer from a string (e.g., "14 Days" -> 14).
+    """
+    if isinstance(value, int):
+        return value
+    if not isinstance(value, str):
+        return None
+    match = _INT_RE.search(to_ascii_digits(value))
+    return int(match.group()) if match else None
+
+
+def parse_rate(rate_str: Optional[str]) -> Optional[float]:
+    """
+    Parse a percentage (e.g., "85.71%") into a number.
+    
+    Returns:
+        The percentage, or None if the rate is not known yet.
+    """
+    if not isinstance(rate_str, str):
+        return None
+    match = _RATE_RE.search(to_ascii_digits(rate_str))
+    return float(match.group(1)) if match else None
+
+
+def parse_published_at(published_str: Optional[str]) -> Optional[datetime]:
+    """
+    Parse a normalized (ISO) publication date as a UTC timestamp.
+    """
+    if not isinstance(published_str, str):
+        return None
+    try:
+        parsed = datetime.fromisoformat(published_str)
+    except ValueError:
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def typed_values(project: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Derive the typed values of a job from its scraped strings.
+    
+    Args:
+        project: The job dictionary, with normalized duration.
+        
+    Returns:
+        Dictionary with the keys of ``TYPED_FIELDS``.
+    """
+    budget_min, budget_max, currency = parse_budget(project.get("project_budget"))
+    return {
+        "project_budget_min": budget_min,
+        "project_budget_max": budget_max,
+        "project_budget_currency": currency,
+        "project_duration_days": parse_int(project.get("project_duration")),
+        "project_bids_count": parse_int(project.get("project_number_of_bids")),
+        "project_owner_employment_pct": parse_rate(project.get("project_owner_employment_rate")),
+        "project_owner_registered_at": _isoformat(
+            parse_registration_date(project.get("project_owner_registration_date"))
+        ),
+    }
+
+
+def _isoformat(value: Optional[datetime]) -> Optional[str]:
+    return value.isoformat() if value else None
+
+
 async def normalize_data(
     data: Dict[str, List[Dict[str, str]]]
 ) -> Dict[str, List[Dict[str, str]]]:
     """
     Normalize scraped job data.
     
-    Processes dates and durations into standardized formats.
+    Processes dates and durations into standardized formats and adds the
+    typed values of ``TYPED_FIELDS``.
     
     Args:
         data: Dictionary mapping categories to lists of job dictionaries.
@@ -86,6 +287,9 @@ async def normalize_data(
             
             # Normalize duration
             project["project_duration"] = clean_duration(project.get("project_duration"))
+
+            # Typed budget, duration, bids, employment rate and registration date
+            project.update(typed_values(project))
             
             payload[category].append(project)
 
@@ -1,64 +1,140 @@
 """Job queue consumer for processing notifications."""
 
 import asyncio
-import json
-from typing import Dict
-
-from sqlalchemy import select
-from sqlalchemy.dialects.postgresql import insert
+import time
+from typing import Any, Dict, List, Optional
 
 from config import settings
-from database import AsyncSessionLocal
 import models
-from clients import get_redis_client
-from core.notifications.discord import discord_format, notify_discord
-from core.notifications.telegram import telegram_format, notify_telegram
+from clients import get_redis_client, close_http_clients
+from core.queue.envelope import JobEnvelope, decode_job
+from core.queue.priority import Tier, TierQueue, WeightedDequeuer, build_tier_queues
+from core.queue.supervisor import ConsumerSupervisor
+from core.queue.fanout import DeliveryOutcome, FanOut, coalesce_targets
+from core.queue.job_writer import JobWriteBuffer
+from core.monitoring import (
+    BACKPRESSURE_DECISIONS,
+    DELIVERIES,
+    FANOUT_COALESCED,
+    FANOUT_DURATION,
+    QUEUE_DEPTH,
+    observe_stage,
+    observe_delivery,
+    start_metrics_server,
+)
+from core.notifications.base import DeliveryResult
+from core.notifications.batching import DigestBatcher
+from core.notifications.quarantine import is_permanent_failure, record_failure, record_success
+from core.notifications.registry import get_notifier, get_notifiers
+from core.notifications.render import RenderCache
+from core.notifications.retry import RetryItem, RetryScheduler
+from core.subscriptions import SubscriberIndex
 from logging_config import get_consumer_logger
 
 
 logger = get_consumer_logger()
 
+retry_scheduler = RetryScheduler()
+subscriber_index = SubscriberIndex()
+job_writer = JobWriteBuffer()
+digest_batcher = DigestBatcher(
+    lambda platform, target, payload, category: _deliver(platform, target, payload, category, None, None)
+)
+
 
 async def start_consuming() -> None:
     """
     starting the main queue consumer loop
+
+    the supervisor runs dedicated workers per category shard, each taking
+    jobs from its tier queues by weighted fair dequeueing, so premium
+    fan-out drains first without starving the normal tier
     """
     redis_client = await get_redis_client()
+    start_metrics_server()
+    await subscriber_index.load()
+    asyncio.create_task(subscriber_index.listen())
+    asyncio.create_task(subscriber_index.resync())
+    asyncio.create_task(job_writer.run())
+    asyncio.create_task(_report_queue_depth())
+    asyncio.create_task(retry_scheduler.run())
+    asyncio.create_task(digest_batcher.run())
     logger.info("Consumer started - listening for jobs...")
 
-    while True:
-        job_raw = None
+    supervisor = ConsumerSupervisor(redis_client, consume_shard)
+    try:
+        await supervisor.run()
+    finally:
+        # buffered jobs are only written every few seconds, don't lose them
+        await job_writer.close()
+        # pooled notification connections live as long as the consumer
+        await close_http_clients()
+
+
+async def consume_shard(queues: List[TierQueue], stop: asyncio.Event) -> None:
+    """
+    consume jobs from one shard's tier queues until asked to stop
+    """
+    redis_client = await get_redis_client()
+    dequeuer = WeightedDequeuer(redis_client, queues)
+
+    while not stop.is_set():
         try:
-            # move job from main queue to processing queue
-            job_raw = await redis_client.blmove(
-                settings.QUEUE_MAIN, 
-                settings.QUEUE_PROCESSING, 
-                30,
-                "RIGHT", 
-                "LEFT"
-            )
+            # move job from a tier queue to its processing queue
+            entry = await dequeuer.next()
             
-            if job_raw is None:
+            if entry is None:
                 continue
+            source, job_raw = entry
+            dequeued_at = time.time()
+
+            # accepts both envelopes and legacy [category, job] entries
+            try:
+                envelope = decode_job(job_raw)
+            except ValueError as e:
+                logger.error(f"Failed to decode job: {e}")
+                # Remove malformed job from processing queue
+                await redis_client.lrem(source.processing, 1, job_raw)
+                continue
+
+            category = envelope.category
+            data = envelope.data
+
+            tier_label = source.tier.value if source.tier else "all"
 
-            job = json.loads(job_raw)
-            category = job[0]
-            data = job[1]
+            # every tier gets its own copy, count the shared stages once
+            if source.tier != Tier.NORMAL:
+                observe_stage("detect_to_scrape", category, envelope.detected_at, envelope.scraped_at)
+                observe_stage("scrape_to_enqueue", category, envelope.scraped_at, envelope.enqueued_at)
+            observe_stage("enqueue_to_dequeue", category, envelope.enqueued_at, dequeued_at, tier_label)
             
-            logger.info(f"Processing job: {data.get('project_id', 'unknown')} in {category}")
+            logger.info(
+                f"Processing job: {envelope.project_id} in {category} [{tier_label}] "
+                f"(trace {envelope.trace_id}, attempt {envelope.attempt})"
+            )
             
-            await notifier(category, data)
+            stale = _is_stale(envelope, dequeued_at)
+            if stale and settings.QUEUE_STALE_JOB_POLICY == "digest":
+                # stale jobs still reach subscribers, but folded into digests
+                BACKPRESSURE_DECISIONS.labels(component="consumer", decision="digest_stale").inc()
+                await notifier(category, data, envelope, dequeued_at, source.tier, digest_only=True)
+            elif stale:
+                # shed delivery of stale jobs, they are still persisted
+                BACKPRESSURE_DECISIONS.labels(component="consumer", decision="drop_stale").inc()
+                logger.warning(
+                    f"Dropping delivery of stale job {envelope.project_id} "
+                    f"({_job_age(envelope, dequeued_at):.0f}s old)"
+                )
+                if source.tier != Tier.NORMAL:
+                    job_writer.add(category, data)
+            else:
+                BACKPRESSURE_DECISIONS.labels(component="consumer", decision="deliver").inc()
+                await notifier(category, data, envelope, dequeued_at, source.tier)
             
             # Only remove from processing queue AFTER successful processing
-            await redis_client.lrem(settings.QUEUE_PROCESSING, 1, job_raw)
-            logger.info(f"Job {data.get('project_id', 'unknown')} completed")
-
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to decode job JSON: {e}")
-            # Remove malformed job from processing queue
-            if job_raw:
-                await redis_client.lrem(settings.QUEUE_PROCESSING, 1, job_raw)
-                
+            await redis_client.lrem(source.processing, 1, job_raw)
+            logger.info(f"Job {envelope.project_id} completed")
+
         except Exception as e:
             # CRITICAL: Consumer crash - notify via Discord
             logger.critical(f"Consumer crashed: {e}")
@@ -66,55 +142,221 @@ async def start_consuming() -> None:
             await asyncio.sleep(5) 
 
 
-async def notifier(category: str, data: Dict[str, str]) -> None:
+async def _report_queue_depth() -> None:
+    """Periodically sample queue lengths into the queue depth gauge."""
+    redis_client = await get_redis_client()
+
+    while True:
+        try:
+            queues = [
+                name
+                for shard in [None, *settings.CATEGORIES]
+                for tq in build_tier_queues(shard)
+                for name in (tq.queue, tq.processing)
+            ]
+            async with redis_client.pipeline(transaction=False) as pipe:
+                for queue in queues:
+                    pipe.llen(queue)
+                depths = await pipe.execute()
+            for queue, depth in zip(queues, depths):
+                QUEUE_DEPTH.labels(queue=queue).set(depth)
+        except Exception as e:
+            logger.warning(f"Failed to sample queue depth: {e}")
+        await asyncio.sleep(settings.METRICS_QUEUE_DEPTH_INTERVAL)
+
+
+async def _deliver(
+    platform: str,
+    target: str,
+    message: Any,
+    category: str,
+    envelope: Optional[JobEnvelope],
+    dequeued_at: Optional[float]
+) -> DeliveryOutcome:
+    """Send one notification and settle its result."""
+    result = await get_notifier(platform).send(target, message)
+    if result:
+        await record_success(platform, [target])
+    return await _settle(platform, target, message, result, category, envelope, dequeued_at)
+
+
+async def _deliver_many(
+    platform: str,
+    targets: List[str],
+    message: Any,
+    category: str,
+    envelope: Optional[JobEnvelope],
+    dequeued_at: Optional[float]
+) -> List[DeliveryOutcome]:
+    """
+    Send one payload to many targets through the notifier's batch API.
+
+    A batch that raises instead of returning results is settled as a
+    retryable failure of each target, so it is parked for a retry rather
+    than failing the whole job.
+    """
+    try:
+        results = await get_notifier(platform).send_many(targets, message)
+    except Exception as e:
+        logger.error(f"{platform} batch send to {len(targets)} targets failed: {e}")
+        results = [
+            DeliveryResult(ok=False, retryable=True, error=str(e) or type(e).__name__)
+            for _ in targets
+        ]
+    await record_success(platform, [target for target, result in zip(targets, results) if result])
+    return list(await asyncio.gather(*(
+        _settle(platform, target, message, result, category, envelope, dequeued_at)
+        for target, result in zip(targets, results)
+    )))
+
+
+async def _settle(
+    platform: str,
+    target: str,
+    message: Any,
+    result: DeliveryResult,
+    category: str,
+    envelope: Optional[JobEnvelope],
+    dequeued_at: Optional[float]
+) -> DeliveryOutcome:
+    """
+    Record a delivery's latency once the platform accepted it and park it
+    for a retry if it failed with a retryable error. Targets that fail
+    permanently count towards their quarantine instead. Successes reset the
+    quarantine count in the callers, batched per send.
+    """
+    if result:
+        delivered_at = result.completed_at
+        observe_delivery("dequeue_to_delivery", category, platform, dequeued_at, delivered_at)
+        if envelope is not None:
+            observe_delivery("detect_to_delivery", category, platform, envelope.detected_at, delivered_at)
+        return DeliveryOutcome(platform, target, result)
+
+    if is_permanent_failure(platform, result):
+        await record_failure(platform, target, category, result)
+        return DeliveryOutcome(platform, target, result)
+
+    retrying = await retry_scheduler.schedule(
+        RetryItem(
+            platform=platform,
+            target=target,
+            message=message,
+            category=category,
+            trace_id=envelope.trace_id if envelope else None,
+            detected_at=envelope.detected_at if envelope else None,
+        ),
+        result,
+    )
+    return DeliveryOutcome(platform, target, result, retrying)
+
+
+async def _enqueue_digest(platform: str, target: str, category: str, data: Dict[str, str]) -> DeliveryOutcome:
+    """Buffer a job for the target's next digest."""
+    await digest_batcher.add(platform, target, category, data)
+    return DeliveryOutcome(platform, target, DeliveryResult(ok=False), batched=True)
+
+
+def _job_age(envelope: JobEnvelope, now: float) -> Optional[float]:
+    """Seconds since the job was detected (or enqueued), None if unknown."""
+    started_at = envelope.detected_at or envelope.enqueued_at
+    return now - started_at if started_at else None
+
+
+def _is_stale(envelope: JobEnvelope, now: float) -> bool:
+    """Whether a job is older than QUEUE_MAX_JOB_AGE_SECONDS."""
+    if not settings.QUEUE_MAX_JOB_AGE_SECONDS:
+        return False
+    age = _job_age(envelope, now)
+    return age is not None and age > settings.QUEUE_MAX_JOB_AGE_SECONDS
+
+
+async def notifier(
+    category: str,
+    data: Dict[str, str],
+    envelope: Optional[JobEnvelope] = None,
+    dequeued_at: Optional[float] = None,
+    tier: Optional[Tier] = None,
+    digest_only: bool = False
+) -> None:
     """
     Dispatch notifications to all active subscribers for a category.
+
+    Args:
+        category: The job category.
+        data: The job data dictionary.
+        envelope: The queue envelope, used for end-to-end latency metrics.
+        dequeued_at: When the job left the queue.
+        tier: Only notify subscribers of this delivery tier, None for all.
+        digest_only: Buffer the job for digests even for instant subscriptions.
     """
-    async with AsyncSessionLocal() as db:
-        # Get all active subscriptions for this category
-        # Priority: Users with higher max_categories get notified first (premium prioritization)
-        result = await db.execute(
-            select(models.Subscription)
-            .join(models.User, models.Subscription.user_id == models.User.id)
-            .filter(
-                models.Subscription.category == category,
-                models.Subscription.is_active.is_(True)
-            )
-            .order_by(models.User.max_categories.desc())
+    # Get the active subscriptions whose filters accept this job from the in-memory index,
+    # already ordered so users with higher max_categories are notified first
+    await subscriber_index.ensure_loaded()
+    subscribers = subscriber_index.match(category, data)
+
+    # coalesce before splitting by tier, so a target shared by a premium
+    # and a normal subscription is only served by the high tier copy
+    subscriptions, coalesced = coalesce_targets(subscribers)
+    if tier == Tier.HIGH:
+        subscriptions = [s for s in subscriptions if s.max_categories >= settings.PRIORITY_PREMIUM_MIN_CATEGORIES]
+    elif tier == Tier.NORMAL:
+        subscriptions = [s for s in subscriptions if s.max_categories < settings.PRIORITY_PREMIUM_MIN_CATEGORIES]
+
+    # both tier copies see the same duplicates, count them once
+    if tier != Tier.NORMAL:
+        for platform, count in coalesced.items():
+            FANOUT_COALESCED.labels(category=category, platform=platform).inc(count)
+    
+    logger.info(
+        f"Notifying {len(subscriptions)} subscribers for {category}"
+        f" ({sum(coalesced.values())} duplicate targets coalesced)"
+    )
+
+    # Send notifications to each subscriber
+    # each payload is rendered and serialized once, then sent to every
+    # target of its platform in one batch, keeping the priority order
+    renders = RenderCache(category, data)
+    fanout = FanOut()
+    notifiers = get_notifiers()
+    instant: Dict[str, List[str]] = {}
+    for subscription in subscriptions:
+        platform = models.PlatformEnum(subscription.platform).value
+        if platform not in notifiers:
+            continue
+        if digest_only or subscription.delivery_mode == models.DeliveryModeEnum.BATCHED:
+            fanout.submit(_enqueue_digest(platform, subscription.target_address, category, data))
+            continue
+        instant.setdefault(platform, []).append(subscription.target_address)
+
+    for platform, targets in instant.items():
+        fanout.submit(_deliver_many(
+            platform, targets, await renders.get(platform), category, envelope, dequeued_at
+        ))
+
+    # the job is acked once every delivery settled, failed batches were
+    # already parked in the retry store
+    outcomes, errors = await fanout.gather()
+    tier_label = tier.value if tier else "all"
+    FANOUT_DURATION.labels(category=category, tier=tier_label).observe(fanout.duration)
+    for outcome in outcomes:
+        DELIVERIES.labels(platform=outcome.platform, outcome=outcome.label).inc()
+
+    logger.info(
+        f"Fan-out for {data.get('project_id')} took {fanout.duration:.2f}s: "
+        f"{sum(1 for o in outcomes if o.result)}/{len(outcomes) + len(errors)} delivered, "
+        f"{sum(1 for o in outcomes if o.retrying)} retrying, "
+        f"{sum(1 for o in outcomes if o.batched)} batched"
+    )
+
+    # The high tier copy is dequeued first, so it owns persisting the job
+    if tier != Tier.NORMAL:
+        job_writer.add(category, data)
+
+    if errors:
+        # nothing requeues processing entries, so keeping the job there would
+        # lose every delivery of it; only these could not be parked
+        logger.error(
+            f"{len(errors)} deliveries of {data.get('project_id')} could not be settled "
+            f"or parked for a retry: {errors[0]}"
         )
-        subscriptions = result.scalars().all()
-        
-        logger.info(f"Notifying {len(subscriptions)} subscribers for {category}")
-
-        # Send notifications to each subscriber
-        for subscription in subscriptions:
-            if subscription.platform == "telegram":
-                formatted_data = await telegram_format(category, data)
-                asyncio.create_task(notify_telegram(subscription.target_address, formatted_data))
-            elif subscription.platform == "discord":
-                formatted_data = await discord_format(category, data)
-                asyncio.create_task(notify_discord(subscription.target_address, formatted_data))
-
-        # Save job to database
-        try:
-            stmt = insert(models.Job).values(
-                external_id=data["project_id"],
-                external_url=data["project_link"],
-                category=category,
-                title=data["project_title"],
-                details=data["project_details"],
-                budget=data["project_budget"],
-                duration=data["project_duration"],
-                owner_name=data["project_owner_name"],
-                owner_registration_date=data["project_owner_registration_date"],
-                owner_employment_rate=data["project_owner_employment_rate"],
-                number_of_bids=data["project_number_of_bids"],
-                published_at=data["project_date_published"]
-            ).on_conflict_do_nothing(index_elements=['external_id'])
-            
-            await db.execute(stmt)
-            await db.commit()
-            logger.debug(f"Saved job {data['project_id']} to database")
-        except Exception as e:
-            logger.error(f"Database error saving job {data.get('project_id')}: {e}")
-            await db.rollback()
+
@@ -0,0 +1,175 @@
+"""Versioned job envelope for the Redis queue.
+
+Jobs used to travel as ``json.dumps([category, job])`` which repeats every
+key name on each hop. The envelope stores the job fields positionally and
+carries queue metadata next to them:
+
+    [version, category, trace_id, attempt, enqueued_at,
+     detected_at, scraped_at, [field values...]]
+
+Timestamps are unix seconds and feed the pipeline latency metrics. Since
+version 3 the field values also carry the typed values derived by the
+normalizer (``TYPED_FIELDS``) after the scraped strings.
+
+Decoding accepts both the versioned layout and the legacy
+``[category, job]`` layout so publishers and consumers can be rolled out
+independently.
+"""
+
+import time
+import uuid
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+import orjson
+
+from core.processing.normalizer import TYPED_FIELDS
+
+
+ENVELOPE_VERSION = 3
+LEGACY_VERSION = 0
+
+# Positional layout of the job fields, order must never change within a version
+JOB_FIELDS: Tuple[str, ...] = (
+    "project_id",
+    "project_link",
+    "project_title",
+    "project_details",
+    "project_date_published",
+    "project_budget",
+    "project_duration",
+    "project_owner_name",
+    "project_owner_registration_date",
+    "project_owner_employment_rate",
+    "project_number_of_bids",
+)
+
+# Version 3 appends the typed values
+JOB_FIELDS_V3: Tuple[str, ...] = JOB_FIELDS + TYPED_FIELDS
+
+
+@dataclass
+class JobEnvelope:
+    """A job plus the metadata it carries through the queue."""
+
+    category: str
+    data: Dict[str, Any]
+    trace_id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    attempt: int = 0
+    enqueued_at: Optional[float] = None
+    detected_at: Optional[float] = None
+    scraped_at: Optional[float] = None
+    version: int = ENVELOPE_VERSION
+
+    @property
+    def project_id(self) -> str:
+        return self.data.get("project_id", "unknown")
+
+
+def encode_job(envelope: JobEnvelope, version: int = ENVELOPE_VERSION) -> bytes:
+    """
+    Serialize an envelope into the compact positional format.
+
+    Args:
+        envelope: The envelope to serialize. ``enqueued_at`` is stamped
+            with the current time if it is not set yet.
+        version: 3, or 2 to leave out the typed values while consumers
+            that only read version 2 are still running.
+
+    Returns:
+        The encoded envelope.
+    """
+    if version not in (2, 3):
+        raise ValueError(f"Cannot encode envelope version {version}")
+
+    if envelope.enqueued_at is None:
+        envelope.enqueued_at = time.time()
+
+    fields = JOB_FIELDS_V3 if version == 3 else JOB_FIELDS
+    values = [envelope.data.get(name) for name in fields]
+    return orjson.dumps([
+        version,
+        envelope.category,
+        envelope.trace_id,
+        envelope.attempt,
+        envelope.enqueued_at,
+        envelope.detected_at,
+        envelope.scraped_at,
+        values,
+    ])
+
+
+def encode_legacy_job(envelope: JobEnvelope) -> bytes:
+    """Serialize an envelope into the legacy ``[category, job]`` format."""
+    return orjson.dumps([envelope.category, envelope.data])
+
+
+def _decode_v1(payload: List[Any], fields: Tuple[str, ...] = JOB_FIELDS) -> JobEnvelope:
+    _, category, trace_id, attempt, enqueued_at, values = payload
+    if len(values) != len(fields):
+        raise ValueError(f"Expected {len(fields)} job fields, got {len(values)}")
+
+    return JobEnvelope(
+        category=category,
+        data={name: value for name, value in zip(fields, values) if value is not None},
+        trace_id=trace_id,
+        attempt=attempt,
+        enqueued_at=enqueued_at,
+        version=1,
+    )
+
+
+def _decode_v2(payload: List[Any], fields: Tuple[str, ...] = JOB_FIELDS) -> JobEnvelope:
+    version, category, trace_id, attempt, enqueued_at, detected_at, scraped_at, values = payload
+    envelope = _decode_v1([1, category, trace_id, attempt, enqueued_at, values], fields)
+    envelope.detected_at = detected_at
+    envelope.scraped_at = scraped_at
+    envelope.version = version
+    return envelope
+
+
+def _decode_v3(payload: List[Any]) -> JobEnvelope:
+    # same layout as version 2, with the typed values appended
+    return _decode_v2(payload, JOB_FIELDS_V3)
+
+
+_DECODERS = {
+    1: _decode_v1,
+    2: _decode_v2,
+    3: _decode_v3,
+}
+
+
+def decode_job(raw: str | bytes) -> JobEnvelope:
+    """
+    Deserialize a queued job in either the versioned or the legacy format.
+
+    Args:
+        raw: The raw queue entry.
+
+    Returns:
+        The decoded envelope. Legacy entries get a fresh trace id and no
+        enqueue timestamp.
+
+    Raises:
+        ValueError: If the entry is malformed or its version is unknown.
+    """
+    payload = orjson.loads(raw)
+
+    if not isinstance(payload, list) or not payload:
+        raise ValueError("Job entry must be a non-empty list")
+
+    # versioned envelopes start with an int, legacy ones with the category
+    if isinstance(payload[0], int):
+        decoder = _DECODERS.get(payload[0])
+        if decoder is None:
+            raise ValueError(f"Unsupported envelope version: {payload[0]}")
+        try:
+            return decoder(payload)
+        except TypeError as e:
+            raise ValueError(f"Malformed v{payload[0]} envelope: {e}") from e
+
+    if len(payload) != 2 or not isinstance(payload[1], dict):
+        raise ValueError("Legacy job entry must be [category, job]")
+
+    return JobEnvelope(category=payload[0], data=payload[1], version=LEGACY_VERSION)
@@ -0,0 +1,121 @@
+"""Bounded, tracked fan-out of a job's deliveries."""
+
+import asyncio
+import time
+from dataclasses import dataclass
+from collections import Counter
+from typing import Awaitable, Iterable, List, Tuple, Union
+
+import models
+
+from config import settings
+from core.notifications.base import DeliveryResult
+from core.subscriptions import Subscriber
+
+
+@dataclass
+class DeliveryOutcome:
+    """Final state of one delivery within a fan-out."""
+
+    platform: str
+    target: str
+    result: DeliveryResult
+    # handed to the durable retry store instead of being delivered now
+    retrying: bool = False
+    # buffered for a digest instead of being sent on its own
+    batched: bool = False
+
+    @property
+    def label(self) -> str:
+        if self.batched:
+            return "batched"
+        if self.result:
+            return "delivered"
+        return "retrying" if self.retrying else "failed"
+
+
+class FanOut:
+    """
+    Run a job's deliveries concurrently, at most ``concurrency`` at a time.
+
+    Tasks are referenced until they settle, so none of them can be garbage
+    collected mid-flight, and ``gather`` returns every outcome.
+    """
+
+    def __init__(self, concurrency: int = settings.FANOUT_CONCURRENCY):
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._tasks: List[asyncio.Task] = []
+        self._started_at = time.monotonic()
+
+    def __len__(self) -> int:
+        return len(self._tasks)
+
+    def submit(self, delivery: Awaitable[Union[DeliveryOutcome, List[DeliveryOutcome]]]) -> None:
+        """
+        Schedule a delivery, it starts as soon as a slot is free.
+
+        A batch of deliveries returning a list of outcomes takes one slot,
+        its notifier bounds the concurrency within the batch.
+        """
+        self._tasks.append(asyncio.create_task(self._run(delivery)))
+
+    async def _run(
+        self,
+        delivery: Awaitable[Union[DeliveryOutcome, List[DeliveryOutcome]]]
+    ) -> Union[DeliveryOutcome, List[DeliveryOutcome]]:
+        async with self._semaphore:
+            return await delivery
+
+    async def gather(self) -> Tuple[List[DeliveryOutcome], List[BaseException]]:
+        """
+        Wait until every delivery settled.
+
+        Returns:
+            The outcomes, and the errors of deliveries that neither
+            settled nor reached the retry store.
+        """
+        results = await asyncio.gather(*self._tasks, return_exceptions=True)
+        outcomes: List[DeliveryOutcome] = []
+        errors: List[BaseException] = []
+        for result in results:
+            if isinstance(result, BaseException):
+                errors.append(result)
+            elif isinstance(result, list):
+                outcomes.extend(result)
+            else:
+                outcomes.append(result)
+        return outcomes, errors
+
+    @property
+    def duration(self) -> float:
+        """Seconds since the fan-out started."""
+        return time.monotonic() - self._started_at
+
+
+def coalesce_targets(
+    subscriptions: Iterable[Subscriber]
+) -> Tuple[List[Subscriber], Counter]:
+    """
+    Drop subscriptions that point at an already seen delivery target.
+
+    Several subscriptions can share a Discord webhook or a Telegram chat,
+    they should still get a job only once. Order is kept, so the first
+    (highest priority) subscription of a target wins.
+
+    Returns:
+        The unique subscriptions, and the number of coalesced sends per platform.
+    """
+    seen = set()
+    unique: List[Subscriber] = []
+    coalesced: Counter = Counter()
+
+    for subscription in subscriptions:
+        platform = models.PlatformEnum(subscription.platform).value
+        key = (platform, subscription.target_address)
+        if key in seen:
+            coalesced[platform] += 1
+            continue
+        seen.add(key)
+        unique.append(subscription)
+
+    return unique, coalesced
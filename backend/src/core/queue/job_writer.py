@@ -0,0 +1,211 @@
+"""Write-behind persistence of consumed jobs.
+
+Jobs are collected in memory and written as one multi-row ``INSERT`` once
+``JOB_WRITE_BATCH_SIZE`` jobs are buffered or every
+``JOB_WRITE_FLUSH_SECONDS``, instead of one statement and commit per job.
+
+The partitioned jobs table cannot have a unique index on ``external_id``,
+so jobs already stored in the last ``JOB_DEDUP_WINDOW_DAYS`` are skipped
+with a lookup that only touches the recent partitions. After a write the
+generations of the affected categories are bumped, which invalidates the
+API's cached first pages.
+
+A batch the database rejects because of its data (e.g. a numeric overflow,
+a NUL byte or a date without a partition) is split in halves until the bad
+rows are isolated; those are logged and dropped, the rest is written. Any
+other failed write (connection, timeout) puts its rows back into the
+buffer for the next flush. The buffer holds at most
+``JOB_WRITE_BUFFER_MAX`` jobs; past that the oldest ones are dropped, the
+scraper will not resend them but their notifications already went out.
+"""
+
+import asyncio
+from datetime import timedelta
+from decimal import Decimal
+from typing import Any, Dict, List, Optional, Set
+
+from sqlalchemy import func, select
+from sqlalchemy.exc import DataError, IntegrityError
+from sqlalchemy.dialects.postgresql import insert
+
+from config import settings
+from clients import get_redis_client
+from database import AsyncSessionLocal
+import models
+from core.monitoring import BACKPRESSURE_DECISIONS
+from core.processing.normalizer import parse_published_at, typed_values
+from logging_config import get_consumer_logger
+
+
+logger = get_consumer_logger()
+
+
+def _decimal(value: Optional[float]) -> Optional[Decimal]:
+    return Decimal(str(value)) if value is not None else None
+
+
+def job_row(category: str, data: Dict[str, Any]) -> Dict[str, Any]:
+    """Map a scraped job onto the columns of the jobs table."""
+    # jobs from publishers older than envelope v3 come without typed values
+    typed = data if "project_budget_min" in data else {**typed_values(data), **data}
+    return {
+        "external_id": data["project_id"],
+        "external_url": data["project_link"],
+        "category": category,
+        "title": data["project_title"],
+        "details": data["project_details"],
+        "budget": data["project_budget"],
+        "duration": data["project_duration"],
+        "owner_name": data["project_owner_name"],
+        "owner_registration_date": data["project_owner_registration_date"],
+        "owner_employment_rate": data["project_owner_employment_rate"],
+        "number_of_bids": data["project_number_of_bids"],
+        "published_at": data["project_date_published"],
+        "budget_min": _decimal(typed.get("project_budget_min")),
+        "budget_max": _decimal(typed.get("project_budget_max")),
+        "budget_currency": typed.get("project_budget_currency"),
+        "duration_days": typed.get("project_duration_days"),
+        "bids_count": typed.get("project_bids_count"),
+        "employment_rate": _decimal(typed.get("project_owner_employment_pct")),
+        "published_date": parse_published_at(data["project_date_published"]),
+        "owner_registered_at": parse_published_at(typed.get("project_owner_registered_at")),
+    }
+
+
+class JobWriteBuffer:
+    """Buffer jobs in memory and persist them in batches."""
+
+    def __init__(
+        self,
+        batch_size: int = settings.JOB_WRITE_BATCH_SIZE,
+        flush_interval: float = settings.JOB_WRITE_FLUSH_SECONDS,
+        max_buffered: int = settings.JOB_WRITE_BUFFER_MAX
+    ):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_buffered = max_buffered
+        # keyed by external_id, a job buffered twice is written once
+        self._rows: Dict[str, Dict[str, Any]] = {}
+        self._flush_lock = asyncio.Lock()
+        self._wake = asyncio.Event()
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def add(self, category: str, data: Dict[str, str]) -> None:
+        """Buffer a job, waking the flusher once a batch is full."""
+        try:
+            row = job_row(category, data)
+        except KeyError as e:
+            logger.error(f"Not persisting job {data.get('project_id')}, missing field {e}")
+            return
+
+        self._rows[row["external_id"]] = row
+        self._trim()
+        if len(self._rows) >= self.batch_size:
+            self._wake.set()
+
+    async def run(self) -> None:
+        """Flush every interval, or earlier once a batch is full, until cancelled."""
+        while True:
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+            await self.flush()
+
+    async def flush(self) -> int:
+        """
+        Write every buffered job, one multi-row statement per batch.
+
+        Returns:
+            The number of jobs written.
+        """
+        async with self._flush_lock:
+            written = 0
+            while self._rows:
+                batch = self._take(self.batch_size)
+                if not await self._write(batch):
+                    self._restore(batch)
+                    break
+                written += len(batch)
+            return written
+
+    async def close(self) -> None:
+        """Flush what is left, call on shutdown."""
+        await self.flush()
+        if self._rows:
+            logger.error(f"Lost {len(self._rows)} buffered jobs on shutdown")
+
+    def _take(self, count: int) -> List[Dict[str, Any]]:
+        keys = list(self._rows)[:count]
+        return [self._rows.pop(key) for key in keys]
+
+    def _restore(self, batch: List[Dict[str, Any]]) -> None:
+        # failed rows are older than anything buffered meanwhile, keep them first
+        rows = {row["external_id"]: row for row in batch}
+        rows.update(self._rows)
+        self._rows = rows
+        self._trim()
+
+    def _trim(self) -> None:
+        overflow = len(self._rows) - self.max_buffered
+        if overflow <= 0:
+            return
+        for key in list(self._rows)[:overflow]:
+            del self._rows[key]
+        BACKPRESSURE_DECISIONS.labels(component="job_writer", decision="drop").inc(overflow)
+        logger.error(f"Job write buffer full, dropped {overflow} unsaved jobs")
+
+    async def _write(self, batch: List[Dict[str, Any]]) -> bool:
+        """
+        Write a batch, dropping the rows the database rejects.
+
+        Returns:
+            False if the batch should stay buffered for a retry.
+        """
+        try:
+            rows = await self._insert(batch)
+        except (DataError, IntegrityError) as e:
+            if len(batch) == 1:
+                logger.error(f"Dropping job {batch[0]['external_id']}, the database rejects it: {e}")
+                return True
+            # bisect to isolate the bad rows, rows already written by one
+            # half are skipped by the duplicate lookup if the other is retried
+            middle = len(batch) // 2
+            return await self._write(batch[:middle]) and await self._write(batch[middle:])
+        except Exception as e:
+            logger.error(f"Database error saving {len(batch)} jobs, keeping them buffered: {e}")
+            return False
+
+        if rows:
+            await self._invalidate_pages({row["category"] for row in rows})
+        return True
+
+    async def _insert(self, batch: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Insert the jobs of a batch not stored yet, returning those rows."""
+        async with AsyncSessionLocal() as db:
+            stored = set(await db.scalars(
+                select(models.Job.external_id).where(
+                    models.Job.external_id.in_([row["external_id"] for row in batch]),
+                    models.Job.created_at >= func.now() - timedelta(days=settings.JOB_DEDUP_WINDOW_DAYS)
+                )
+            ))
+            rows = [row for row in batch if row["external_id"] not in stored]
+            if rows:
+                await db.execute(insert(models.Job).values(rows))
+                await db.commit()
+            logger.debug(f"Saved {len(rows)} jobs to database, {len(batch) - len(rows)} already stored")
+            return rows
+
+    async def _invalidate_pages(self, categories: Set[str]) -> None:
+        try:
+            redis_client = await get_redis_client()
+            pipe = redis_client.pipeline(transaction=False)
+            for category in (*categories, settings.JOBS_ALL_CATEGORIES):
+                pipe.incr(settings.JOBS_GENERATION_KEY.format(category=category))
+            await pipe.execute()
+        except Exception as e:
+            # the cached pages still expire after JOBS_PAGE_CACHE_TTL_SECONDS
+            logger.warning(f"Failed to invalidate cached job pages: {e}")
@@ -1,9 +1,16 @@
 """Main entry point for the consumer service."""
 
 import asyncio
+import signal
 
 from core.queue.consumer import start_consuming
 
 
+async def main() -> None:
+    # docker stop sends SIGTERM, cancel so buffered jobs are still flushed
+    asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, asyncio.current_task().cancel)
+    await start_consuming()
+
+
 if __name__ == "__main__":
-    asyncio.run(start_consuming())
+    asyncio.run(main())
@@ -0,0 +1,191 @@
+"""Tiered delivery queues with weighted fair dequeueing.
+
+Queues are sharded per category (``task_queue:{category}:{tier}``) and
+every job is published once per tier of its category. Premium subscribers
+are served from the high tier, everybody else from the normal tier.
+Workers pick the next queue with smooth weighted round-robin, so under
+load the high tier gets ``weight_high / (weight_high + weight_normal)`` of
+the throughput while the normal tier keeps a guaranteed share. A normal
+tier entry that waited longer than ``PRIORITY_MAX_WAIT_SECONDS`` is served
+next regardless of weights. Queue heads are only checked for that once per
+``starvation_check_interval`` while no tier is starved, not on every
+dequeue.
+"""
+
+import enum
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+import redis.asyncio as redis
+
+from config import settings
+from core.queue.envelope import decode_job
+
+
+class Tier(str, enum.Enum):
+    HIGH = "high"
+    NORMAL = "normal"
+
+
+@dataclass
+class TierQueue:
+    """A Redis list feeding one delivery tier, plus its processing list."""
+
+    queue: str
+    processing: str
+    weight: int
+    # None marks the legacy queue whose jobs go to every tier at once
+    tier: Optional[Tier] = None
+    current: int = 0
+
+
+def processing_queue(queue: str) -> str:
+    """Name of the processing list that holds in-flight entries of a queue."""
+    return f"{queue}:processing"
+
+
+def category_queue_name(category: str) -> str:
+    """Base name of a category's queues, e.g. ``task_queue:design``."""
+    return settings.QUEUE_CATEGORY_TEMPLATE.format(category=category)
+
+
+def tier_queue_name(tier: Tier, category: Optional[str] = None) -> str:
+    """
+    Name of the delivery queue for a tier.
+
+    Args:
+        tier: The delivery tier.
+        category: The category shard, None for the pre-sharding global queue.
+    """
+    base = category_queue_name(category) if category else settings.QUEUE_MAIN
+    return f"{base}:{tier.value}"
+
+
+def build_tier_queues(category: Optional[str] = None) -> List[TierQueue]:
+    """
+    Build the queues a consumer worker reads, highest priority first.
+
+    Without a category this is the legacy shard: the global tier queues and
+    ``QUEUE_MAIN``, still drained so jobs published before sharding (or
+    before the tiers existed) are delivered.
+    """
+    queues = [
+        TierQueue(
+            queue=tier_queue_name(Tier.HIGH, category),
+            processing=processing_queue(tier_queue_name(Tier.HIGH, category)),
+            weight=settings.PRIORITY_HIGH_WEIGHT,
+            tier=Tier.HIGH,
+        ),
+        TierQueue(
+            queue=tier_queue_name(Tier.NORMAL, category),
+            processing=processing_queue(tier_queue_name(Tier.NORMAL, category)),
+            weight=settings.PRIORITY_NORMAL_WEIGHT,
+            tier=Tier.NORMAL,
+        ),
+    ]
+    if category is None:
+        queues.append(TierQueue(
+            queue=settings.QUEUE_MAIN,
+            processing=settings.QUEUE_PROCESSING,
+            weight=settings.PRIORITY_NORMAL_WEIGHT,
+        ))
+    return queues
+
+
+class WeightedDequeuer:
+    """Reliable weighted fair dequeueing over several tier queues."""
+
+    def __init__(
+        self,
+        redis_client: redis.Redis,
+        queues: List[TierQueue],
+        max_wait_seconds: float = settings.PRIORITY_MAX_WAIT_SECONDS,
+        idle_timeout: float = 1,
+        starvation_check_interval: float = 1
+    ):
+        self.redis = redis_client
+        self.queues = queues
+        self.max_wait_seconds = max_wait_seconds
+        self.idle_timeout = idle_timeout
+        self.starvation_check_interval = starvation_check_interval
+        self._next_starvation_check = 0.0
+        # queue -> (head entry, when it was first seen at the head), ages
+        # entries that carry no enqueued_at
+        self._heads: Dict[str, Tuple[str, float]] = {}
+
+    def _weighted_order(self) -> List[TierQueue]:
+        """Advance the smooth weighted round-robin and return queues by preference."""
+        total = 0
+        for tq in self.queues:
+            tq.current += tq.weight
+            total += tq.weight
+
+        order = sorted(self.queues, key=lambda tq: tq.current, reverse=True)
+        order[0].current -= total
+        return order
+
+    async def _oldest_age(self, tq: TierQueue) -> float:
+        """Seconds the oldest entry of a queue has been waiting, 0 if empty."""
+        raw = await self.redis.lindex(tq.queue, -1)
+        if raw is None:
+            self._heads.pop(tq.queue, None)
+            return 0
+
+        now = time.time()
+        try:
+            enqueued_at = decode_job(raw).enqueued_at
+        except ValueError:
+            enqueued_at = None
+        if enqueued_at:
+            return now - enqueued_at
+
+        # legacy entries are aged from when they were first seen at the head
+        head, seen_at = self._heads.get(tq.queue, (None, now))
+        if head != raw:
+            seen_at = now
+            self._heads[tq.queue] = (raw, seen_at)
+        return now - seen_at
+
+    async def _starved(self) -> Optional[TierQueue]:
+        """Return the first lower tier whose head waited longer than allowed."""
+        for tq in self.queues[1:]:
+            if await self._oldest_age(tq) > self.max_wait_seconds:
+                return tq
+        return None
+
+    async def next(self) -> Optional[Tuple[TierQueue, str]]:
+        """
+        Move the next entry into its processing list.
+
+        Returns:
+            The source queue and the raw entry, or None if every queue
+            stayed empty for ``idle_timeout`` seconds.
+        """
+        order = self._weighted_order()
+
+        # starvation protection only matters while the top tier is preferred.
+        # Peeking at the queue heads is paced so most dequeues skip it, but
+        # a starved tier is rechecked every time until it caught up
+        now = time.monotonic()
+        if order[0] is self.queues[0] and now >= self._next_starvation_check:
+            starved = await self._starved()
+            if starved is None:
+                self._next_starvation_check = now + self.starvation_check_interval
+            else:
+                order.remove(starved)
+                order.insert(0, starved)
+
+        for tq in order:
+            raw = await self.redis.lmove(tq.queue, tq.processing, "RIGHT", "LEFT")
+            if raw is not None:
+                return tq, raw
+
+        # everything is empty, block on each queue in turn for a slice of the
+        # idle timeout instead of spinning, so no tier waits a full timeout
+        timeout = self.idle_timeout / len(self.queues)
+        for tq in self.queues:
+            raw = await self.redis.blmove(tq.queue, tq.processing, timeout, "RIGHT", "LEFT")
+            if raw is not None:
+                return tq, raw
+        return None
@@ -1,29 +1,109 @@
 """Job queue publishing functionality."""
 
-import json
-from typing import Dict, List
+import asyncio
+import time
+from typing import Dict, List, Optional
+
+import redis.asyncio as redis
 
 from config import settings
 from clients import get_redis_client
+from core.monitoring import BACKPRESSURE_DECISIONS
+from core.queue.envelope import JobEnvelope, LEGACY_VERSION, encode_job, encode_legacy_job
+from core.queue.priority import Tier, tier_queue_name
+from logging_config import get_scraper_logger
+
+
+logger = get_scraper_logger()
+
+
+async def queue_depth(redis_client: redis.Redis) -> int:
+    """Length of the deepest category tier queue."""
+    async with redis_client.pipeline(transaction=False) as pipe:
+        for category in settings.CATEGORIES:
+            for tier in Tier:
+                pipe.llen(tier_queue_name(tier, category))
+        depths = await pipe.execute()
+    return max(depths)
 
 
-async def publish_jobs(payload: Dict[str, List[Dict[str, str]]]) -> None:
+async def wait_for_capacity(redis_client: redis.Redis) -> None:
+    """
+    Slow the publisher down while the queue is above its high-water mark.
+
+    Waits with exponential backoff until the depth drops below
+    ``QUEUE_HIGH_WATER_MARK`` or ``QUEUE_BACKPRESSURE_MAX_WAIT_SECONDS``
+    elapsed. Jobs are published either way, stale ones are shed by the
+    consumer.
+    """
+    depth = await queue_depth(redis_client)
+    if depth < settings.QUEUE_HIGH_WATER_MARK:
+        BACKPRESSURE_DECISIONS.labels(component="publisher", decision="accept").inc()
+        return
+
+    logger.warning(f"Queue depth {depth} above high-water mark, throttling publisher")
+    deadline = time.monotonic() + settings.QUEUE_BACKPRESSURE_MAX_WAIT_SECONDS
+    delay = 1.0
+
+    while depth >= settings.QUEUE_HIGH_WATER_MARK:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            BACKPRESSURE_DECISIONS.labels(component="publisher", decision="throttle_timeout").inc()
+            logger.warning(f"Queue still at {depth} after max wait, publishing anyway")
+            return
+        await asyncio.sleep(min(delay, remaining))
+        delay = min(delay * 2, 30)
+        depth = await queue_depth(redis_client)
+
+    BACKPRESSURE_DECISIONS.labels(component="publisher", decision="throttle").inc()
+
+
+async def publish_jobs(
+    payload: Dict[str, List[Dict[str, str]]],
+    timings: Optional[Dict[str, Dict[str, float]]] = None
+) -> None:
     """
     Publish processed jobs to the Redis queue.
+
+    Each category is pushed to its own shard, once per delivery tier in a
+    single transaction, after waiting for the queues to drain below their
+    high-water mark.
     
     Args:
         payload: Dictionary mapping categories to lists of job data.
+        timings: Optional mapping of project_id to its pipeline timestamps
+            (``detected_at``, ``scraped_at``).
     """
     redis_client = await get_redis_client()
+    version = settings.QUEUE_ENVELOPE_VERSION
+    encode = encode_legacy_job if version == LEGACY_VERSION else lambda envelope: encode_job(envelope, version)
+    timings = timings or {}
+
+    if any(payload.values()):
+        await wait_for_capacity(redis_client)
     
     for category, projects in payload.items():
-        for job in projects:
-            try:
-                job_data = json.dumps([category, job])
-                await redis_client.lpush(settings.QUEUE_MAIN, job_data)
-            except Exception as e:
-                print(f"Error publishing job {job.get('project_id', 'unknown')}: {e}")
-                # Remove from seen set so it can be retried
-                project_id = job.get("project_id")
-                if project_id:
-                    await redis_client.srem(f"ids:{category}", project_id)
+        if not projects:
+            continue
+
+        try:
+            entries = []
+            for job in projects:
+                stamps = timings.get(job.get("project_id"), {})
+                entries.append(encode(JobEnvelope(
+                    category=category,
+                    data=job,
+                    detected_at=stamps.get("detected_at"),
+                    scraped_at=stamps.get("scraped_at"),
+                )))
+
+            async with redis_client.pipeline(transaction=True) as pipe:
+                for tier in Tier:
+                    pipe.lpush(tier_queue_name(tier, category), *entries)
+                await pipe.execute()
+        except Exception as e:
+            logger.error(f"Error publishing {len(projects)} jobs in {category}: {e}")
+            # Remove from seen set so they can be retried
+            project_ids = [job["project_id"] for job in projects if job.get("project_id")]
+            if project_ids:
+                await redis_client.srem(f"ids:{category}", *project_ids)
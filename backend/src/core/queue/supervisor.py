@@ -0,0 +1,161 @@
+"""Consumer supervisor running dedicated workers per category shard.
+
+Each category has its own queues, so a backlog in one category no longer
+delays the others. The supervisor keeps ``CONSUMER_WORKERS_PER_CATEGORY``
+workers on every shard and hands the remaining ``CONSUMER_MAX_WORKERS``
+budget to the deepest queues on every rebalance.
+"""
+
+import asyncio
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, List, Optional
+
+import redis.asyncio as redis
+
+from config import settings
+from core.monitoring import CONSUMER_WORKERS
+from core.queue.priority import TierQueue, build_tier_queues
+from logging_config import get_consumer_logger
+
+
+logger = get_consumer_logger()
+
+# a worker consumes the given queues until its stop event is set
+Worker = Callable[[List[TierQueue], asyncio.Event], Awaitable[None]]
+
+LEGACY_SHARD = "legacy"
+
+
+@dataclass
+class _WorkerHandle:
+    task: asyncio.Task
+    stop: asyncio.Event
+
+
+class ConsumerSupervisor:
+    """Start, stop and rebalance consumer workers across category shards."""
+
+    def __init__(
+        self,
+        redis_client: redis.Redis,
+        worker: Worker,
+        categories: Optional[List[str]] = None,
+        workers_per_category: int = settings.CONSUMER_WORKERS_PER_CATEGORY,
+        max_workers: int = settings.CONSUMER_MAX_WORKERS,
+        rebalance_interval: float = settings.CONSUMER_REBALANCE_INTERVAL
+    ):
+        self.redis = redis_client
+        self.worker = worker
+        self.categories = categories or list(settings.CATEGORIES)
+        self.workers_per_category = max(1, workers_per_category)
+        self.max_workers = max(max_workers, self.workers_per_category * len(self.categories))
+        self.rebalance_interval = rebalance_interval
+        self._workers: Dict[str, List[_WorkerHandle]] = {}
+        # workers asked to stop that may still be finishing a job
+        self._retiring: List[_WorkerHandle] = []
+
+    async def run(self) -> None:
+        """Start the baseline workers and rebalance until cancelled."""
+        # one worker drains the pre-sharding queues during rollout
+        self._scale(LEGACY_SHARD, 1)
+        for category in self.categories:
+            self._scale(category, self.workers_per_category)
+
+        try:
+            while True:
+                await asyncio.sleep(self.rebalance_interval)
+                try:
+                    await self.rebalance()
+                except Exception as e:
+                    logger.error(f"Worker rebalance failed: {e}")
+        finally:
+            await self.stop()
+
+    async def rebalance(self) -> None:
+        """Resize every shard's worker pool according to its queue depth."""
+        depths = await self._depths()
+        for category, count in self.allocate(depths).items():
+            self._scale(category, count)
+
+    def allocate(self, depths: Dict[str, int]) -> Dict[str, int]:
+        """
+        Split the worker budget across categories.
+
+        Every category keeps its baseline workers, the spare budget is
+        distributed proportionally to queue depth (largest remainder first).
+
+        Args:
+            depths: Mapping of category to number of waiting jobs.
+
+        Returns:
+            Mapping of category to its target worker count.
+        """
+        allocation = {category: self.workers_per_category for category in self.categories}
+        spare = self.max_workers - sum(allocation.values())
+        total_depth = sum(depths.get(category, 0) for category in self.categories)
+
+        if spare <= 0 or total_depth == 0:
+            return allocation
+
+        shares = {
+            category: spare * depths.get(category, 0) / total_depth
+            for category in self.categories
+        }
+        for category, share in shares.items():
+            allocation[category] += int(share)
+
+        leftover = spare - sum(int(share) for share in shares.values())
+        by_remainder = sorted(shares, key=lambda c: shares[c] - int(shares[c]), reverse=True)
+        for category in by_remainder[:leftover]:
+            allocation[category] += 1
+
+        return allocation
+
+    async def stop(self) -> None:
+        """Ask every worker to finish its current job and wait for them."""
+        handles = [handle for shard in self._workers.values() for handle in shard]
+        handles.extend(self._retiring)
+        for handle in handles:
+            handle.stop.set()
+        await asyncio.gather(*(handle.task for handle in handles), return_exceptions=True)
+        self._workers.clear()
+        self._retiring.clear()
+
+    async def _depths(self) -> Dict[str, int]:
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for category in self.categories:
+                for tq in build_tier_queues(category):
+                    pipe.llen(tq.queue)
+            lengths = await pipe.execute()
+
+        per_shard = len(lengths) // len(self.categories)
+        return {
+            category: sum(lengths[i * per_shard:(i + 1) * per_shard])
+            for i, category in enumerate(self.categories)
+        }
+
+    def _scale(self, shard: str, count: int) -> None:
+        """Start or stop workers until the shard runs ``count`` of them."""
+        previous = len(self._workers.get(shard, []))
+        handles = [h for h in self._workers.get(shard, []) if not h.task.done()]
+        self._retiring = [h for h in self._retiring if not h.task.done()]
+
+        while len(handles) < count:
+            queues = build_tier_queues(None if shard == LEGACY_SHARD else shard)
+            stop = asyncio.Event()
+            handles.append(_WorkerHandle(
+                task=asyncio.create_task(self.worker(queues, stop)),
+                stop=stop,
+            ))
+
+        if len(handles) > count:
+            # stopped workers finish their current job before exiting
+            for handle in handles[count:]:
+                handle.stop.set()
+                self._retiring.append(handle)
+            handles = handles[:count]
+
+        if len(handles) != previous:
+            logger.info(f"Shard {shard} now runs {len(handles)} workers")
+        self._workers[shard] = handles
+        CONSUMER_WORKERS.labels(shard=shard).set(len(handles))
@@ -1,6 +1,7 @@
 """Job scraping functionality for Mostaql.com."""
 
-from typing import Dict, List, Tuple
+import time
+from typing import Dict, List, Optional, Tuple
 
 from config import settings
 from core.scraping.browser import init_browser, init_context, route_intercept
@@ -62,12 +63,16 @@ async def scrape_newest_jobs() -> None:
         await playwright.stop()
 
 
-async def scrape_data(jobs: Dict[str, List[Tuple[str, str]]]) -> None:
+async def scrape_data(
+    jobs: Dict[str, List[Tuple[str, str]]],
+    detected_at: Optional[Dict[str, float]] = None
+) -> None:
     """
     Scrape detailed data for specific jobs.
     
     Args:
         jobs: Dictionary mapping category names to lists of (project_id, url) tuples.
+        detected_at: Optional mapping of project_id to the time it was first seen.
     """
     total_jobs = sum(len(v) for v in jobs.values())
     logger.info(f"Scraping details for {total_jobs} new jobs...")
@@ -76,6 +81,9 @@ async def scrape_data(jobs: Dict[str, List[Tuple[str, str]]]) -> None:
     redis_client = await get_redis_client()
     
     payload: Dict[str, List[dict]] = {}
+    # project_id -> pipeline timestamps carried into the queue envelope
+    timings: Dict[str, Dict[str, float]] = {}
+    detected_at = detected_at or {}
 
     try:
         for category, link_items in jobs.items():
@@ -94,6 +102,10 @@ async def scrape_data(jobs: Dict[str, List[Tuple[str, str]]]) -> None:
                         # Extract project data
                         project_data = await _extract_project_data(page, project_id, link)
                         payload[category].append(project_data)
+                        timings[project_id] = {
+                            "detected_at": detected_at.get(project_id),
+                            "scraped_at": time.time(),
+                        }
                         logger.debug(f"Scraped details for {project_id}")
 
                     except Exception as e:
@@ -104,7 +116,7 @@ async def scrape_data(jobs: Dict[str, List[Tuple[str, str]]]) -> None:
 
         # Normalize and publish the data
         payload = await normalize_data(payload)
-        await publish_jobs(payload)
+        await publish_jobs(payload, timings)
         logger.info(f"Published {total_jobs} jobs to queue")
 
     finally:
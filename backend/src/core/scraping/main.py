@@ -4,6 +4,7 @@ import asyncio
 import traceback
 
 from core.scraping import scrape_newest_jobs
+from core.monitoring import start_metrics_server
 from logging_config import get_scraper_logger
 from config import settings
 
@@ -19,6 +20,7 @@ async def run_scraper_loop() -> None:
     Scrapes newest jobs every SCRAPE_INTERVAL_SECONDS.
     """
     logger.info(f"Starting scraper loop (interval: {SCRAPE_INTERVAL_SECONDS}s)")
+    start_metrics_server()
     
     while True:
         try:
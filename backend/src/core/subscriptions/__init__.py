@@ -0,0 +1,13 @@
+# Subscriptions module
+from .events import subscription_changed, user_changed
+from .index import Subscriber, SubscriberIndex, subscriber_query
+from .matching import CategoryMatcher
+
+__all__ = [
+    "subscription_changed",
+    "user_changed",
+    "Subscriber",
+    "SubscriberIndex",
+    "subscriber_query",
+    "CategoryMatcher",
+]
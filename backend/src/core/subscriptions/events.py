@@ -0,0 +1,52 @@
+"""Change events for subscriptions and users.
+
+Whatever changes a subscription, or a user in a way that affects its
+subscriptions, publishes an event on ``SUBSCRIPTION_EVENTS_CHANNEL`` after
+committing. Events only carry ids, listeners re-read the rows, so a late
+or duplicated event can never leave them with stale data.
+"""
+
+from typing import Iterable
+
+import orjson
+
+from config import settings
+from clients import get_redis_client
+from logging_config import setup_logging
+
+
+logger = setup_logging("first.subscriptions")
+
+SUBSCRIPTION = "subscription"
+USER = "user"
+
+
+async def publish_change(kind: str, ids: Iterable[int]) -> None:
+    """
+    Announce that subscriptions or users changed.
+
+    Publishing is best effort, listeners resync periodically anyway.
+
+    Args:
+        kind: ``SUBSCRIPTION`` or ``USER``.
+        ids: The ids of the changed rows.
+    """
+    ids = list(ids)
+    if not ids:
+        return
+    try:
+        redis_client = await get_redis_client()
+        await redis_client.publish(
+            settings.SUBSCRIPTION_EVENTS_CHANNEL,
+            orjson.dumps({"kind": kind, "ids": ids}),
+        )
+    except Exception as e:
+        logger.warning(f"Failed to publish {kind} change event: {e}")
+
+
+async def subscription_changed(*subscription_ids: int) -> None:
+    await publish_change(SUBSCRIPTION, subscription_ids)
+
+
+async def user_changed(*user_ids: int) -> None:
+    await publish_change(USER, user_ids)
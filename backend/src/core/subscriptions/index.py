@@ -0,0 +1,195 @@
+"""In-process index of active subscribers per category.
+
+The consumer fans out every job to the subscribers of its category. Those
+change far less often than jobs arrive, so instead of a SQL join per job
+the index keeps each category's subscribers pre-sorted by priority. It is
+loaded at startup, patched from change events (see ``events``) and fully
+resynced every ``SUBSCRIBER_INDEX_RESYNC_SECONDS`` in case an event was
+missed.
+"""
+
+import asyncio
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import orjson
+from sqlalchemy import Select, select
+
+from config import settings
+from clients import get_redis_client
+from database import AsyncSessionLocal
+import models
+from core.subscriptions.events import SUBSCRIPTION, USER
+from core.subscriptions.matching import CategoryMatcher
+from logging_config import setup_logging
+
+
+logger = setup_logging("first.subscriptions")
+
+
+@dataclass(frozen=True)
+class Subscriber:
+    """What the fan-out needs to know about an active subscription."""
+
+    id: int
+    user_id: int
+    category: str
+    platform: models.PlatformEnum
+    target_address: str
+    delivery_mode: models.DeliveryModeEnum
+    max_categories: int
+    include_keywords: Tuple[str, ...] = ()
+    exclude_keywords: Tuple[str, ...] = ()
+    min_budget: Optional[float] = None
+    max_budget: Optional[float] = None
+    max_bids: Optional[int] = None
+
+
+def _float(value: Optional[Decimal]) -> Optional[float]:
+    return float(value) if value is not None else None
+
+
+def subscriber_query(*criteria) -> Select:
+    """
+    Select active subscriptions with their user's max_categories.
+
+    Refreshes by user go through the partial index on active
+    subscriptions, see ``benchmarks.query_plans``.
+
+    Args:
+        *criteria: Extra filters, e.g. on id or user_id.
+    """
+    return (
+        select(models.Subscription, models.User.max_categories)
+        .join(models.User, models.Subscription.user_id == models.User.id)
+        .filter(models.Subscription.is_active.is_(True), *criteria)
+    )
+
+
+def _priority(subscriber: Subscriber) -> tuple:
+    # users with higher max_categories get notified first (premium prioritization)
+    return (-subscriber.max_categories, subscriber.id)
+
+
+class SubscriberIndex:
+    """Category -> active subscribers, highest priority first."""
+
+    def __init__(self, resync_interval: float = settings.SUBSCRIBER_INDEX_RESYNC_SECONDS):
+        self.resync_interval = resync_interval
+        self._by_category: Dict[str, List[Subscriber]] = {}
+        self._by_id: Dict[int, Subscriber] = {}
+        # compiled filters per category, built on first use after a change
+        self._matchers: Dict[str, CategoryMatcher] = {}
+        self._loaded = False
+        self._lock = asyncio.Lock()
+
+    def get(self, category: str) -> List[Subscriber]:
+        """Active subscribers of a category, highest priority first."""
+        return self._by_category.get(category, [])
+
+    def match(self, category: str, data: Dict[str, Any]) -> List[Subscriber]:
+        """Active subscribers of a category whose filters accept a job."""
+        matcher = self._matchers.get(category)
+        if matcher is None:
+            matcher = self._matchers[category] = CategoryMatcher(self.get(category))
+        return matcher.match(data)
+
+    async def ensure_loaded(self) -> None:
+        if not self._loaded:
+            await self.load()
+
+    async def load(self) -> None:
+        """Rebuild the whole index from the database."""
+        async with self._lock:
+            subscribers = await self._query()
+            by_category: Dict[str, List[Subscriber]] = {}
+            for subscriber in sorted(subscribers, key=_priority):
+                by_category.setdefault(subscriber.category, []).append(subscriber)
+            self._by_category = by_category
+            self._by_id = {subscriber.id: subscriber for subscriber in subscribers}
+            self._matchers = {}
+            self._loaded = True
+        logger.info(f"Subscriber index loaded: {len(subscribers)} subscribers in {len(by_category)} categories")
+
+    async def refresh(self, kind: str, ids: Iterable[int]) -> None:
+        """Re-read the subscriptions behind a change event."""
+        ids = list(ids)
+        async with self._lock:
+            if kind == SUBSCRIPTION:
+                stale = [i for i in ids if i in self._by_id]
+                fresh = await self._query(models.Subscription.id.in_(ids))
+            elif kind == USER:
+                stale = [s.id for s in self._by_id.values() if s.user_id in ids]
+                fresh = await self._query(models.Subscription.user_id.in_(ids))
+            else:
+                logger.warning(f"Ignoring unknown change event kind: {kind}")
+                return
+
+            touched = set()
+            for subscription_id in stale:
+                subscriber = self._by_id.pop(subscription_id)
+                touched.add(subscriber.category)
+                self._by_category[subscriber.category] = [
+                    s for s in self._by_category[subscriber.category] if s.id != subscription_id
+                ]
+            for subscriber in fresh:
+                self._by_id[subscriber.id] = subscriber
+                touched.add(subscriber.category)
+                self._by_category.setdefault(subscriber.category, []).append(subscriber)
+            for category in touched:
+                self._by_category[category].sort(key=_priority)
+                self._matchers.pop(category, None)
+
+    async def listen(self) -> None:
+        """Apply change events until cancelled, resyncing after a disconnect."""
+        while True:
+            try:
+                redis_client = await get_redis_client()
+                pubsub = redis_client.pubsub()
+                await pubsub.subscribe(settings.SUBSCRIPTION_EVENTS_CHANNEL)
+                # events sent while we were not subscribed are lost
+                await self.load()
+                async for message in pubsub.listen():
+                    if message["type"] != "message":
+                        continue
+                    try:
+                        event = orjson.loads(message["data"])
+                        await self.refresh(event["kind"], event["ids"])
+                    except (ValueError, KeyError, TypeError) as e:
+                        logger.error(f"Dropping malformed change event: {e}")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Subscriber index listener failed: {e}")
+                await asyncio.sleep(1)
+
+    async def resync(self) -> None:
+        """Periodically rebuild the index as a safety net."""
+        while True:
+            await asyncio.sleep(self.resync_interval)
+            try:
+                await self.load()
+            except Exception as e:
+                logger.error(f"Subscriber index resync failed: {e}")
+
+    async def _query(self, *criteria) -> List[Subscriber]:
+        async with AsyncSessionLocal() as db:
+            result = await db.execute(subscriber_query(*criteria))
+            return [
+                Subscriber(
+                    id=subscription.id,
+                    user_id=subscription.user_id,
+                    category=subscription.category,
+                    platform=subscription.platform,
+                    target_address=subscription.target_address,
+                    delivery_mode=subscription.delivery_mode,
+                    max_categories=max_categories,
+                    include_keywords=tuple(subscription.include_keywords or ()),
+                    exclude_keywords=tuple(subscription.exclude_keywords or ()),
+                    min_budget=_float(subscription.min_budget),
+                    max_budget=_float(subscription.max_budget),
+                    max_bids=subscription.max_bids,
+                )
+                for subscription, max_categories in result.all()
+            ]
@@ -0,0 +1,181 @@
+"""Match a job against every subscription filter of its category at once.
+
+Each category's subscribers are compiled into a ``CategoryMatcher``:
+
+- every include/exclude keyword of every subscriber goes into one trie
+  shaped regex, so the job's title and details are scanned once no matter
+  how many subscribers there are; each keyword maps to a bitset of the
+  subscribers using it.
+- budget and bid limits go into sorted range indexes, so the subscribers
+  admitting a value are found with a bisect and a precomputed bitset.
+
+The bitsets are combined with a few integer operations and the matching
+subscribers come out in priority order. Keywords and job text are
+normalized with ``normalize_arabic`` so spelling variants still match.
+"""
+
+import re
+from bisect import bisect_left, bisect_right
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from core.processing.normalizer import normalize_arabic, typed_values
+
+if TYPE_CHECKING:
+    from core.subscriptions.index import Subscriber
+
+
+def _trie_pattern(words: Iterable[str]) -> str:
+    """
+    Build a regex matching any of ``words``, the longest one first.
+
+    Alternatives sharing a prefix are merged, so the regex engine walks a
+    trie instead of trying every word in turn.
+    """
+    trie: Dict[str, Any] = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = True
+
+    def build(node: Dict[str, Any]) -> str:
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        # a word ending here is a prefix of the longer ones, prefer those
+        return f"(?:{body})?" if "" in node else body
+
+    return build(trie)
+
+
+class _RangeIndex:
+    """Subscribers whose bound admits a value, looked up by bisection."""
+
+    def __init__(self, bounds: List[Tuple[float, int]], everyone: int, minimum: bool):
+        """
+        Args:
+            bounds: (bound, subscriber bit) of every bounded subscriber.
+            everyone: Bitset of all subscribers.
+            minimum: True if bounds are minimums the value must reach,
+                False if they are maximums it must not exceed.
+        """
+        bounds = sorted(bounds)
+        self._values = [value for value, _ in bounds]
+        self._minimum = minimum
+        self._everyone = everyone
+
+        bounded = 0
+        for _, bit in bounds:
+            bounded |= bit
+        self._unbounded = everyone & ~bounded
+
+        # cumulative bitsets from the side of the bounds that admit more
+        masks = []
+        acc = 0
+        for _, bit in (bounds if minimum else reversed(bounds)):
+            acc |= bit
+            masks.append(acc)
+        self._masks = masks if minimum else masks[::-1]
+
+    def admitted(self, value: Optional[float]) -> int:
+        # an unknown value is never a reason to drop a job
+        if value is None or not self._values:
+            return self._everyone
+        if self._minimum:
+            i = bisect_right(self._values, value)
+            return self._unbounded | (self._masks[i - 1] if i else 0)
+        i = bisect_left(self._values, value)
+        return self._unbounded | (self._masks[i] if i < len(self._masks) else 0)
+
+
+class CategoryMatcher:
+    """Compiled filters of one category's subscribers."""
+
+    def __init__(self, subscribers: List["Subscriber"]):
+        """
+        Args:
+            subscribers: The category's subscribers, highest priority first.
+        """
+        self.subscribers = subscribers
+        self._everyone = (1 << len(subscribers)) - 1
+        self._include: Dict[str, int] = {}
+        self._exclude: Dict[str, int] = {}
+        self._no_include = 0
+
+        min_budgets: List[Tuple[float, int]] = []
+        max_budgets: List[Tuple[float, int]] = []
+        max_bids: List[Tuple[float, int]] = []
+
+        for position, subscriber in enumerate(subscribers):
+            bit = 1 << position
+            include = {normalize_arabic(k.strip()) for k in subscriber.include_keywords if k.strip()}
+            for keyword in include:
+                self._include[keyword] = self._include.get(keyword, 0) | bit
+            if not include:
+                self._no_include |= bit
+            for keyword in {normalize_arabic(k.strip()) for k in subscriber.exclude_keywords if k.strip()}:
+                self._exclude[keyword] = self._exclude.get(keyword, 0) | bit
+
+            if subscriber.min_budget is not None:
+                min_budgets.append((subscriber.min_budget, bit))
+            if subscriber.max_budget is not None:
+                max_budgets.append((subscriber.max_budget, bit))
+            if subscriber.max_bids is not None:
+                max_bids.append((subscriber.max_bids, bit))
+
+        keywords: Set[str] = set(self._include) | set(self._exclude)
+        # a zero-width lookahead finds the longest keyword at every position
+        self._pattern = re.compile(f"(?=({_trie_pattern(keywords)}))") if keywords else None
+        # shorter keywords starting at the same position are its prefixes
+        self._prefixes = {
+            keyword: [keyword[:i] for i in range(1, len(keyword)) if keyword[:i] in keywords]
+            for keyword in keywords
+        }
+
+        self._min_budget = _RangeIndex(min_budgets, self._everyone, minimum=True)
+        self._max_budget = _RangeIndex(max_budgets, self._everyone, minimum=False)
+        self._max_bids = _RangeIndex(max_bids, self._everyone, minimum=False)
+
+    def _keywords_in(self, text: str) -> Set[str]:
+        found: Set[str] = set()
+        if self._pattern is None:
+            return found
+        for match in self._pattern.finditer(text):
+            keyword = match.group(1)
+            if keyword and keyword not in found:
+                found.add(keyword)
+                found.update(self._prefixes[keyword])
+        return found
+
+    def match(self, data: Dict[str, Any]) -> List["Subscriber"]:
+        """
+        Return the subscribers whose filters accept a job, in priority order.
+
+        Args:
+            data: The job data, with or without its typed values.
+        """
+        mask = self._everyone
+        if not mask:
+            return []
+
+        typed = data if "project_budget_min" in data else {**typed_values(data), **data}
+        # a job's budget range only has to overlap the subscriber's range
+        mask &= self._min_budget.admitted(typed.get("project_budget_max"))
+        mask &= self._max_budget.admitted(typed.get("project_budget_min"))
+        mask &= self._max_bids.admitted(typed.get("project_bids_count"))
+
+        if mask and self._pattern is not None:
+            text = normalize_arabic(f"{data.get('project_title', '')}\n{data.get('project_details', '')}")
+            included = self._no_include
+            for keyword in self._keywords_in(text):
+                included |= self._include.get(keyword, 0)
+                mask &= ~self._exclude.get(keyword, 0)
+            mask &= included
+
+        matched = []
+        while mask:
+            low = mask & -mask
+            matched.append(self.subscribers[low.bit_length() - 1])
+            mask ^= low
+        return matched
@@ -1,12 +1,21 @@
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from config import settings
+from logging_config import setup_logging
+
+logger = setup_logging("first.database")
 
 DATABASE_URL = settings.DATABASE_URL
 
 engine = create_async_engine(
     DATABASE_URL,
-    pool_size=5,
-    max_overflow=10,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
     pool_pre_ping=True,
     echo=False
 )
@@ -19,5 +28,53 @@ AsyncSessionLocal = async_sessionmaker(
     autoflush=False
 )
 
+# read-only queries go to the replica if one is configured, else the primary
+read_engine = create_async_engine(
+    settings.DATABASE_READ_URL,
+    pool_size=settings.DB_READ_POOL_SIZE,
+    max_overflow=settings.DB_READ_MAX_OVERFLOW,
+    pool_pre_ping=True,
+    connect_args={"timeout": settings.DB_READ_CONNECT_TIMEOUT_SECONDS},
+    echo=False
+) if settings.DATABASE_READ_URL else engine
+
+AsyncReadSessionLocal = async_sessionmaker(
+    read_engine,
+    class_=AsyncSession,
+    expire_on_commit=False,
+    autocommit=False,
+    autoflush=False
+)
+
+# monotonic time until which the replica is considered down
+_replica_down_until = 0.0
+
+
+@asynccontextmanager
+async def read_session() -> AsyncIterator[AsyncSession]:
+    """
+    Session for read-only queries.
+
+    Uses the read replica when one is configured and reachable, otherwise
+    the primary. A replica lags behind the primary, so never use this to
+    read something the same request just wrote.
+    """
+    global _replica_down_until
 
+    if read_engine is not engine and time.monotonic() >= _replica_down_until:
+        session = AsyncReadSessionLocal()
+        try:
+            await session.connection()
+        except (OSError, asyncio.TimeoutError, SQLAlchemyError) as e:
+            await session.close()
+            _replica_down_until = time.monotonic() + settings.DB_READ_RETRY_SECONDS
+            logger.warning(f"Read replica unavailable, using the primary for {settings.DB_READ_RETRY_SECONDS}s: {e}")
+        else:
+            try:
+                yield session
+            finally:
+                await session.close()
+            return
 
+    async with AsyncSessionLocal() as session:
+        yield session
@@ -121,3 +121,8 @@ def get_consumer_logger() -> logging.Logger:
 def get_notifications_logger() -> logging.Logger:
     """Get logger for notifications."""
     return setup_logging("first.notifications")
+
+
+def get_maintenance_logger() -> logging.Logger:
+    """Get logger for database maintenance."""
+    return setup_logging("first.maintenance")
@@ -1,10 +1,13 @@
 import enum
 from datetime import datetime
+from decimal import Decimal
 from typing import List, Optional
 
 from sqlalchemy import (
-    Boolean, BigInteger, DateTime, ForeignKey, Integer, String, Text, func, Enum as SAEnum
+    JSON, Boolean, BigInteger, Computed, DateTime, ForeignKey, Index, Integer, Numeric, String, Text, func, text,
+    Enum as SAEnum
 )
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
 class Base(DeclarativeBase):
@@ -14,6 +17,10 @@ class PlatformEnum(str, enum.Enum):
     TELEGRAM = "telegram"
     DISCORD = "discord"
 
+class DeliveryModeEnum(str, enum.Enum):
+    INSTANT = "instant"
+    BATCHED = "batched"
+
 class User(Base):
     __tablename__ = "users"
 
@@ -32,6 +39,12 @@ class User(Base):
 
 class Subscription(Base):
     __tablename__ = "subscriptions"
+    __table_args__ = (
+        # the subscriber index re-reads a user's active subscriptions on
+        # every user change event; the predicate is spelled like the
+        # query's is_(True) so the planner matches it
+        Index("ix_subscriptions_active_user_id", "user_id", postgresql_where=text("is_active IS true")),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), index=True, nullable=False)
@@ -39,17 +52,45 @@ class Subscription(Base):
     platform: Mapped[PlatformEnum] = mapped_column(SAEnum(PlatformEnum, native_enum=False), nullable=False)
     target_address: Mapped[str] = mapped_column(String, nullable=False)
     is_active: Mapped[bool] = mapped_column(Boolean, default=True) 
+    delivery_mode: Mapped[DeliveryModeEnum] = mapped_column(
+        SAEnum(DeliveryModeEnum, native_enum=False),
+        default=DeliveryModeEnum.INSTANT,
+        server_default=DeliveryModeEnum.INSTANT.name,
+    )
+    # set when deliveries kept failing permanently and the subscription was deactivated
+    quarantined_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True, default=None)
+    # filters, a job must contain an include keyword (if any), no exclude
+    # keyword, overlap the budget range and have at most max_bids bids
+    include_keywords: Mapped[List[str]] = mapped_column(JSON, default=list, server_default="[]")
+    exclude_keywords: Mapped[List[str]] = mapped_column(JSON, default=list, server_default="[]")
+    min_budget: Mapped[Optional[Decimal]] = mapped_column(Numeric(12, 2), nullable=True)
+    max_budget: Mapped[Optional[Decimal]] = mapped_column(Numeric(12, 2), nullable=True)
+    max_bids: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
 
     user: Mapped["User"] = relationship("User", back_populates="subscriptions")
 
+# Text search configuration of jobs.search_vector. first_normalize_arabic is
+# created by migration and mirrors core.processing.normalizer.normalize_arabic
+JOB_SEARCH_CONFIG = "arabic"
+
+
 class Job(Base):
     __tablename__ = "jobs"
+    # monthly partitions are managed by core.maintenance, a partition key
+    # must be part of every unique index so external_id is only indexed
+    __table_args__ = (
+        # keyset pagination of the jobs API, newest first
+        Index("ix_jobs_created_at_id", "created_at", "id"),
+        Index("ix_jobs_category_created_at_id", "category", "created_at", "id"),
+        Index("ix_jobs_search_vector", "search_vector", postgresql_using="gin"),
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
-    external_id: Mapped[str] = mapped_column(String, unique=True, index=True, nullable=False)
+    external_id: Mapped[str] = mapped_column(String, index=True, nullable=False)
     external_url: Mapped[str] = mapped_column(String, nullable=False)
-    category: Mapped[str] = mapped_column(String, index=True, nullable=False)
+    category: Mapped[str] = mapped_column(String, nullable=False)
     title: Mapped[str] = mapped_column(Text, nullable=False)
     details: Mapped[str] = mapped_column(Text, nullable=False) 
     budget: Mapped[str] = mapped_column(String, nullable=False)
@@ -57,6 +98,26 @@ class Job(Base):
     owner_name: Mapped[str] = mapped_column(String, nullable=False)
     owner_registration_date: Mapped[str] = mapped_column(String, nullable=False)
     owner_employment_rate: Mapped[str] = mapped_column(String, nullable=False)
-    number_of_bids: Mapped[str] = mapped_column(String, default=0)
+    number_of_bids: Mapped[str] = mapped_column(String, default="0")
     published_at: Mapped[str] = mapped_column(String, nullable=False)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
\ No newline at end of file
+    # typed values parsed from the strings above, for filtering and analytics
+    budget_min: Mapped[Optional[Decimal]] = mapped_column(Numeric(12, 2), nullable=True)
+    budget_max: Mapped[Optional[Decimal]] = mapped_column(Numeric(12, 2), nullable=True)
+    budget_currency: Mapped[Optional[str]] = mapped_column(String(3), nullable=True)
+    duration_days: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    bids_count: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    employment_rate: Mapped[Optional[Decimal]] = mapped_column(Numeric(5, 2), nullable=True)
+    published_date: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), index=True, nullable=True)
+    owner_registered_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), primary_key=True, server_default=func.now())
+    # title weighted above details, only loaded when asked for
+    search_vector: Mapped[Optional[str]] = mapped_column(
+        TSVECTOR,
+        Computed(
+            f"setweight(to_tsvector('{JOB_SEARCH_CONFIG}'::regconfig, first_normalize_arabic(title)), 'A') || "
+            f"setweight(to_tsvector('{JOB_SEARCH_CONFIG}'::regconfig, first_normalize_arabic(details)), 'B')",
+            persisted=True
+        ),
+        deferred=True,
+        nullable=True
+    )
\ No newline at end of file